@@ -0,0 +1,362 @@
+"""Game.update / Game.draw 스케일링 벤치마크
+
+시나리오(적 수 x 모양 구성 x 배치)마다 헤드리스 게임을 만들어 update와 draw를
+반복 실행하고, 틱/초와 p50/p99 프레임 시간, 적 수에 따른 비용 증가율을
+JSON으로 저장함. 이전 결과 파일과 비교해 회귀를 찾을 수 있음.
+
+사용 예:
+    python -m benchmarks.bench_game --quick
+    python -m benchmarks.bench_game --label v1.1 --compare benchmarks/results/v1.0.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from src.constants import ENEMY_SHAPES, ENEMY_COLORS, GRID_COLS, GRID_ROWS
+from src.enemy import Enemy
+from src.game import Game
+
+# 기본 시나리오 축
+ENEMY_COUNTS = [30, 100, 300, 1000, 3000, 10000]
+SHAPE_MIXES = ["mixed", "square", "L", "T", "Z", "block"]
+LAYOUTS = ["sparse", "jammed"]
+
+# 모양 구성 이름 -> ENEMY_SHAPES 인덱스 (mixed는 전체에서 랜덤)
+MIX_SHAPE_INDEX = {"square": 0, "L": 1, "T": 2, "Z": 3, "block": 4}
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+# 시나리오 이름 외에 같은 시나리오인지 비교할 설정 항목과 기본값
+# (결과에 항목이 없는 이전 파일은 파일의 settings, 그것도 없으면 기본값으로 봄)
+SCENARIO_DEFAULTS = {
+    "engine": "object",
+    "pathing": "direct",
+    "world": [GRID_COLS, GRID_ROWS],
+    "chunk_size": None,
+    "dirty_rects": False,
+    "draw": True,
+}
+
+
+def percentile(samples, q):
+    """샘플의 q 백분위수 (밀리초 단위 샘플 리스트)"""
+    if not samples:
+        return 0.0
+    return float(np.percentile(samples, q))
+
+
+def build_enemies(count, mix, layout, player, seed, cols=GRID_COLS, rows=GRID_ROWS):
+    """
+    시나리오용 적 리스트 생성
+
+    sparse는 월드 전체에 고르게, jammed는 플레이어 주변부터 빽빽하게 배치함.
+    겹치지 않게 놓을 자리가 없으면 (월드가 가득 차면) 겹쳐서 배치함.
+
+    Args:
+        count: 적 수
+        mix: 모양 구성 ("mixed" 또는 MIX_SHAPE_INDEX의 키)
+        layout: "sparse" 또는 "jammed"
+        player: 겹치지 않아야 할 플레이어
+        seed: 난수 시드
+        cols: 월드 가로 셀 개수
+        rows: 월드 세로 셀 개수
+
+    Returns:
+        tuple: (적 리스트, 겹쳐서 배치된 적 수)
+    """
+    rng = random.Random(seed)
+    occupied = set(player.get_grid_positions())
+    center_x, center_y = player.get_center()
+
+    anchors = [(x, y) for x in range(cols) for y in range(rows)]
+    if layout == "jammed":
+        anchors.sort(key=lambda a: (a[0] - center_x)**2 + (a[1] - center_y)**2)
+    else:
+        rng.shuffle(anchors)
+
+    enemies = []
+    overlapping = 0
+    anchor_index = 0
+    for _ in range(count):
+        if mix == "mixed":
+            shape_index = rng.randint(0, len(ENEMY_SHAPES) - 1)
+        else:
+            shape_index = MIX_SHAPE_INDEX[mix]
+        shape = ENEMY_SHAPES[shape_index]
+        max_dx = max(dx for dx, dy in shape)
+        max_dy = max(dy for dx, dy in shape)
+
+        placed = None
+        while anchor_index < len(anchors):
+            x, y = anchors[anchor_index]
+            anchor_index += 1
+            if x + max_dx >= cols or y + max_dy >= rows:
+                continue
+            cells = {(x + dx, y + dy) for dx, dy in shape}
+            if occupied.isdisjoint(cells):
+                occupied |= cells
+                placed = (x, y)
+                break
+
+        if placed is None:
+            # 빈 자리가 없으면 겹쳐서 배치
+            overlapping += 1
+            placed = (rng.randint(0, cols - 1 - max_dx), rng.randint(0, rows - 1 - max_dy))
+
+        enemies.append(Enemy(placed[0], placed[1], ENEMY_COLORS[shape_index], shape))
+    return enemies, overlapping
+
+
+def run_scenario(count, mix, layout, ticks=60, max_seconds=None, seed=0, use_swarm=False,
+                 draw=True, dirty_rects=False, pathing="direct", world=(GRID_COLS, GRID_ROWS),
+                 chunk_size=None):
+    """
+    시나리오 하나 실행
+
+    플레이어는 움직이지 않고 무적으로 둠 (게임 오버가 되어도 계속 진행).
+
+    Args:
+        count: 적 수
+        mix: 모양 구성
+        layout: 배치 방식
+        ticks: 최대 틱 수
+        max_seconds: 시나리오당 시간 예산 (넘으면 중단, None이면 제한 없음)
+        seed: 난수 시드
+        use_swarm: True면 Swarm 엔진 사용
+        draw: False면 draw 측정 생략
+        dirty_rects: True면 dirty rectangle 렌더러 사용
+        pathing: 적 이동 방식 ("direct" 또는 "flow")
+        world: (가로, 세로) 월드 셀 개수 (화면보다 크면 화면에 보이는 적만 그림)
+        chunk_size: 청크 한 변의 셀 개수 (None이면 청크 없이 실행)
+
+    Returns:
+        dict: 측정 결과
+    """
+    game = Game(headless=True, seed=seed, use_swarm=use_swarm, dirty_rects=dirty_rects,
+                pathing=pathing, world_cols=world[0], world_rows=world[1], chunk_size=chunk_size)
+    game.enemies, overlapping = build_enemies(count, mix, layout, game.player, seed, *world)
+    game.last_spawn_time = float("inf")  # 시나리오 중 추가 spawn 없음
+
+    update_ms = []
+    draw_ms = []
+    started = time.perf_counter()
+    for _ in range(ticks):
+        game.game_over = False
+
+        t0 = time.perf_counter()
+        game.update()
+        t1 = time.perf_counter()
+        if draw:
+            game.draw()
+        t2 = time.perf_counter()
+
+        update_ms.append((t1 - t0) * 1000)
+        draw_ms.append((t2 - t1) * 1000)
+        if max_seconds is not None and t2 - started > max_seconds:
+            break
+
+    frame_ms = [u + d for u, d in zip(update_ms, draw_ms)]
+    elapsed = sum(frame_ms) / 1000
+    return {
+        "name": f"{layout}/{mix}/{count}",
+        "count": count,
+        "mix": mix,
+        "layout": layout,
+        "engine": "swarm" if use_swarm else "object",
+        "pathing": pathing,
+        "world": list(world),
+        "chunk_size": chunk_size,
+        "dirty_rects": dirty_rects,
+        "draw": draw,
+        "overlapping_spawns": overlapping,
+        "ticks": len(frame_ms),
+        "ticks_per_sec": len(frame_ms) / elapsed if elapsed > 0 else 0.0,
+        "update_p50_ms": percentile(update_ms, 50),
+        "update_p99_ms": percentile(update_ms, 99),
+        "draw_p50_ms": percentile(draw_ms, 50),
+        "draw_p99_ms": percentile(draw_ms, 99),
+        "frame_p50_ms": percentile(frame_ms, 50),
+        "frame_p99_ms": percentile(frame_ms, 99),
+    }
+
+
+def scaling_exponents(results):
+    """
+    (배치, 모양 구성)별로 log(프레임 p50) / log(적 수) 기울기 계산
+
+    1.0이면 적 수에 선형, 2.0이면 제곱으로 비용이 증가함.
+
+    Returns:
+        dict: "layout/mix" -> 기울기
+    """
+    groups = {}
+    for result in results:
+        key = f"{result['layout']}/{result['mix']}"
+        groups.setdefault(key, []).append(result)
+
+    exponents = {}
+    for key, group in groups.items():
+        points = [(r["count"], r["frame_p50_ms"]) for r in group if r["frame_p50_ms"] > 0]
+        if len(points) < 2:
+            continue
+        log_n = np.log([n for n, _ in points])
+        log_t = np.log([t for _, t in points])
+        exponents[key] = float(np.polyfit(log_n, log_t, 1)[0])
+    return exponents
+
+
+def environment_info():
+    """결과 비교용 실행 환경 정보"""
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_revision": revision,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+    }
+
+
+def scenario_key(result, settings=None):
+    """
+    같은 시나리오끼리만 비교하기 위한 키 (이름 + SCENARIO_DEFAULTS의 설정 항목)
+
+    Args:
+        result: run_scenario 결과
+        settings: 결과 파일의 settings (결과에 없는 항목을 채울 값)
+
+    Returns:
+        tuple: 비교 키
+    """
+    settings = settings or {}
+    key = [result["name"]]
+    for field, default in SCENARIO_DEFAULTS.items():
+        value = result.get(field, settings.get(field, default))
+        key.append(tuple(value) if isinstance(value, list) else value)
+    return tuple(key)
+
+
+def compare(results, baseline, threshold):
+    """
+    기준 결과와 비교해 frame p50이 threshold 비율 이상 느려진 시나리오 반환
+
+    이름이 같아도 엔진, pathing, 월드 크기, 청크, 렌더러 설정이 다르면 비교하지 않음.
+
+    Returns:
+        list: (시나리오 이름, 기준 ms, 현재 ms, 비율) 리스트
+    """
+    settings = baseline.get("settings")
+    previous = {scenario_key(r, settings): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        old = previous.get(scenario_key(result))
+        if old is None or old["frame_p50_ms"] <= 0:
+            continue
+        ratio = result["frame_p50_ms"] / old["frame_p50_ms"]
+        print(f"  {result['name']:<24} {old['frame_p50_ms']:9.3f} -> "
+              f"{result['frame_p50_ms']:9.3f} ms  x{ratio:.2f}")
+        if ratio > 1 + threshold:
+            regressions.append((result["name"], old["frame_p50_ms"], result["frame_p50_ms"], ratio))
+    return regressions
+
+
+def main(argv=None):
+    """벤치마크 실행 진입점"""
+    parser = argparse.ArgumentParser(description="Fighter Game update/draw 스케일링 벤치마크")
+    parser.add_argument("--counts", type=int, nargs="+", default=ENEMY_COUNTS)
+    parser.add_argument("--mixes", nargs="+", default=SHAPE_MIXES, choices=SHAPE_MIXES)
+    parser.add_argument("--layouts", nargs="+", default=LAYOUTS, choices=LAYOUTS)
+    parser.add_argument("--ticks", type=int, default=60)
+    parser.add_argument("--max-seconds", type=float, default=10.0,
+                        help="시나리오당 시간 예산 (초)")
+    parser.add_argument("--swarm", action="store_true", help="Swarm 엔진으로 실행")
+    parser.add_argument("--no-draw", action="store_true", help="draw 측정 생략")
+    parser.add_argument("--dirty-rects", action="store_true", help="dirty rectangle 렌더러 사용")
+    parser.add_argument("--pathing", default="direct", choices=["direct", "flow"], help="적 이동 방식")
+    parser.add_argument("--world", type=int, nargs=2, default=[GRID_COLS, GRID_ROWS], metavar=("COLS", "ROWS"),
+                        help="월드 크기 (화면보다 크면 카메라 영역만 그림)")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help="청크 월드로 실행 (먼 청크의 적은 드물게 이동)")
+    parser.add_argument("--quick", action="store_true",
+                        help="빠른 확인용 (적 30/300/1000, mixed, 20틱)")
+    parser.add_argument("--label", default=None, help="결과 파일 이름 (기본: 시각)")
+    parser.add_argument("--output-dir", default=RESULTS_DIR)
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="회귀로 볼 frame p50 증가 비율")
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        args.counts = [30, 300, 1000]
+        args.mixes = ["mixed"]
+        args.ticks = 20
+
+    results = []
+    for layout in args.layouts:
+        for mix in args.mixes:
+            for count in args.counts:
+                result = run_scenario(
+                    count, mix, layout, ticks=args.ticks, max_seconds=args.max_seconds,
+                    use_swarm=args.swarm, draw=not args.no_draw, dirty_rects=args.dirty_rects,
+                    pathing=args.pathing, world=tuple(args.world), chunk_size=args.chunk_size
+                )
+                results.append(result)
+                print(f"{result['name']:<24} {result['ticks_per_sec']:9.1f} ticks/s  "
+                      f"frame p50 {result['frame_p50_ms']:8.3f} ms  "
+                      f"p99 {result['frame_p99_ms']:8.3f} ms  "
+                      f"(update {result['update_p50_ms']:.3f} / draw {result['draw_p50_ms']:.3f})")
+
+    exponents = scaling_exponents(results)
+    for key, exponent in sorted(exponents.items()):
+        print(f"scaling {key:<16} ~ n^{exponent:.2f}")
+
+    report = {
+        "environment": environment_info(),
+        "settings": {"ticks": args.ticks, "max_seconds": args.max_seconds,
+                     "engine": "swarm" if args.swarm else "object", "draw": not args.no_draw,
+                     "dirty_rects": args.dirty_rects, "pathing": args.pathing, "world": args.world,
+                     "chunk_size": args.chunk_size},
+        "results": results,
+        "scaling_exponents": exponents,
+    }
+    os.makedirs(args.output_dir, exist_ok=True)
+    label = args.label or datetime.now().strftime("%Y%m%d-%H%M%S")
+    path = os.path.join(args.output_dir, f"{label}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"결과 저장: {path}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"비교 기준: {args.compare}")
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"회귀 {len(regressions)}건 (frame p50 +{args.threshold:.0%} 초과)")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""적 한 마리당 메모리 사용량 측정
+
+tracemalloc으로 적 N마리를 만들 때 늘어난 메모리를 재서 한 마리당 바이트를
+구함. 슬롯 클래스(현재 Enemy)와 __dict__를 가진 클래스(슬롯 도입 전과 같은
+구조)를 같은 방법으로 비교함.
+
+사용 예:
+    python -m benchmarks.bench_memory
+    python -m benchmarks.bench_memory --count 100000
+"""
+
+import argparse
+import gc
+import random
+import sys
+import tracemalloc
+
+from src.constants import ENEMY_SHAPES, ENEMY_COLORS
+from src.enemy import Enemy
+
+
+class DictEnemy(Enemy):
+    """비교용: __slots__를 선언하지 않아 인스턴스마다 __dict__가 생기는 Enemy"""
+
+
+def bytes_per_enemy(enemy_class, count, seed=0):
+    """
+    적 count마리를 만들 때 늘어난 메모리를 한 마리당 바이트로 반환
+
+    Args:
+        enemy_class: 만들 적 클래스
+        count: 적 수
+        seed: 위치/모양 난수 시드
+
+    Returns:
+        float: 한 마리당 바이트 (리스트 슬롯 포함)
+    """
+    rng = random.Random(seed)
+    specs = []
+    for _ in range(count):
+        shape_index = rng.randrange(len(ENEMY_SHAPES))
+        specs.append((rng.uniform(0, 70), rng.uniform(0, 70),
+                      ENEMY_COLORS[shape_index], ENEMY_SHAPES[shape_index]))
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    enemies = [enemy_class(x, y, color, shape) for x, y, color, shape in specs]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    assert len(enemies) == count
+    return (after - before) / count
+
+
+def main(argv=None):
+    """측정 실행 진입점"""
+    parser = argparse.ArgumentParser(description="적 한 마리당 메모리 측정")
+    parser.add_argument("--count", type=int, default=10000)
+    args = parser.parse_args(argv)
+
+    # 모양 인터닝 캐시를 먼저 채워 측정에서 제외
+    bytes_per_enemy(Enemy, 100)
+
+    slotted = bytes_per_enemy(Enemy, args.count)
+    with_dict = bytes_per_enemy(DictEnemy, args.count)
+    print(f"적 {args.count}마리")
+    print(f"  __dict__ (슬롯 도입 전): {with_dict:8.1f} bytes/enemy")
+    print(f"  __slots__ (현재)       : {slotted:8.1f} bytes/enemy")
+    print(f"  절감                   : {with_dict - slotted:8.1f} bytes/enemy "
+          f"({1 - slotted / with_dict:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
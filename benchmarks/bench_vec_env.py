@@ -0,0 +1,66 @@
+"""다중 월드 환경 처리량 측정 (초당 환경 스텝)
+
+VecEnv로 N개 월드를 한 번에 진행할 때와, 월드마다 헤드리스 Game을 하나씩
+두고 차례로 update할 때의 초당 환경 스텝 수를 비교함.
+
+사용 예:
+    python -m benchmarks.bench_vec_env
+    python -m benchmarks.bench_vec_env --envs 16 64 256 --ticks 1000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+
+from src.vec_env import VecEnv, ACTION_KEYS, NUM_ACTIONS
+from src.game import Game
+
+PARAMS = {"enemy_speed": 0.05, "spawn_interval": 200, "max_enemies": 30}
+
+
+def vec_env_steps_per_sec(num_envs, actions):
+    """VecEnv의 초당 환경 스텝 수"""
+    env = VecEnv(num_envs, seed=0, **PARAMS)
+    started = time.perf_counter()
+    for tick_actions in actions:
+        env.step(tick_actions)
+    return len(actions) * num_envs / (time.perf_counter() - started)
+
+
+def games_steps_per_sec(num_envs, actions):
+    """월드마다 Game 하나씩 돌릴 때의 초당 환경 스텝 수"""
+    games = [Game(headless=True, seed=i, **PARAMS) for i in range(num_envs)]
+    started = time.perf_counter()
+    for tick_actions in actions:
+        for game, action in zip(games, tick_actions.tolist()):
+            if game.game_over:
+                game.reset()
+            game.update(ACTION_KEYS[action])
+    return len(actions) * num_envs / (time.perf_counter() - started)
+
+
+def main(argv=None):
+    """측정 실행 진입점"""
+    parser = argparse.ArgumentParser(description="다중 월드 환경 처리량 측정")
+    parser.add_argument("--envs", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--ticks", type=int, default=600)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    for num_envs in args.envs:
+        actions = rng.integers(0, NUM_ACTIONS, (args.ticks, num_envs))
+        vec = vec_env_steps_per_sec(num_envs, actions)
+        games = games_steps_per_sec(num_envs, actions)
+        print(f"envs {num_envs:5d}  VecEnv {vec:10.0f} steps/s  Game x{num_envs} {games:10.0f} steps/s"
+              f"  ({vec / games:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,51 @@
 """게임 실행 메인 파일"""
 
+# 시작 시간 측정 기준점 (pygame 등 무거운 모듈 import 전)
+from src.startup import StartupTimer
+STARTUP = StartupTimer()
+
+import argparse
+import sys
 from src.game import Game
+STARTUP.mark("imports")
 
 
-def main():
+def main(argv=None):
     """게임 시작"""
-    game = Game()
-    game.run()
+    parser = argparse.ArgumentParser(description="Fighter Game")
+    parser.add_argument("--speed", type=float, default=1.0, help="빨리 감기 배율 (1.0이면 실시간)")
+    parser.add_argument("--unthrottled", action="store_true", help="FPS 제한 없이 최대 속도로 시뮬레이션")
+    parser.add_argument("--record", default=None, metavar="DIR", help="매 판을 리플레이 파일로 저장할 디렉터리")
+    parser.add_argument("--world", type=int, nargs=2, default=None, metavar=("COLS", "ROWS"),
+                        help="월드 크기 (셀 단위, 화면보다 크면 카메라가 플레이어를 따라감)")
+    parser.add_argument("--chunk-size", type=int, default=None, metavar="CELLS",
+                        help="월드를 청크로 나눠 적이 있는 청크만 메모리에 두고 먼 청크는 드물게 이동")
+    parser.add_argument("--spawner", default="random", choices=["random", "indexed"],
+                        help="spawn 위치 선택 (indexed: 적/플레이어와 겹치지 않는 빈 경계 자리만)")
+    parser.add_argument("--wave", type=int, default=1, metavar="N", help="spawn 간격마다 spawn할 적 수")
+    parser.add_argument("--pipelined", action="store_true",
+                        help="시뮬레이션을 작업 스레드에서 실행하는 동안 지난 틱의 스냅샷을 그림")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="프로세스 실행부터 첫 프레임까지의 단계별 시간 출력")
+    parser.add_argument("--exit-after-first-frame", action="store_true",
+                        help="첫 프레임을 그린 뒤 종료 (시작 시간 측정용)")
+    args = parser.parse_args(argv)
+
+    world = {} if args.world is None else {"world_cols": args.world[0], "world_rows": args.world[1]}
+    if args.chunk_size is not None:
+        world["chunk_size"] = args.chunk_size
+    game = Game(time_scale=args.speed, unthrottled=args.unthrottled, record_dir=args.record,
+                spawner=args.spawner, wave_size=args.wave, pipelined=args.pipelined, **world)
+    STARTUP.mark("game_init")
+
+    def on_first_frame():
+        STARTUP.mark("first_frame")
+        if args.startup_report:
+            print("\n".join(STARTUP.report_lines()), file=sys.stderr)
+        if args.exit_after_first_frame:
+            game.running = False
+
+    game.run(on_first_frame=on_first_frame)
 
 
 if __name__ == "__main__":
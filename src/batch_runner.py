@@ -0,0 +1,218 @@
+"""헤드리스 게임 일괄 실행기 (밸런스 조정용 파라미터 스윕)
+
+파라미터 조합(적 속도 x spawn 간격 x 최대 적 수) x 입력 정책 x 시드마다
+헤드리스 게임을 하나씩 실행하고, 프로세스 풀로 모든 코어에 나눠 돌린 뒤
+조합별 생존 시간과 틱당 비용 통계를 모음.
+
+사용 예:
+    python -m src.batch_runner --speeds 0.1 0.15 0.2 --intervals 1000 2000 --runs 50
+    python -m src.batch_runner --policies flee random --max-ticks 7200 --output sweep.json
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+
+from src.constants import ENEMY_SPEED_GRID, ENEMY_SPAWN_INTERVAL, MAX_ENEMIES, SIM_TICK_MS
+from src.bots import POLICIES, make_policy
+from src.game import Game
+
+DEFAULT_MAX_TICKS = 60 * 60 * 2  # 2분 (시뮬레이션 시간)
+
+
+def parameter_grid(speeds, intervals, max_enemies):
+    """
+    파라미터 조합 목록 생성
+
+    Args:
+        speeds: 적 속도 후보들
+        intervals: spawn 간격 후보들 (밀리초)
+        max_enemies: 최대 적 수 후보들
+
+    Returns:
+        list: Game 키워드 인자 dict 리스트
+    """
+    return [
+        {"enemy_speed": speed, "spawn_interval": interval, "max_enemies": limit}
+        for speed, interval, limit in itertools.product(speeds, intervals, max_enemies)
+    ]
+
+
+# 워커 프로세스마다 설정별로 한 번만 만들고 reset()으로 재사용하는 게임
+_games = {}
+
+
+def _reusable_game(params, use_swarm):
+    """
+    같은 설정의 헤드리스 게임을 프로세스 안에서 재사용 (화면/캐시/적 풀 유지)
+
+    Args:
+        params: Game 밸런스 키워드 인자
+        use_swarm: True면 Swarm 엔진 사용
+
+    Returns:
+        Game: 설정이 같은 게임 (상태는 호출한 쪽에서 reset)
+    """
+    key = (tuple(sorted(params.items())), use_swarm)
+    game = _games.get(key)
+    if game is None:
+        game = _games[key] = Game(headless=True, use_swarm=use_swarm, **params)
+    return game
+
+
+def run_game(params, policy, seed, max_ticks=DEFAULT_MAX_TICKS, use_swarm=False):
+    """
+    헤드리스 게임 하나를 게임 오버 또는 max_ticks까지 실행 (워커 프로세스에서 호출)
+
+    Args:
+        params: Game 밸런스 키워드 인자 (parameter_grid의 항목)
+        policy: 입력 정책 이름 (POLICIES의 키)
+        seed: 게임과 정책의 난수 시드
+        max_ticks: 최대 틱 수
+        use_swarm: True면 Swarm 엔진 사용
+
+    Returns:
+        dict: 한 판의 결과 (생존 틱, 게임 오버 여부, 틱당 비용)
+    """
+    game = _reusable_game(params, use_swarm)
+    game.reset(seed=seed)
+    game.input_source = make_policy(policy, seed)
+    tick_ms = []
+    perf_counter = time.perf_counter
+    while game.tick_count < max_ticks and not game.game_over and game.running:
+        started = perf_counter()
+        game.update()
+        tick_ms.append((perf_counter() - started) * 1000)
+
+    return {
+        "params": params,
+        "policy": policy,
+        "seed": seed,
+        "survival_ticks": game.tick_count,
+        "game_over": game.game_over,
+        "enemies": len(game.enemies),
+        "tick_mean_ms": float(np.mean(tick_ms)) if tick_ms else 0.0,
+        "tick_p95_ms": float(np.percentile(tick_ms, 95)) if tick_ms else 0.0,
+    }
+
+
+def _run_job(job):
+    """ProcessPoolExecutor.map용 래퍼 (인자 튜플 풀기)"""
+    return run_game(*job)
+
+
+def aggregate(results):
+    """
+    (파라미터, 정책) 조합별로 결과 집계
+
+    Args:
+        results: run_game 결과 리스트
+
+    Returns:
+        list: 조합별 통계 dict 리스트 (생존 시간 중앙값이 짧은 순)
+    """
+    groups = {}
+    for result in results:
+        key = (tuple(sorted(result["params"].items())), result["policy"])
+        groups.setdefault(key, []).append(result)
+
+    summaries = []
+    for (params, policy), group in groups.items():
+        survival = np.array([r["survival_ticks"] for r in group]) * SIM_TICK_MS / 1000
+        summaries.append({
+            "params": dict(params),
+            "policy": policy,
+            "runs": len(group),
+            "game_over_rate": sum(r["game_over"] for r in group) / len(group),
+            "survival_mean_s": float(survival.mean()),
+            "survival_p10_s": float(np.percentile(survival, 10)),
+            "survival_p50_s": float(np.percentile(survival, 50)),
+            "survival_p90_s": float(np.percentile(survival, 90)),
+            "tick_mean_ms": float(np.mean([r["tick_mean_ms"] for r in group])),
+            "tick_p95_ms": float(np.max([r["tick_p95_ms"] for r in group])),
+        })
+    summaries.sort(key=lambda s: (s["survival_p50_s"], s["policy"]))
+    return summaries
+
+
+def run_batch(grid, policies, runs, max_ticks=DEFAULT_MAX_TICKS, workers=None,
+              base_seed=0, use_swarm=False):
+    """
+    파라미터 조합 x 정책 x 시드 전체를 프로세스 풀에서 실행
+
+    Args:
+        grid: parameter_grid 결과
+        policies: 입력 정책 이름들
+        runs: 조합마다 실행할 판 수 (시드 base_seed부터 연속)
+        max_ticks: 한 판의 최대 틱 수
+        workers: 프로세스 수 (None이면 CPU 코어 수, 1이면 현재 프로세스에서 실행)
+        base_seed: 첫 시드
+        use_swarm: True면 Swarm 엔진 사용
+
+    Returns:
+        list: run_game 결과 리스트 (입력 순서 유지)
+    """
+    jobs = [
+        (params, policy, base_seed + run, max_ticks, use_swarm)
+        for params in grid
+        for policy in policies
+        for run in range(runs)
+    ]
+    if workers == 1:
+        return [_run_job(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunksize = max(1, len(jobs) // ((workers or os.cpu_count() or 1) * 4))
+        return list(executor.map(_run_job, jobs, chunksize=chunksize))
+
+
+def main(argv=None):
+    """일괄 실행 진입점"""
+    parser = argparse.ArgumentParser(description="Fighter Game 헤드리스 밸런스 스윕")
+    parser.add_argument("--speeds", type=float, nargs="+", default=[ENEMY_SPEED_GRID])
+    parser.add_argument("--intervals", type=float, nargs="+", default=[ENEMY_SPAWN_INTERVAL])
+    parser.add_argument("--max-enemies", type=int, nargs="+", default=[MAX_ENEMIES])
+    parser.add_argument("--policies", nargs="+", default=["flee"], choices=sorted(POLICIES))
+    parser.add_argument("--runs", type=int, default=20, help="조합마다 실행할 판 수")
+    parser.add_argument("--max-ticks", type=int, default=DEFAULT_MAX_TICKS)
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: 코어 수)")
+    parser.add_argument("--seed", type=int, default=0, help="첫 시드")
+    parser.add_argument("--swarm", action="store_true", help="Swarm 엔진으로 실행")
+    parser.add_argument("--output", default=None, help="결과를 저장할 JSON 경로")
+    args = parser.parse_args(argv)
+
+    grid = parameter_grid(args.speeds, args.intervals, args.max_enemies)
+    started = time.perf_counter()
+    results = run_batch(grid, args.policies, args.runs, max_ticks=args.max_ticks,
+                        workers=args.workers, base_seed=args.seed, use_swarm=args.swarm)
+    elapsed = time.perf_counter() - started
+
+    summaries = aggregate(results)
+    for summary in summaries:
+        params = summary["params"]
+        print(f"speed {params['enemy_speed']:<6} interval {params['spawn_interval']:<7} "
+              f"max {params['max_enemies']:<4} {summary['policy']:<7} "
+              f"survival p50 {summary['survival_p50_s']:7.1f}s "
+              f"(p10 {summary['survival_p10_s']:.1f} / p90 {summary['survival_p90_s']:.1f})  "
+              f"game over {summary['game_over_rate']:4.0%}  "
+              f"tick {summary['tick_mean_ms']:.3f} ms")
+    print(f"{len(results)}판 실행, {elapsed:.1f}초")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"summaries": summaries, "results": results}, f, indent=2)
+        print(f"결과 저장: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
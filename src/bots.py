@@ -0,0 +1,114 @@
+"""헤드리스 실행용 입력 정책 (Game의 input_source로 사용)"""
+
+import random
+import pygame
+from src.input_state import KeyState, NO_KEYS
+
+# 이동 방향 키 (Player.move가 확인하는 순서와 무관)
+MOVE_KEYS = {
+    (-1, 0): KeyState([pygame.K_LEFT]),
+    (1, 0): KeyState([pygame.K_RIGHT]),
+    (0, -1): KeyState([pygame.K_UP]),
+    (0, 1): KeyState([pygame.K_DOWN]),
+}
+
+
+class IdlePolicy:
+    """아무 키도 누르지 않는 정책"""
+
+    def __init__(self, seed=None):
+        pass
+
+    def __call__(self, game):
+        return NO_KEYS
+
+
+class RandomWalkPolicy:
+    """
+    일정 틱마다 무작위 방향을 골라 이동하는 정책
+
+    시드가 같으면 같은 입력열을 만듦.
+    """
+
+    def __init__(self, seed=None, hold_ticks=12):
+        """
+        정책 초기화
+
+        Args:
+            seed: 난수 시드
+            hold_ticks: 한 방향을 유지하는 틱 수
+        """
+        self.rng = random.Random(seed)
+        self.hold_ticks = hold_ticks
+        self._keys = NO_KEYS
+        self._remaining = 0
+
+    def __call__(self, game):
+        if self._remaining <= 0:
+            self._keys = self.rng.choice(list(MOVE_KEYS.values()) + [NO_KEYS])
+            self._remaining = self.hold_ticks
+        self._remaining -= 1
+        return self._keys
+
+
+class FleePolicy:
+    """
+    가장 가까운 적의 반대 방향으로 도망가는 정책
+
+    그 방향이 벽에 막히면 다른 축으로 비켜 감.
+    """
+
+    def __init__(self, seed=None):
+        pass
+
+    def __call__(self, game):
+        if not game.enemies:
+            return NO_KEYS
+
+        player = game.player
+        center_x, center_y = player.get_center()
+        nearest = min(
+            game.enemies,
+            key=lambda e: (e.grid_x - center_x)**2 + (e.grid_y - center_y)**2
+        )
+        enemy_x, enemy_y = nearest.get_center()
+        away_x = 1 if center_x >= enemy_x else -1
+        away_y = 1 if center_y >= enemy_y else -1
+
+        # 더 가까운 축부터 벌리고, 막히면 다른 축으로 이동
+        if abs(center_x - enemy_x) <= abs(center_y - enemy_y):
+            directions = [(away_x, 0), (0, away_y), (0, -away_y)]
+        else:
+            directions = [(0, away_y), (away_x, 0), (-away_x, 0)]
+        for dx, dy in directions:
+            if player.is_valid_position(player.grid_x + dx * player.speed,
+                                        player.grid_y + dy * player.speed,
+                                        cols=game.world_cols, rows=game.world_rows):
+                return MOVE_KEYS[(dx, dy)]
+        return NO_KEYS
+
+
+# 이름 -> 정책 클래스 (프로세스 간에는 이름과 시드만 전달)
+POLICIES = {
+    "idle": IdlePolicy,
+    "random": RandomWalkPolicy,
+    "flee": FleePolicy,
+}
+
+
+def make_policy(name, seed=None):
+    """
+    이름으로 입력 정책 생성
+
+    Args:
+        name: POLICIES의 키
+        seed: 정책 난수 시드
+
+    Returns:
+        callable: game을 받아 KeyState를 반환하는 정책
+    """
+    try:
+        policy_class = POLICIES[name]
+    except KeyError:
+        raise ValueError(f"알 수 없는 입력 정책: {name} (가능: {', '.join(POLICIES)})") from None
+    return policy_class(seed=seed)
@@ -0,0 +1,106 @@
+"""월드의 일부만 화면에 보여 주는 카메라 (플레이어 추적, 화면 밖 객체 컬링용)"""
+
+from src.constants import GRID_WIDTH, GRID_HEIGHT, GRID_COLS, GRID_ROWS
+
+
+def shape_reach(shapes):
+    """
+    기준점이나 중심점에서 모양의 셀까지 떨어질 수 있는 최대 거리 (셀 단위, 여유 1칸 포함)
+
+    기준점/중심점 좌표로 화면 근처 객체를 고를 때 화면 영역을 이만큼 넓혀서
+    조회하면 화면에 걸친 객체를 빠뜨리지 않음.
+
+    Args:
+        shapes: Shape 목록
+
+    Returns:
+        int: 최대 거리
+    """
+    reach = 0
+    for shape in shapes:
+        if not shape.size:
+            continue
+        reach = max(
+            reach,
+            abs(shape.min_x), abs(shape.max_x), abs(shape.min_y), abs(shape.max_y),
+            shape.max_x - shape.center_x, shape.center_x - shape.min_x,
+            shape.max_y - shape.center_y, shape.center_y - shape.min_y,
+        )
+    return int(reach) + 1
+
+
+class Camera:
+    """
+    화면에 보이는 월드 영역 (셀 단위 정수 좌표)
+
+    x, y는 화면 왼쪽 위 셀의 월드 좌표. 따라갈 점이 화면 가운데 오도록
+    움직이되 월드 경계 밖은 보이지 않게 고정함. 월드가 화면보다 작거나
+    같으면 항상 (0, 0)에 있음.
+    """
+
+    def __init__(self, view_cols=GRID_COLS, view_rows=GRID_ROWS, world_cols=GRID_COLS, world_rows=GRID_ROWS):
+        """
+        카메라 초기화
+
+        Args:
+            view_cols: 화면 가로 셀 개수
+            view_rows: 화면 세로 셀 개수
+            world_cols: 월드 가로 셀 개수
+            world_rows: 월드 세로 셀 개수
+        """
+        self.view_cols = view_cols
+        self.view_rows = view_rows
+        self.world_cols = world_cols
+        self.world_rows = world_rows
+        self.x = 0
+        self.y = 0
+
+    @property
+    def covers_world(self):
+        """화면 하나에 월드 전체가 들어가는지 여부 (컬링 불필요)"""
+        return self.view_cols >= self.world_cols and self.view_rows >= self.world_rows
+
+    def follow(self, center_x, center_y):
+        """
+        점이 화면 가운데 오도록 이동 (월드 경계에서는 멈춤)
+
+        Args:
+            center_x: 따라갈 점의 x 좌표 (그리드 단위)
+            center_y: 따라갈 점의 y 좌표 (그리드 단위)
+
+        Returns:
+            bool: 카메라가 움직였으면 True
+        """
+        x = min(max(int(center_x) - self.view_cols // 2, 0), max(self.world_cols - self.view_cols, 0))
+        y = min(max(int(center_y) - self.view_rows // 2, 0), max(self.world_rows - self.view_rows, 0))
+        moved = (x, y) != (self.x, self.y)
+        self.x = x
+        self.y = y
+        return moved
+
+    @property
+    def offset(self):
+        """월드 픽셀 좌표에 더하면 화면 픽셀 좌표가 되는 이동량"""
+        return (-self.x * GRID_WIDTH, -self.y * GRID_HEIGHT)
+
+    def visible_rect(self):
+        """
+        화면에 보이는 셀 범위
+
+        Returns:
+            tuple: (min_x, min_y, max_x, max_y) 그리드 좌표 (양 끝 포함)
+        """
+        return (self.x, self.y, self.x + self.view_cols - 1, self.y + self.view_rows - 1)
+
+    def to_screen(self, grid_x, grid_y):
+        """
+        셀 좌표를 화면 픽셀 좌표로 변환
+
+        Args:
+            grid_x: 셀 x 좌표
+            grid_y: 셀 y 좌표
+
+        Returns:
+            tuple: (pixel_x, pixel_y) 셀 왼쪽 위 픽셀
+        """
+        return ((grid_x - self.x) * GRID_WIDTH, (grid_y - self.y) * GRID_HEIGHT)
@@ -0,0 +1,229 @@
+"""청크 단위로 나눈 큰 월드 (필요한 청크만 메모리 할당, 먼 청크는 멈추거나 드물게 이동)
+
+월드를 chunk_size x chunk_size 셀의 청크로 나눔.
+
+- ChunkedOccupancyGrid: OccupancyGrid와 같은 인터페이스이지만, 적이 있는 청크만
+  점유 배열을 할당하고 청크가 비면 해제함. 월드 크기가 아니라 적이 있는 영역에
+  비례하는 메모리를 씀.
+- ChunkIndex: 적을 중심점이 속한 청크별로 묶어 두고, 이번 틱에 움직일 적만 고름.
+  플레이어 청크에서 active_radius 청크 안의 적은 매 틱 이동하고, 그보다 먼 청크의
+  적은 far_interval 틱에 한 번 그만큼 몰아서 이동함 (0이면 멈춰 있음).
+"""
+
+import math
+import numpy as np
+
+from src.constants import GRID_COLS, GRID_ROWS, CHUNK_SIZE, ACTIVE_CHUNK_RADIUS, FAR_CHUNK_INTERVAL
+from src.occupancy_grid import OccupancyGrid
+from src.spatial_hash import SpatialHash
+
+
+class _Chunk:
+    """청크 하나의 점유 배열 (OccupancyGrid의 counts/ids/labels와 같은 의미)"""
+
+    __slots__ = ("counts", "ids", "labels", "population")
+
+    def __init__(self, size):
+        self.counts = np.zeros((size, size), dtype=np.int32)
+        self.ids = np.zeros((size, size), dtype=np.int32)
+        self.labels = np.zeros((size, size), dtype=np.uint8)
+        self.population = 0  # 청크 안 셀 점유 수의 합 (0이 되면 청크 해제)
+
+
+class ChunkedOccupancyGrid(OccupancyGrid):
+    """
+    적이 있는 청크만 배열을 할당하는 점유 그리드
+
+    counts/ids/labels 전체 배열 대신 청크별 배열을 두며, 나머지 동작
+    (겹친 셀 처리, 월드 밖 셀, 객체별 등록 셀 기억)은 OccupancyGrid와 같음.
+    셀 단위 기록/제거는 OccupancyGrid의 _stamp_cell/_erase_cell을 그대로 씀.
+    """
+
+    def __init__(self, cols=GRID_COLS, rows=GRID_ROWS, chunk_size=CHUNK_SIZE):
+        """
+        점유 그리드 초기화
+
+        Args:
+            cols: 그리드 가로 셀 개수
+            rows: 그리드 세로 셀 개수
+            chunk_size: 청크 한 변의 셀 개수
+        """
+        self.cols = cols
+        self.rows = rows
+        self.chunk_size = chunk_size
+        self.chunks = {}  # (청크 x, 청크 y) -> _Chunk (적이 있는 청크만)
+        self.outside = {}
+        self._shared = {}
+        self._entries = {}
+        self._objects = {}
+        self._next_id = 1
+        self.watcher = None
+
+    def clear(self):
+        """모든 객체 제거 (청크 배열도 해제)"""
+        self.chunks.clear()
+        self.outside.clear()
+        self._shared.clear()
+        self._entries.clear()
+        self._objects.clear()
+        if self.watcher is not None:
+            self.watcher.clear()
+
+    def _stamp(self, entity_id, cells, label):
+        chunks = self.chunks
+        size = self.chunk_size
+        cols, rows = self.cols, self.rows
+        for x, y in cells:
+            if 0 <= x < cols and 0 <= y < rows:
+                key = (x // size, y // size)
+                chunk = chunks.get(key)
+                if chunk is None:
+                    chunk = chunks[key] = _Chunk(size)
+                self._stamp_cell(chunk.counts, chunk.ids, chunk.labels,
+                                 x - key[0] * size, y - key[1] * size, (x, y), entity_id, label)
+                chunk.population += 1
+            else:
+                self._stamp_outside((x, y))
+
+    def _erase(self, entity_id, cells):
+        chunks = self.chunks
+        size = self.chunk_size
+        cols, rows = self.cols, self.rows
+        for x, y in cells:
+            if 0 <= x < cols and 0 <= y < rows:
+                key = (x // size, y // size)
+                chunk = chunks[key]
+                chunk.population -= 1
+                if not chunk.population:
+                    # 마지막 점유 셀이므로 겹친 셀 목록도 없음, 청크째 해제
+                    del chunks[key]
+                    continue
+                self._erase_cell(chunk.counts, chunk.ids, chunk.labels,
+                                 x - key[0] * size, y - key[1] * size, (x, y), entity_id)
+            else:
+                self._erase_outside((x, y))
+
+    def _chunk_cell(self, x, y):
+        """셀이 속한 청크와 청크 안 좌표 (청크가 없으면 청크는 None)"""
+        size = self.chunk_size
+        chunk_x, chunk_y = x // size, y // size
+        return self.chunks.get((chunk_x, chunk_y)), x - chunk_x * size, y - chunk_y * size
+
+    def count_at(self, x, y):
+        """셀을 차지한 객체 수 반환"""
+        if 0 <= x < self.cols and 0 <= y < self.rows:
+            chunk, local_x, local_y = self._chunk_cell(x, y)
+            return int(chunk.counts[local_x, local_y]) if chunk is not None else 0
+        return self.outside.get((x, y), 0)
+
+    def entity_at(self, x, y):
+        """셀을 차지한 객체 중 하나 반환 (없으면 None)"""
+        if 0 <= x < self.cols and 0 <= y < self.rows:
+            chunk, local_x, local_y = self._chunk_cell(x, y)
+            if chunk is not None:
+                return self._objects.get(int(chunk.ids[local_x, local_y]))
+        return None
+
+    def any_occupied(self, cells):
+        """
+        셀 목록 중 하나라도 점유되어 있는지 확인
+
+        Args:
+            cells: [(x, y), ...] 셀 목록
+
+        Returns:
+            bool: 점유된 셀이 있으면 True
+        """
+        return any(self.count_at(x, y) for x, y in cells)
+
+    def write_labels(self, out):
+        """
+        셀 라벨을 (cols, rows) 배열에 기록 (청크가 없는 곳은 0)
+
+        Args:
+            out: 기록할 배열
+        """
+        out.fill(0)
+        size = self.chunk_size
+        for (chunk_x, chunk_y), chunk in self.chunks.items():
+            left, top = chunk_x * size, chunk_y * size
+            width = min(size, self.cols - left)
+            height = min(size, self.rows - top)
+            out[left:left + width, top:top + height] = chunk.labels[:width, :height]
+
+
+class ChunkIndex:
+    """
+    적을 중심점이 속한 청크별로 묶어 두는 색인
+
+    청크 좌표는 중심점을 chunk_size로 나눈 값 (SpatialHash 버킷과 같음).
+    먼 청크는 (청크 x + 청크 y) % far_interval로 나눠 틱마다 번갈아 이동시키므로
+    먼 적의 이동 비용이 틱마다 고르게 나뉨.
+    """
+
+    def __init__(self, chunk_size=CHUNK_SIZE, active_radius=ACTIVE_CHUNK_RADIUS,
+                 far_interval=FAR_CHUNK_INTERVAL):
+        """
+        청크 색인 초기화
+
+        Args:
+            chunk_size: 청크 한 변의 셀 개수
+            active_radius: 매 틱 이동하는 범위 (플레이어 청크에서 가로/세로 청크 수)
+            far_interval: 먼 청크의 적을 몇 틱에 한 번 이동할지 (0이면 멈춤)
+        """
+        self.chunk_size = chunk_size
+        self.active_radius = active_radius
+        self.far_interval = far_interval
+        self._hash = SpatialHash(chunk_size)
+
+    def __len__(self):
+        return len(self._hash)
+
+    def __contains__(self, enemy):
+        return enemy in self._hash
+
+    @property
+    def buckets(self):
+        """적이 있는 청크 -> 적들 ({enemy: None}, 추가 순서)"""
+        return self._hash.buckets
+
+    def clear(self):
+        """모든 적 제거"""
+        self._hash.clear()
+
+    def insert(self, enemy):
+        """적 등록 (중심점이 속한 청크)"""
+        self._hash.insert(enemy, *enemy.get_center())
+
+    def remove(self, enemy):
+        """적 제거 (등록되지 않은 적은 무시)"""
+        self._hash.remove(enemy)
+
+    def update(self, enemy):
+        """움직인 적의 청크 갱신 (청크가 바뀔 때만 재배치)"""
+        self._hash.update(enemy, *enemy.get_center())
+
+    def movers(self, tick, center_x, center_y):
+        """
+        이번 틱에 움직일 적 고르기
+
+        Args:
+            tick: 현재 틱 번호 (먼 청크 차례 계산용)
+            center_x: 플레이어 중심 x
+            center_y: 플레이어 중심 y
+
+        Returns:
+            tuple: (매 틱 이동할 적 리스트, 이번 틱에 far_interval만큼 몰아서 이동할 먼 적 리스트)
+        """
+        size = self.chunk_size
+        player_x, player_y = math.floor(center_x / size), math.floor(center_y / size)
+        radius = self.active_radius
+        interval = self.far_interval
+        active = []
+        far = []
+        for (chunk_x, chunk_y), bucket in self._hash.buckets.items():
+            if abs(chunk_x - player_x) <= radius and abs(chunk_y - player_y) <= radius:
+                active.extend(bucket)
+            elif interval and (chunk_x + chunk_y - tick) % interval == 0:
+                far.extend(bucket)
+        return active, far
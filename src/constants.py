@@ -8,6 +8,8 @@ GRID_HEIGHT = 20  # 각 그리드 셀의 픽셀 높이
 SCREEN_WIDTH = 1400
 SCREEN_HEIGHT = 1400
 FPS = 60
+SIM_TICK_MS = 1000 / FPS  # 시뮬레이션 한 틱의 길이 (밀리초, 렌더링 속도와 무관한 고정 간격)
+MAX_TICKS_PER_FRAME = 5  # 렌더링이 밀릴 때 한 프레임에 따라잡을 최대 틱 수
 
 # 그리드 개수 (자동 계산)
 GRID_COLS = SCREEN_WIDTH // GRID_WIDTH  # 70
@@ -78,15 +80,37 @@ ENEMY_COLORS = [
 # 플레이어 설정 (그리드 단위)
 PLAYER_GRID_SIZE = 1  # 그리드 셀 단위
 PLAYER_SPEED_GRID = 1  # 한 번 이동 시 그리드 셀 개수
+PLAYER_MOVE_DELAY = 3  # 한 번 이동한 뒤 다음 이동까지의 쿨다운 (시뮬레이션 틱 수)
 PLAYER_COLOR = BLUE
 
 # 적 설정 (그리드 단위)
 ENEMY_GRID_SIZE = 1  # 그리드 셀 단위
-ENEMY_SPEED_GRID = 0.15  # 한 프레임당 이동 그리드 (느리게 조정)
+ENEMY_SPEED_GRID = 0.15  # 한 틱당 이동 그리드 (느리게 조정)
 ENEMY_COLOR = RED
 ENEMY_SPAWN_INTERVAL = 2000  # 밀리초 (2초)
 MAX_ENEMIES = 30  # 최대 적 개수 제한
 COLLISION_CHECK_DISTANCE = 5  # 충돌 체크 거리 (그리드 단위, 이 거리 이상은 충돌 불가능)
+SPATIAL_HASH_CELL_SIZE = COLLISION_CHECK_DISTANCE  # 공간 해시 버킷 크기 (그리드 단위)
+FLOW_FIELD_CACHE_SIZE = 16  # 보관할 최근 플레이어 셀별 흐름장 수
+FLOW_FIELD_RADIUS = 24  # 흐름장을 계산하는 범위 (목표 셀에서 가로/세로 셀 수, 밖은 직선 추적)
+FLOW_CROWD_COST = 2  # 흐름장을 읽을 때 다른 적이 차지한 셀에 더하는 이동 비용 (걸음 수)
+
+# 청크 월드 설정 (Game(chunk_size=...)로 켬)
+CHUNK_SIZE = 32  # 청크 한 변의 셀 개수
+ACTIVE_CHUNK_RADIUS = 2  # 매 틱 이동하는 범위 (플레이어 청크에서 가로/세로 청크 수)
+FAR_CHUNK_INTERVAL = 8  # 그보다 먼 청크의 적은 이 틱 수마다 한 번 몰아서 이동 (0이면 멈춤)
+
+# 프레임 프로파일러 설정
+PROFILER_HISTORY = 240  # 통계에 쓰는 최근 프레임 수 (60 FPS 기준 4초)
+PROFILER_REFRESH_FRAMES = 15  # 프로파일러 오버레이 텍스트 갱신 주기 (프레임)
+PROFILER_FONT_SIZE = 22
+
+# 관측 배열 설정 (셀 값: 빈 칸 OBS_EMPTY, 적은 모양 번호 + 1, 플레이어 OBS_PLAYER)
+OBS_EMPTY = 0
+OBS_PLAYER = 255
+
+# 리플레이 설정
+REPLAY_KEYFRAME_INTERVAL = 600  # 키프레임 간격 (틱, 60 FPS 기준 10초)
 
 # 게임 타이틀
 GAME_TITLE = "Fighter Game - Version 1"
@@ -3,13 +3,16 @@
 import pygame
 import math
 from src.game_object import GameObject
-from src.constants import ENEMY_SPEED_GRID
+from src.collision import shapes_collide
+from src.constants import ENEMY_SPEED_GRID, COLLISION_CHECK_DISTANCE, GRID_COLS, GRID_ROWS, FLOW_CROWD_COST
 
 
 class Enemy(GameObject):
     """플레이어를 추적하는 적 캐릭터 (그리드 기반, 부드러운 이동, 다양한 모양)"""
     
-    def __init__(self, grid_x, grid_y, color, shape=None):
+    __slots__ = ("speed",)
+    
+    def __init__(self, grid_x, grid_y, color, shape=None, speed=ENEMY_SPEED_GRID):
         """
         적 초기화
         
@@ -18,12 +21,26 @@ class Enemy(GameObject):
             grid_y: 기준점 그리드 y 좌표 (float 가능)
             color: 적의 색상
             shape: 상대 좌표 리스트 [(0,0), (1,0), ...] 또는 None (1x1 정사각형)
+            speed: 한 틱당 이동 그리드
+        """
+        self.reset(grid_x, grid_y, color, shape, speed)
+    
+    def reset(self, grid_x, grid_y, color, shape=None, speed=ENEMY_SPEED_GRID):
+        """
+        적을 새로 만든 것과 같은 상태로 재설정 (EnemyPool에서 재사용할 때)
+        
+        Args:
+            grid_x: 기준점 그리드 x 좌표 (float 가능)
+            grid_y: 기준점 그리드 y 좌표 (float 가능)
+            color: 적의 색상
+            shape: 상대 좌표 리스트 또는 None (1x1 정사각형)
+            speed: 한 틱당 이동 그리드
         """
         if shape is None:
             shape = [(0, 0)]  # 기본: 1x1 정사각형
         
         super().__init__(grid_x, grid_y, color, grid_size=1, shape=shape)
-        self.speed = ENEMY_SPEED_GRID
+        self.speed = speed
         
         # float 좌표 지원 (부드러운 이동)
         self.grid_x = float(grid_x)
@@ -36,9 +53,11 @@ class Enemy(GameObject):
         Returns:
             list: [(x1, y1), (x2, y2), ...] 절대 좌표 리스트
         """
-        return [(int(self.grid_x + dx), int(self.grid_y + dy)) for dx, dy in self.shape]
+        grid_x, grid_y = self.grid_x, self.grid_y
+        return [(int(grid_x + dx), int(grid_y + dy)) for dx, dy in self.compiled_shape.offsets]
     
-    def move_towards_player(self, player, other_enemies=None):
+    def move_towards_player(self, player, other_enemies=None, spatial_hash=None, occupancy=None,
+                            cols=GRID_COLS, rows=GRID_ROWS, steps=1):
         """
         플레이어를 향해 직선으로 이동 (다른 적들과 겹치지 않게)
         최적화: 거리 기반 조기 컷오프로 불필요한 충돌 체크 감소
@@ -47,6 +66,13 @@ class Enemy(GameObject):
         Args:
             player: Player 객체
             other_enemies: 다른 적들의 리스트 (충돌 체크용)
+            spatial_hash: 적들의 중심점이 등록된 SpatialHash (주어지면
+                other_enemies 대신 근처 버킷의 적들만 검사하고, 이동 후 위치를 갱신)
+            occupancy: 적들이 등록된 OccupancyGrid (주어지면 새 위치의 셀이 모두
+                비어 있을 때 적 간 충돌 체크를 생략하고, 이동 후 점유 셀을 갱신)
+            cols: 월드 가로 셀 개수
+            rows: 월드 세로 셀 개수
+            steps: 한 번에 이동할 틱 수 (먼 청크의 적을 몰아서 이동할 때, 속도 x steps만큼 이동)
         """
         # 플레이어의 중심점 계산
         player_center_x, player_center_y = player.get_center()
@@ -66,69 +92,134 @@ class Enemy(GameObject):
             direction_y = dy / distance
             
             # 속도를 곱해 이동
-            new_x = self.grid_x + direction_x * self.speed
-            new_y = self.grid_y + direction_y * self.speed
-            
-            # 이동 가능한지 체크 (경계 + 다른 적들과 충돌)
-            old_x, old_y = self.grid_x, self.grid_y
-            self.grid_x = new_x
-            self.grid_y = new_y
-            
-            # 경계를 벗어나는지 체크
-            positions = self.get_grid_positions()
-            move_valid = True
+            new_x = self.grid_x + direction_x * self.speed * steps
+            new_y = self.grid_y + direction_y * self.speed * steps
+            self._move_to(new_x, new_y, other_enemies, spatial_hash, occupancy, cols, rows)
+    
+    def follow_flow_field(self, field, player, other_enemies=None, spatial_hash=None, occupancy=None,
+                          cols=GRID_COLS, rows=GRID_ROWS, crowd_cost=FLOW_CROWD_COST):
+        """
+        흐름장이 가리키는 방향으로 이동 (다른 적들과 겹치지 않게)
+        
+        적 중심이 속한 셀의 방향을 O(1)로 읽음. 점유 그리드가 있고 그 방향의 다음 칸을
+        다른 적이 차지했으면 crowd_cost를 더해 덜 붐비는 이웃 칸으로 돌아감.
+        플레이어와 같은 셀에 도착하거나 흐름장 범위 밖이면 move_towards_player처럼
+        플레이어 중심을 향해 직선으로 이동함.
+        
+        Args:
+            field: 플레이어 셀을 목표로 한 FlowField
+            player: Player 객체
+            other_enemies: 다른 적들의 리스트 (충돌 체크용)
+            spatial_hash: 적들의 중심점이 등록된 SpatialHash
+            occupancy: 적들이 등록된 OccupancyGrid
+            cols: 월드 가로 셀 개수
+            rows: 월드 세로 셀 개수
+            crowd_cost: 다른 적이 차지한 칸에 더하는 걸음 수 (0이면 혼잡도 무시)
+        """
+        center_x, center_y = self.get_center()
+        if occupancy is not None and crowd_cost:
+            direction_x, direction_y = field.direction_avoiding(
+                center_x, center_y,
+                lambda x, y: not occupancy.is_free_for(self, ((x, y),)),
+                crowd_cost
+            )
+        else:
+            direction_x, direction_y = field.direction_at(center_x, center_y)
+        if direction_x == 0 and direction_y == 0:
+            self.move_towards_player(player, other_enemies, spatial_hash, occupancy, cols, rows)
+            return
+        
+        new_x = self.grid_x + direction_x * self.speed
+        new_y = self.grid_y + direction_y * self.speed
+        self._move_to(new_x, new_y, other_enemies, spatial_hash, occupancy, cols, rows)
+    
+    def _move_to(self, new_x, new_y, other_enemies=None, spatial_hash=None, occupancy=None,
+                 cols=GRID_COLS, rows=GRID_ROWS):
+        """
+        새 위치로 이동 시도 (경계와 다른 적들과의 충돌을 확인하고, 불가능하면 그대로 둠)
+        
+        Args:
+            new_x: 새 기준점 x 좌표
+            new_y: 새 기준점 y 좌표
+            other_enemies: 다른 적들의 리스트 (충돌 체크용)
+            spatial_hash: 적들의 중심점이 등록된 SpatialHash
+            occupancy: 적들이 등록된 OccupancyGrid
+            cols: 월드 가로 셀 개수
+            rows: 월드 세로 셀 개수
             
-            if positions:
-                xs = [x for x, y in positions]
-                ys = [y for x, y in positions]
+        Returns:
+            bool: 이동했으면 True
+        """
+        # 이동 가능한지 체크 (경계 + 다른 적들과 충돌)
+        old_x, old_y = self.grid_x, self.grid_y
+        self.grid_x = new_x
+        self.grid_y = new_y
+        
+        # 경계를 벗어나는지 체크
+        positions = self.get_grid_positions()
+        move_valid = True
+        shape = self.compiled_shape
+        
+        if positions:
+            # 경계 체크 (모양의 최소/최대 오프셋만 확인)
+            if (int(new_x + shape.min_x) < 0 or int(new_x + shape.max_x) >= cols
+                    or int(new_y + shape.min_y) < 0 or int(new_y + shape.max_y) >= rows):
+                move_valid = False
+        
+        # 점유 그리드 빠른 판정: 새 셀을 다른 적이 차지하지 않았으면 충돌 불가능
+        if move_valid and occupancy is not None and occupancy.is_free_for(self, positions):
+            other_enemies = None
+        
+        # 충돌 후보: 공간 해시가 있으면 근처 버킷만, 없으면 전체 리스트
+        elif move_valid and spatial_hash is not None:
+            other_enemies = spatial_hash.query(new_x, new_y, COLLISION_CHECK_DISTANCE)
+        
+        # 다른 적들과 충돌하는지 체크 (최적화: 거리 기반 조기 컷오프)
+        if move_valid and other_enemies:
+            for other in other_enemies:
+                if other is self:
+                    continue
                 
-                # 경계 체크
-                from src.constants import GRID_COLS, GRID_ROWS, COLLISION_CHECK_DISTANCE
-                if min(xs) < 0 or max(xs) >= GRID_COLS or min(ys) < 0 or max(ys) >= GRID_ROWS:
-                    move_valid = False
-            
-            # 다른 적들과 충돌하는지 체크 (최적화: 거리 기반 조기 컷오프)
-            if move_valid and other_enemies:
-                for other in other_enemies:
-                    if other is self:
-                        continue
-                    
-                    # 최적화: 거리 기반 조기 컷오프 (제곱근 계산 생략)
-                    other_center_x, other_center_y = other.get_center()
-                    dx_check = abs(self.grid_x - other_center_x)
-                    dy_check = abs(self.grid_y - other_center_y)
-                    
-                    # 맨해튼 거리로 빠른 체크 (실제 거리보다 큼)
-                    manhattan_distance = dx_check + dy_check
-                    if manhattan_distance > COLLISION_CHECK_DISTANCE:
-                        continue  # 충돌 불가능, 스킵
-                    
+                # 최적화: 거리 기반 조기 컷오프 (제곱근 계산 생략)
+                other_center_x, other_center_y = other.get_center()
+                dx_check = abs(self.grid_x - other_center_x)
+                dy_check = abs(self.grid_y - other_center_y)
+                
+                # 맨해튼 거리로 빠른 체크 (실제 거리보다 큼)
+                manhattan_distance = dx_check + dy_check
+                if manhattan_distance > COLLISION_CHECK_DISTANCE:
+                    continue  # 충돌 불가능, 스킵
+                
+                # 새 위치에서 충돌하는지 체크 (비트마스크 판정, collides_with와 같은 결과)
+                other_shape = other.compiled_shape
+                other_x, other_y = other.grid_x, other.grid_y
+                is_colliding = shapes_collide(shape, new_x, new_y, other_shape, other_x, other_y)
+                
+                # 이미 충돌 중이었다면, 새 위치에서도 충돌하더라도 거리가 멀어지는 방향이면 허용
+                if is_colliding:
                     # 현재 위치에서 이미 충돌 중인지 체크 (lock-in 방지)
-                    self.grid_x = old_x
-                    self.grid_y = old_y
-                    was_colliding = self.collides_with(other)
-                    self.grid_x = new_x
-                    self.grid_y = new_y
-                    
-                    # 새 위치에서 충돌하는지 체크
-                    is_colliding = self.collides_with(other)
-                    
-                    # 이미 충돌 중이었다면, 새 위치에서도 충돌하더라도 거리가 멀어지는 방향이면 허용
-                    if is_colliding:
-                        if was_colliding:
-                            # 이미 겹쳐있었음 - 거리가 멀어지는지 확인
-                            old_distance_sq = (old_x - other_center_x)**2 + (old_y - other_center_y)**2
-                            new_distance_sq = (new_x - other_center_x)**2 + (new_y - other_center_y)**2
-                            
-                            # 거리가 멀어지면 이동 허용 (lock-in 탈출)
-                            if new_distance_sq > old_distance_sq:
-                                continue  # 이 적과는 충돌 OK
+                    was_colliding = shapes_collide(shape, old_x, old_y, other_shape, other_x, other_y)
+                    if was_colliding:
+                        # 이미 겹쳐있었음 - 거리가 멀어지는지 확인
+                        old_distance_sq = (old_x - other_center_x)**2 + (old_y - other_center_y)**2
+                        new_distance_sq = (new_x - other_center_x)**2 + (new_y - other_center_y)**2
                         
-                        # 새로 충돌하거나, 이미 충돌 중인데 더 가까워지면 이동 불가
-                        move_valid = False
-                        break
-            
-            # 이동이 불가능하면 이전 위치로 복원
-            if not move_valid:
-                self.grid_x = old_x
-                self.grid_y = old_y
+                        # 거리가 멀어지면 이동 허용 (lock-in 탈출)
+                        if new_distance_sq > old_distance_sq:
+                            continue  # 이 적과는 충돌 OK
+                    
+                    # 새로 충돌하거나, 이미 충돌 중인데 더 가까워지면 이동 불가
+                    move_valid = False
+                    break
+        
+        # 이동이 불가능하면 이전 위치로 복원
+        if not move_valid:
+            self.grid_x = old_x
+            self.grid_y = old_y
+        else:
+            if spatial_hash is not None:
+                spatial_hash.update(self, *self.get_center())
+            if occupancy is not None:
+                occupancy.move(self, positions)
+        
+        return move_valid
@@ -0,0 +1,73 @@
+"""Enemy 객체 재사용 풀"""
+
+from src.enemy import Enemy
+from src.constants import ENEMY_SPEED_GRID
+
+
+class EnemyPool:
+    """
+    사라진 적 객체를 보관했다가 spawn 때 다시 사용
+
+    게임 재시작이나 적 제거 때마다 객체를 버리고 새로 만드는 대신
+    재설정해서 쓰므로 할당과 GC 부담이 줄어듦.
+    """
+
+    def __init__(self, max_free=None):
+        """
+        풀 초기화
+
+        Args:
+            max_free: 보관할 최대 객체 수 (None이면 제한 없음)
+        """
+        self.max_free = max_free
+        self._free = []
+        self.created = 0  # 새로 만든 객체 수
+        self.reused = 0  # 재사용한 횟수
+
+    def __len__(self):
+        """보관 중인 (재사용 대기) 객체 수"""
+        return len(self._free)
+
+    def acquire(self, grid_x, grid_y, color, shape=None, speed=ENEMY_SPEED_GRID):
+        """
+        적 하나를 꺼내 초기화 (보관된 객체가 없으면 새로 생성)
+
+        Args:
+            grid_x: 기준점 그리드 x 좌표
+            grid_y: 기준점 그리드 y 좌표
+            color: 적의 색상
+            shape: 상대 좌표 리스트 또는 Shape
+            speed: 한 틱당 이동 그리드
+
+        Returns:
+            Enemy: 새로 만든 것과 같은 상태의 적
+        """
+        if self._free:
+            enemy = self._free.pop()
+            enemy.reset(grid_x, grid_y, color, shape, speed)
+            self.reused += 1
+            return enemy
+        self.created += 1
+        return Enemy(grid_x, grid_y, color, shape, speed)
+
+    def release(self, enemy):
+        """
+        더 이상 쓰지 않는 적을 반환
+
+        Args:
+            enemy: 게임에서 제거된 적
+        """
+        if self.max_free is None or len(self._free) < self.max_free:
+            self._free.append(enemy)
+
+    def release_all(self, enemies):
+        """
+        여러 적을 한꺼번에 반환
+
+        Args:
+            enemies: 게임에서 제거된 적들
+        """
+        if self.max_free is None:
+            self._free.extend(enemies)
+        else:
+            self._free.extend(list(enemies)[:max(0, self.max_free - len(self._free))])
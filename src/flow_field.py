@@ -0,0 +1,282 @@
+"""플레이어 셀을 향한 공유 흐름장 (거리장 + 셀별 이동 방향)"""
+
+import math
+from collections import OrderedDict
+import numpy as np
+from src.constants import GRID_COLS, GRID_ROWS, FLOW_FIELD_CACHE_SIZE, FLOW_FIELD_RADIUS
+
+# 8방향 이웃 (dx, dy)
+NEIGHBORS = ((-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+
+# 이웃 방향 -> 정규화된 방향
+UNIT_DIRECTIONS = {(dx, dy): (dx / math.hypot(dx, dy), dy / math.hypot(dx, dy)) for dx, dy in NEIGHBORS}
+
+
+def _shift_slices(dx, dy, cols, rows):
+    """
+    (x, y) 셀 값을 (x + dx, y + dy) 셀로 옮기는 (대상, 원본) 슬라이스 쌍
+
+    Returns:
+        tuple: (대상 슬라이스, 원본 슬라이스)
+    """
+    target = (slice(max(dx, 0), cols + min(dx, 0)), slice(max(dy, 0), rows + min(dy, 0)))
+    source = (slice(max(-dx, 0), cols - max(dx, 0)), slice(max(-dy, 0), rows - max(dy, 0)))
+    return target, source
+
+
+def field_window(target, cols, rows, radius):
+    """
+    흐름장 계산 범위
+
+    Args:
+        target: 목표 셀 (x, y)
+        cols: 그리드 가로 칸 수
+        rows: 그리드 세로 칸 수
+        radius: 목표 셀에서 가로/세로 셀 수 (None이면 그리드 전체)
+
+    Returns:
+        tuple: (x0, y0, x1, y1), [x0, x1) x [y0, y1) (목표가 그리드 밖이면 빈 범위일 수 있음)
+    """
+    if radius is None:
+        return 0, 0, cols, rows
+    target_x, target_y = target
+    x0, y0 = max(target_x - radius, 0), max(target_y - radius, 0)
+    x1, y1 = min(target_x + radius + 1, cols), min(target_y + radius + 1, rows)
+    return x0, y0, max(x1, x0), max(y1, y0)
+
+
+class FlowField:
+    """
+    목표 셀까지의 거리장과 셀마다 다음에 갈 방향
+
+    목표 셀에서 radius 안의 창(window)만 계산하므로 월드가 커져도 계산 비용이 일정함.
+    창 밖의 셀은 방향이 (0, 0)이고, 적은 이 경우 플레이어를 향해 직선으로 이동함.
+
+    거리는 8방향 이동 기준 걸음 수 (BFS를 numpy 배열 팽창으로 한 번에 한 겹씩 계산).
+    같은 거리의 이웃이 여럿이면 목표에 직선으로 더 가까운 쪽을 고름.
+    막힌 셀(blocked)은 지나갈 수 없음. 흐름장은 목표 셀(과 막힌 셀)만으로 정해지며,
+    적이 붐비는 셀은 읽을 때 direction_avoiding으로 피함.
+    """
+
+    def __init__(self, target, cols=GRID_COLS, rows=GRID_ROWS, blocked=None, radius=None):
+        """
+        흐름장 계산
+
+        Args:
+            target: 목표 셀 (x, y)
+            cols: 그리드 가로 칸 수
+            rows: 그리드 세로 칸 수
+            blocked: (cols, rows) bool 배열, True인 셀은 통과 불가 (None이면 없음)
+            radius: 계산 범위 (목표 셀에서 가로/세로 셀 수, None이면 그리드 전체)
+        """
+        self.target = target
+        self.cols = cols
+        self.rows = rows
+
+        x0, y0, x1, y1 = field_window(target, cols, rows, radius)
+        self.origin = (x0, y0)
+        self.window = (x1 - x0, y1 - y0)
+        self.distance = self._compute_distance(
+            None if blocked is None else blocked[x0:x1, y0:y1]
+        )
+
+        # 셀별 다음 칸 (dx, dy)와 정규화된 이동 방향 (Python 리스트로 두어 O(1) 조회)
+        step_x, step_y = self._compute_steps()
+        self._steps = list(zip(step_x.ravel().astype(int).tolist(), step_y.ravel().astype(int).tolist()))
+        self._directions = [UNIT_DIRECTIONS.get(step, (0.0, 0.0)) for step in self._steps]
+
+    def _compute_distance(self, blocked):
+        """목표 셀에서 시작하는 창 안의 BFS 거리 (도달 불가 셀은 -1, 창 좌표 기준)"""
+        cols, rows = self.window
+        distance = np.full((cols, rows), -1, dtype=np.int32)
+        target_x, target_y = self.target[0] - self.origin[0], self.target[1] - self.origin[1]
+        if not (0 <= target_x < cols and 0 <= target_y < rows):
+            return distance
+
+        open_cells = np.ones((cols, rows), dtype=bool) if blocked is None else ~blocked
+        open_cells[target_x, target_y] = True
+        unvisited = open_cells.copy()
+        frontier = np.zeros((cols, rows), dtype=bool)
+        frontier[target_x, target_y] = True
+        unvisited[target_x, target_y] = False
+        distance[target_x, target_y] = 0
+
+        shifts = [_shift_slices(dx, dy, cols, rows) for dx, dy in NEIGHBORS]
+        step = 0
+        while frontier.any():
+            step += 1
+            grown = np.zeros_like(frontier)
+            for target_slice, source_slice in shifts:
+                grown[target_slice] |= frontier[source_slice]
+            frontier = grown & unvisited
+            unvisited &= ~frontier
+            distance[frontier] = step
+        return distance
+
+    def _compute_steps(self):
+        """창 안의 셀마다 거리가 가장 작은 이웃으로 가는 (dx, dy)"""
+        cols, rows = self.window
+        unreachable = cols * rows + 1
+        distance = np.where(self.distance < 0, unreachable, self.distance).astype(np.float64)
+
+        # 같은 걸음 수 안에서의 우선순위: 이웃과 목표 사이 직선 거리 (1 미만으로 정규화)
+        xs = np.arange(cols)[:, None] + self.origin[0]
+        ys = np.arange(rows)[None, :] + self.origin[1]
+        straight = np.hypot(xs - self.target[0], ys - self.target[1])
+        self._tie_scale = straight.max(initial=0.0) + 1.0
+        tie_break = straight / self._tie_scale
+
+        best = np.full((cols, rows), np.inf)
+        step_x = np.zeros((cols, rows))
+        step_y = np.zeros((cols, rows))
+        for dx, dy in NEIGHBORS:
+            # 셀 (x, y)에서 본 이웃 (x + dx, y + dy)의 점수
+            score = np.full((cols, rows), np.inf)
+            target_slice, source_slice = _shift_slices(-dx, -dy, cols, rows)
+            score[target_slice] = distance[source_slice] + tie_break[source_slice]
+            better = score < best
+            best[better] = score[better]
+            step_x[better] = dx
+            step_y[better] = dy
+
+        # 목표 셀과 도달할 수 없는 셀은 움직이지 않음
+        stay = (self.distance <= 0) | (best >= unreachable)
+        step_x[stay] = 0
+        step_y[stay] = 0
+        return step_x, step_y
+
+    def distance_at(self, cell_x, cell_y):
+        """
+        셀에서 목표까지의 걸음 수
+
+        Returns:
+            int: 걸음 수 (도달할 수 없거나 계산 범위 밖이면 -1)
+        """
+        local_x, local_y = cell_x - self.origin[0], cell_y - self.origin[1]
+        if not (0 <= local_x < self.window[0] and 0 <= local_y < self.window[1]):
+            return -1
+        return int(self.distance[local_x, local_y])
+
+    def _local_index(self, x, y):
+        """좌표가 속한 셀 (그리드 밖이면 가장 가까운 칸)과 창 안 인덱스 (범위 밖이면 None)"""
+        cell_x = min(max(math.floor(x), 0), self.cols - 1)
+        cell_y = min(max(math.floor(y), 0), self.rows - 1)
+        local_x, local_y = cell_x - self.origin[0], cell_y - self.origin[1]
+        if not (0 <= local_x < self.window[0] and 0 <= local_y < self.window[1]):
+            return cell_x, cell_y, None
+        return cell_x, cell_y, local_x * self.window[1] + local_y
+
+    def direction_at(self, x, y):
+        """
+        좌표가 속한 셀에서 다음에 갈 정규화된 방향
+
+        Args:
+            x: 그리드 x 좌표 (float 가능, 그리드 밖이면 가장 가까운 칸 기준)
+            y: 그리드 y 좌표
+
+        Returns:
+            tuple: (direction_x, direction_y), 목표 셀이거나 계산 범위 밖이면 (0.0, 0.0)
+        """
+        _, _, index = self._local_index(x, y)
+        if index is None:
+            return (0.0, 0.0)
+        return self._directions[index]
+
+    def direction_avoiding(self, x, y, is_crowded, crowd_cost):
+        """
+        direction_at과 같지만 다음 칸이 붐비면 혼잡 비용을 더해 이웃을 다시 고름
+
+        다음 칸이 비어 있으면 추가 비용 없이 direction_at을 그대로 반환함. 붐비면
+        이웃마다 (걸음 수 + 직선 거리 우선순위 + 붐비는 칸이면 crowd_cost)가 가장 작은
+        쪽으로 감 (도달할 수 없는 이웃은 제외).
+
+        Args:
+            x: 그리드 x 좌표
+            y: 그리드 y 좌표
+            is_crowded: 셀 (x, y)를 받아 다른 적이 차지했는지 반환하는 함수
+            crowd_cost: 붐비는 칸에 더하는 걸음 수
+
+        Returns:
+            tuple: (direction_x, direction_y)
+        """
+        cell_x, cell_y, index = self._local_index(x, y)
+        if index is None:
+            return (0.0, 0.0)
+        dx, dy = self._steps[index]
+        if (dx == 0 and dy == 0) or not is_crowded(cell_x + dx, cell_y + dy):
+            return self._directions[index]
+
+        target_x, target_y = self.target
+        best_score = None
+        for step_x, step_y in NEIGHBORS:
+            next_x, next_y = cell_x + step_x, cell_y + step_y
+            steps = self.distance_at(next_x, next_y)
+            if steps < 0:
+                continue
+            score = steps + math.hypot(next_x - target_x, next_y - target_y) / self._tie_scale
+            if is_crowded(next_x, next_y):
+                score += crowd_cost
+            if best_score is None or score < best_score:
+                best_score = score
+                dx, dy = step_x, step_y
+        return UNIT_DIRECTIONS[(dx, dy)]
+
+
+class FlowFieldNavigator:
+    """
+    플레이어 셀별 흐름장을 필요할 때만 계산하고 최근 것들을 LRU로 보관
+
+    플레이어가 같은 칸에 있는 동안은 같은 흐름장을 쓰고, 칸이 바뀌어도
+    최근에 있던 칸이면 다시 계산하지 않음. 흐름장은 목표 셀 주변 radius 범위만 계산함.
+    """
+
+    def __init__(self, cols=GRID_COLS, rows=GRID_ROWS, cache_size=FLOW_FIELD_CACHE_SIZE, blocked=None,
+                 radius=FLOW_FIELD_RADIUS):
+        """
+        내비게이터 초기화
+
+        Args:
+            cols: 그리드 가로 칸 수
+            rows: 그리드 세로 칸 수
+            cache_size: 보관할 흐름장 수
+            blocked: 통과 불가 셀 bool 배열 (None이면 없음)
+            radius: 흐름장 계산 범위 (목표 셀에서 가로/세로 셀 수, None이면 그리드 전체)
+        """
+        self.cols = cols
+        self.rows = rows
+        self.cache_size = cache_size
+        self.blocked = blocked
+        self.radius = radius
+        self._fields = OrderedDict()  # 목표 셀 -> FlowField (최근 사용 순)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._fields)
+
+    def clear(self):
+        """보관한 흐름장 모두 제거 (막힌 셀이 바뀐 경우 등)"""
+        self._fields.clear()
+
+    def field_for(self, cell):
+        """
+        목표 셀의 흐름장 반환 (없으면 계산해서 보관)
+
+        Args:
+            cell: 목표 셀 (x, y)
+
+        Returns:
+            FlowField: 흐름장
+        """
+        field = self._fields.get(cell)
+        if field is not None:
+            self._fields.move_to_end(cell)
+            self.hits += 1
+            return field
+
+        self.misses += 1
+        field = FlowField(cell, self.cols, self.rows, self.blocked, self.radius)
+        self._fields[cell] = field
+        if len(self._fields) > self.cache_size:
+            self._fields.popitem(last=False)
+        return field
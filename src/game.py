@@ -2,175 +2,773 @@
 
 import pygame
 import random
+import os
 import sys
 import math
+import time
+from datetime import datetime
+import numpy as np
 from src.constants import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, FPS,
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, SIM_TICK_MS,
     GRID_WIDTH, GRID_HEIGHT, GRID_COLS, GRID_ROWS,
-    BLACK, WHITE, GAME_TITLE, ENEMY_SPAWN_INTERVAL,
-    ENEMY_SHAPES, ENEMY_COLORS, MAX_ENEMIES
+    BLACK, WHITE, GAME_TITLE, ENEMY_SPAWN_INTERVAL, ENEMY_SPEED_GRID,
+    ENEMY_SHAPES, ENEMY_COLORS, MAX_ENEMIES,
+    PROFILER_REFRESH_FRAMES, PROFILER_FONT_SIZE, OBS_EMPTY, OBS_PLAYER,
+    ACTIVE_CHUNK_RADIUS, FAR_CHUNK_INTERVAL
 )
 from src.player import Player
-from src.enemy import Enemy
+from src.spatial_hash import SpatialHash
+from src.occupancy_grid import OccupancyGrid
+from src.swarm import Swarm
+from src.input_state import NO_KEYS
+from src.shape import COMPILED_ENEMY_SHAPES
+from src.renderer import DirtyRectRenderer
+from src.sprite_cache import SpriteCache
+from src.profiler import FrameProfiler
+from src.timestep import FixedTimestep
+from src.replay import ReplayRecorder, check_seed
+from src.flow_field import FlowFieldNavigator
+from src.ordering import FarToNearOrder
+from src.enemy_pool import EnemyPool
+from src.camera import Camera, shape_reach
+from src.chunked_world import ChunkedOccupancyGrid, ChunkIndex
+from src.spawner import EdgeSpawnIndex
+from src.pipeline import FrozenObject, RenderFrame, SimulationPipeline
+
+
+def random_edge_spawn(rng, cols=GRID_COLS, rows=GRID_ROWS):
+    """
+    월드 경계의 무작위 spawn 모양과 위치 선택
+    
+    Args:
+        rng: random.Random (모양, 변, 위치 순서로 뽑음)
+        cols: 월드 가로 셀 개수
+        rows: 월드 세로 셀 개수
+        
+    Returns:
+        tuple: (모양 번호, grid_x, grid_y)
+    """
+    # 랜덤으로 모양 선택 (위치 조정을 위해 먼저 선택)
+    shape_index = rng.randint(0, len(ENEMY_SHAPES) - 1)
+    shape = COMPILED_ENEMY_SHAPES[shape_index]
+    
+    # 모양의 경계 상자 (미리 계산된 값)
+    shape_min_x, shape_max_x = shape.min_x, shape.max_x
+    shape_min_y, shape_max_y = shape.min_y, shape.max_y
+    
+    # 랜덤으로 spawn 위치 선택 (0: 왼쪽, 1: 오른쪽, 2: 위, 3: 아래)
+    side = rng.randint(0, 3)
+    
+    if side == 0:  # 왼쪽
+        grid_x = -shape_min_x  # 모양의 왼쪽 끝이 월드 왼쪽에 오도록
+        grid_y = rng.randint(-shape_min_y, rows - 1 - shape_max_y)
+    elif side == 1:  # 오른쪽
+        grid_x = cols - 1 - shape_max_x  # 모양의 오른쪽 끝이 월드 오른쪽에 오도록
+        grid_y = rng.randint(-shape_min_y, rows - 1 - shape_max_y)
+    elif side == 2:  # 위
+        grid_x = rng.randint(-shape_min_x, cols - 1 - shape_max_x)
+        grid_y = -shape_min_y  # 모양의 위쪽 끝이 월드 위에 오도록
+    else:  # 아래
+        grid_x = rng.randint(-shape_min_x, cols - 1 - shape_max_x)
+        grid_y = rows - 1 - shape_max_y  # 모양의 아래쪽 끝이 월드 아래에 오도록
+    
+    return shape_index, grid_x, grid_y
 
 
 class Game:
     """게임 메인 클래스 (그리드 기반)"""
     
-    def __init__(self):
-        """게임 초기화"""
-        # Pygame 초기화
-        pygame.init()
+    def __init__(self, use_swarm=False, headless=False, seed=None, input_source=None,
+                 dirty_rects=False, time_scale=1.0, unthrottled=False,
+                 enemy_speed=ENEMY_SPEED_GRID, spawn_interval=ENEMY_SPAWN_INTERVAL,
+                 max_enemies=MAX_ENEMIES, record_dir=None, pathing="direct",
+                 world_cols=GRID_COLS, world_rows=GRID_ROWS, chunk_size=None,
+                 active_chunk_radius=ACTIVE_CHUNK_RADIUS, far_chunk_interval=FAR_CHUNK_INTERVAL,
+                 spawner="random", wave_size=1, pipelined=False):
+        """
+        게임 초기화
+        
+        Args:
+            use_swarm: True면 적 이동을 Swarm 벡터화 엔진으로 처리
+            headless: True면 창 없이 오프스크린 surface에 그림
+            seed: 적 spawn용 난수 시드 (None이면 임의 시드, 리플레이에 저장하므로 64비트 정수)
+            input_source: game을 받아 키 상태를 반환하는 함수
+                (None이면 헤드리스는 입력 없음, 일반 모드는 키보드)
+            dirty_rects: True면 바뀐 영역만 다시 그리고 그 영역만 화면에 반영
+            time_scale: run()의 빨리 감기 배율 (1.0이면 실시간)
+            unthrottled: True면 run()이 FPS 제한 없이 최대 속도로 시뮬레이션
+            enemy_speed: 적의 한 틱당 이동 그리드
+            spawn_interval: 적 spawn 간격 (밀리초, 시뮬레이션 시계 기준)
+            max_enemies: 최대 적 개수
+            record_dir: 지정하면 매 판을 리플레이 파일로 이 디렉터리에 저장
+            pathing: 적 이동 방식 ("direct": 플레이어를 향해 직선,
+                "flow": 플레이어 근처에서는 공유 흐름장을 따라 적이 붐비는 셀을 피해 이동,
+                FLOW_FIELD_RADIUS 밖에서는 직선)
+            world_cols: 월드 가로 셀 개수 (화면보다 크면 카메라가 플레이어를 따라감)
+            world_rows: 월드 세로 셀 개수
+            chunk_size: 지정하면 월드를 이 크기의 청크로 나눠, 적이 있는 청크만 점유 배열을
+                할당하고 플레이어에서 먼 청크의 적은 드물게 이동 (None이면 모든 적이 매 틱 이동)
+            active_chunk_radius: 매 틱 이동하는 범위 (플레이어 청크에서 가로/세로 청크 수)
+            far_chunk_interval: 그보다 먼 청크의 적을 몇 틱에 한 번 몰아서 이동할지 (0이면 멈춤)
+            spawner: spawn 위치 선택 방식 ("random": 경계의 무작위 위치,
+                "indexed": 빈 경계 앵커 색인에서 적/플레이어와 겹치지 않는 위치만 고름)
+            wave_size: spawn 간격마다 한 번에 spawn할 적 수
+            pipelined: True면 run()이 다음 틱 시뮬레이션을 작업 스레드에서 실행하는 동안
+                메인 스레드가 지난 틱의 스냅샷을 그림 (SimulationPipeline)
+        """
+        if pathing not in ("direct", "flow"):
+            raise ValueError(f"알 수 없는 pathing: {pathing}")
+        if pathing == "flow" and use_swarm:
+            raise ValueError("흐름장 이동은 Swarm 엔진과 함께 쓸 수 없음")
+        if chunk_size is not None and (use_swarm or pathing == "flow"):
+            raise ValueError("청크 월드는 객체 엔진의 직선 이동과만 함께 쓸 수 있음")
+        if spawner not in ("random", "indexed"):
+            raise ValueError(f"알 수 없는 spawner: {spawner}")
+        if spawner == "indexed" and use_swarm:
+            raise ValueError("빈 자리 spawn 색인은 Swarm 엔진과 함께 쓸 수 없음")
         
-        # 화면 설정
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption(GAME_TITLE)
+        self.headless = headless
+        self.input_source = input_source
+        
+        # 밸런스 설정 (게임마다 다르게 지정 가능)
+        self.enemy_speed = enemy_speed
+        self.spawn_interval = spawn_interval
+        self.max_enemies = max_enemies
+        self.wave_size = wave_size
+        self.seed = check_seed(seed)
+        
+        # 월드 크기 (화면에는 카메라가 비추는 GRID_COLS x GRID_ROWS 영역만 보임)
+        self.world_cols = world_cols
+        self.world_rows = world_rows
+        self.camera = Camera(world_cols=world_cols, world_rows=world_rows)
+        
+        # 화면 설정 (헤드리스는 창 없이 오프스크린 surface 사용)
+        # pygame.init()은 오디오 등 쓰지 않는 서브시스템까지 켜므로 필요한 것만 초기화
+        if headless:
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        else:
+            pygame.display.init()  # 이벤트 처리도 함께 초기화됨
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption(GAME_TITLE)
         
         # 시계 설정 (FPS 제어)
         self.clock = pygame.time.Clock()
         
-        # 플레이어 생성 (그리드 중앙)
+        # 모양/색상별 스프라이트 캐시 (객체를 blits 한 번으로 그림)
+        self.sprite_cache = SpriteCache()
+        
+        # 렌더러 (선택, 바뀐 영역만 다시 그리기)
+        self.renderer = DirtyRectRenderer(sprite_cache=self.sprite_cache) if dirty_rects else None
+        
+        # 적 리스트와 재사용 풀 (풀은 재시작해도 유지)
+        self.enemies = []
+        self.enemy_pool = EnemyPool()
+        
+        # 적 중심점 공간 해시 (근처 적끼리만 충돌 체크)
+        self.spatial_hash = SpatialHash()
+        
+        # 적 점유 그리드 (셀 단위 충돌 판정, 셀 라벨은 관측용 모양 번호 + 1)
+        # 청크 월드는 적이 있는 청크만 배열을 할당하고, 적을 청크별로 묶어 둠
+        self.chunk_size = chunk_size
+        self.active_chunk_radius = active_chunk_radius
+        self.far_chunk_interval = far_chunk_interval
+        if chunk_size is None:
+            self.occupancy = OccupancyGrid(world_cols, world_rows)
+            self.chunks = None
+        else:
+            self.occupancy = ChunkedOccupancyGrid(world_cols, world_rows, chunk_size)
+            self.chunks = ChunkIndex(chunk_size, active_chunk_radius, far_chunk_interval)
+        self._shape_labels = {shape: index + 1 for index, shape in enumerate(COMPILED_ENEMY_SHAPES)}
+        
+        # 빈 경계 앵커 색인 (선택, 점유 그리드의 셀 변경을 받아 빈 spawn 자리를 유지)
+        self.spawner = spawner
+        self.spawn_index = EdgeSpawnIndex(world_cols, world_rows) if spawner == "indexed" else None
+        self.occupancy.watcher = self.spawn_index
+        
+        # 관측 배열 (observe()를 처음 호출할 때 할당)
+        self.observation = None
+        
+        # 흐름장 내비게이터 (선택, 플레이어 셀이 바뀔 때만 플레이어 근처 범위의 흐름장 계산)
+        self.pathing = pathing
+        self.navigator = FlowFieldNavigator(world_cols, world_rows) if pathing == "flow" else None
+        
+        # 벡터화 이동 엔진 (선택, 사용 시 공간 해시/점유 그리드 대신 사용)
+        self.use_swarm = use_swarm
+        self.swarm = Swarm(cols=world_cols, rows=world_rows) if use_swarm else None
+        
+        # 먼 적 -> 가까운 적 처리 순서 (프레임마다 점진적으로 갱신)
+        self.ordering = FarToNearOrder()
+        
+        # 고정 간격 시뮬레이션 시계 (틱마다 SIM_TICK_MS씩 진행, 렌더링 속도와 무관)
+        self.timestep = FixedTimestep(time_scale=time_scale, unthrottled=unthrottled)
+        
+        # 시뮬레이션/렌더링 파이프라인 사용 여부 (run()에서만 적용)
+        self.pipelined = pipelined
+        
+        # 리플레이 녹화 (선택, 매 판 시작 시 녹화 시작)
+        self.record_dir = record_dir
+        
+        # 프레임 단계별 시간 측정 (F3으로 오버레이 표시)
+        self.profiler = FrameProfiler()
+        self.show_profiler = False
+        self._profiler_overlays = []
+        
+        # 폰트 (처음 텍스트를 그릴 때 font 모듈 초기화 후 로드)
+        self._fonts = {}
+        
+        # 시뮬레이션 상태 초기화
+        self.reset()
+    
+    def reset(self, seed=None):
+        """
+        새 판을 시작하도록 시뮬레이션 상태만 초기화
+        
+        화면, 폰트, 스프라이트 캐시, 적 풀, 흐름장 캐시는 그대로 두므로
+        새 Game을 만드는 것보다 훨씬 빠름. 결과는 같은 설정으로 새로 만든 Game과 같음.
+        
+        Args:
+            seed: 새 난수 시드 (None이면 기존 시드 유지)
+        """
+        if seed is not None:
+            self.seed = check_seed(seed)
+        
+        # 난수 생성기 (시드 고정 시 spawn 결과 재현 가능)
+        self.rng = random.Random(self.seed)
+        
+        # 플레이어 생성 (월드 중앙)
         self.player = Player(
-            grid_x=GRID_COLS // 2,
-            grid_y=GRID_ROWS // 2
+            grid_x=self.world_cols // 2,
+            grid_y=self.world_rows // 2
         )
         
-        # 적 리스트
+        # 적 리스트 (이전 판의 적 객체는 풀에 반환해 재사용)
+        self.enemy_pool.release_all(self.enemies)
         self.enemies = []
+        self.spatial_hash.clear()
+        self.occupancy.clear()
+        if self.chunks is not None:
+            self.chunks.clear()
+        if self.swarm is not None:
+            self.swarm.clear()
+        self._indexed_enemies = self.enemies
+        self._indexed_members = []
+        self.ordering.clear()
         
         # 게임 상태
         self.running = True
         self.game_over = False
         
+        # 시뮬레이션 시계
+        self.tick_count = 0
+        self.sim_time = 0.0
+        self.timestep.reset()
+        
         # 적 spawn 타이머
-        self.last_spawn_time = pygame.time.get_ticks()
+        self.last_spawn_time = self.get_time()
         
-        # 폰트 설정 (게임 오버 메시지용)
-        self.font = pygame.font.Font(None, 74)
-        self.small_font = pygame.font.Font(None, 36)
+        # 화면은 다음 draw에서 전체 다시 그림
+        self._drawn_game_over = False
+        if self.renderer is not None:
+            self.renderer.invalidate()
+        
+        # 리플레이 녹화 (선택, 틱별 입력 + 주기적 키프레임)
+        self.recorder = None
+        if self.record_dir is not None:
+            self.start_recording()
+    
+    def _get_font(self, size):
+        """
+        기본 폰트를 크기별로 한 번만 로드
+        
+        Args:
+            size: 글자 크기
+            
+        Returns:
+            pygame.font.Font: 폰트
+        """
+        font = self._fonts.get(size)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = self._fonts[size] = pygame.font.Font(None, size)
+        return font
+    
+    @property
+    def font(self):
+        """게임 오버 메시지용 큰 폰트"""
+        return self._get_font(74)
+    
+    @property
+    def small_font(self):
+        """적 개수/안내 문구용 폰트"""
+        return self._get_font(36)
+    
+    @property
+    def profiler_font(self):
+        """프로파일러 오버레이 폰트"""
+        return self._get_font(PROFILER_FONT_SIZE)
     
     def spawn_enemy(self):
         """화면 경계에서 적을 spawn (그리드 좌표, 다양한 모양)"""
-        # 최대 개수 제한
-        if len(self.enemies) >= MAX_ENEMIES:
+        self.spawn_wave(1)
+    
+    def spawn_wave(self, count):
+        """
+        월드 경계에 적 여러 마리를 한 번에 spawn (최대 개수를 넘지 않는 만큼)
+        
+        spawner가 "indexed"면 빈 앵커에만 놓음. 플레이어 셀은 웨이브 동안 막힌 것으로
+        두고, 먼저 놓은 적은 점유 그리드를 거쳐 바로 색인에 반영되므로 같은 웨이브의
+        적끼리도 겹치지 않음. 빈 앵커가 모자라면 그만큼 적게 spawn함.
+        
+        Args:
+            count: spawn할 적 수
+            
+        Returns:
+            list: spawn된 적들
+        """
+        count = min(count, self.max_enemies - len(self.enemies))
+        if count <= 0:
+            return []
+        
+        index = self.spawn_index
+        if index is not None:
+            self._sync_indices()
+            player_cells = self.player.get_grid_positions()
+            index.cells_changed((), player_cells)
+        
+        spawned = []
+        for _ in range(count):
+            if index is None:
+                placed = random_edge_spawn(self.rng, self.world_cols, self.world_rows)
+            else:
+                placed = index.pick(self.rng)
+                if placed is None:
+                    break
+            shape_index, grid_x, grid_y = placed
+            shape = COMPILED_ENEMY_SHAPES[shape_index]
+            color = ENEMY_COLORS[shape_index]
+            
+            enemy = self.enemy_pool.acquire(grid_x, grid_y, color, shape, speed=self.enemy_speed)
+            self.enemies.append(enemy)
+            if self.swarm is not None:
+                self.swarm.add(enemy.grid_x, enemy.grid_y, shape_index, enemy.speed)
+            else:
+                self.spatial_hash.insert(enemy, *enemy.get_center())
+                self.occupancy.add(enemy, label=shape_index + 1)
+                if self.chunks is not None:
+                    self.chunks.insert(enemy)
+            self._indexed_members.append(enemy)
+            spawned.append(enemy)
+        
+        if index is not None:
+            index.cells_changed(player_cells, ())
+        return spawned
+    
+    def despawn_enemy(self, enemy):
+        """
+        적을 게임에서 제거하고 풀에 반환
+        
+        Args:
+            enemy: 제거할 적
+        """
+        self._sync_indices()
+        self.enemies.remove(enemy)
+        if self.swarm is None:
+            self.spatial_hash.remove(enemy)
+            self.occupancy.remove(enemy)
+            if self.chunks is not None:
+                self.chunks.remove(enemy)
+            self._indexed_members.remove(enemy)
+        # Swarm 배열은 구성원 목록이 달라진 것을 보고 다음 _sync_indices에서 다시 구성
+        self.enemy_pool.release(enemy)
+    
+    def move_enemy(self, enemy, grid_x, grid_y):
+        """
+        적을 지정한 위치로 옮기고 적 인덱스(공간 해시/점유 그리드/청크 또는 Swarm 배열)도 함께 갱신
+        
+        적 인덱스는 매 틱 전체를 다시 확인하지 않으므로, 게임 밖에서 적의 grid_x/grid_y를
+        직접 바꾸면 충돌 판정과 관측이 이전 위치를 기준으로 함. 틱 밖에서 적을 옮길 때는
+        이 메서드를 쓰거나, 옮긴 적들로 enemies 리스트를 새로 만들어 대입함.
+        
+        Args:
+            enemy: 옮길 적 (enemies에 있는 객체)
+            grid_x: 새 기준점 그리드 x 좌표
+            grid_y: 새 기준점 그리드 y 좌표
+        """
+        self._sync_indices()
+        enemy.grid_x = float(grid_x)
+        enemy.grid_y = float(grid_y)
+        if self.swarm is not None:
+            index = self.enemies.index(enemy)
+            self.swarm.x[index] = enemy.grid_x
+            self.swarm.y[index] = enemy.grid_y
+        else:
+            self.spatial_hash.update(enemy, *enemy.get_center())
+            self.occupancy.move(enemy)
+            if self.chunks is not None:
+                self.chunks.update(enemy)
+    
+    def restart(self):
+        """게임 재시작 (녹화 중이면 저장 후 시뮬레이션 상태만 초기화)"""
+        self.save_recording()
+        self.reset()
+    
+    def _sync_indices(self):
+        """
+        enemies 리스트가 교체되었거나 구성원이 바뀐 경우 적 인덱스(공간 해시/점유 그리드 또는 Swarm)를 다시 구성
+        
+        리스트 객체와 구성원(순서 포함, 객체 동일성 비교)만 확인하므로 원소를 다른 적으로
+        바꾸거나 추가/삭제한 것은 알아채지만, 적의 위치를 직접 바꾼 것은 알아채지 못함
+        (위치는 move_enemy로 바꿈).
+        """
+        if self._indexed_enemies is self.enemies and self._indexed_members == self.enemies:
+            return
+        
+        self._indexed_enemies = self.enemies
+        self._indexed_members = list(self.enemies)
+        if self.swarm is not None:
+            self.swarm.load(self.enemies)
             return
         
-        # 랜덤으로 모양 선택 (위치 조정을 위해 먼저 선택)
-        shape_index = random.randint(0, len(ENEMY_SHAPES) - 1)
-        shape = ENEMY_SHAPES[shape_index]
-        color = ENEMY_COLORS[shape_index]
-        
-        # 모양의 경계 상자 계산
-        if shape:
-            xs = [dx for dx, dy in shape]
-            ys = [dy for dx, dy in shape]
-            shape_min_x, shape_max_x = min(xs), max(xs)
-            shape_min_y, shape_max_y = min(ys), max(ys)
+        self.spatial_hash.clear()
+        self.occupancy.clear()
+        if self.chunks is not None:
+            self.chunks.clear()
+        for enemy in self.enemies:
+            self.spatial_hash.insert(enemy, *enemy.get_center())
+            self.occupancy.add(enemy, label=self._shape_label(enemy.compiled_shape))
+            if self.chunks is not None:
+                self.chunks.insert(enemy)
+    
+    def _shape_label(self, shape):
+        """관측용 모양 라벨 (모양 번호 + 1, 처음 보는 모양은 Swarm처럼 등록 순서대로 번호 부여)"""
+        label = self._shape_labels.get(shape)
+        if label is None:
+            label = self._shape_labels[shape] = min(len(self._shape_labels) + 1, OBS_PLAYER - 1)
+        return label
+    
+    def observe(self, out=None):
+        """
+        현재 월드를 (world_cols, world_rows) uint8 배열에 직접 기록
+        
+        셀 값은 빈 칸 OBS_EMPTY, 적이 있으면 그 적의 모양 번호 + 1
+        (여러 적이 겹친 셀은 그중 하나), 플레이어 셀은 OBS_PLAYER.
+        적을 하나씩 순회하지 않고 점유 그리드(또는 Swarm 배열)에서 한 번에 복사함.
+        
+        Args:
+            out: 기록할 배열 (예: ObservationBuffer.array, None이면 self.observation)
+            
+        Returns:
+            np.ndarray: 기록한 배열 (out)
+        """
+        if out is None:
+            if self.observation is None:
+                self.observation = np.zeros((self.world_cols, self.world_rows), dtype=np.uint8)
+            out = self.observation
+        
+        self._sync_indices()
+        if self.swarm is None:
+            self.occupancy.write_labels(out)
         else:
-            shape_min_x = shape_max_x = shape_min_y = shape_max_y = 0
-        
-        # 랜덤으로 spawn 위치 선택 (0: 왼쪽, 1: 오른쪽, 2: 위, 3: 아래)
-        side = random.randint(0, 3)
-        
-        if side == 0:  # 왼쪽
-            grid_x = -shape_min_x  # 모양의 왼쪽 끝이 화면 왼쪽에 오도록
-            grid_y = random.randint(-shape_min_y, GRID_ROWS - 1 - shape_max_y)
-        elif side == 1:  # 오른쪽
-            grid_x = GRID_COLS - 1 - shape_max_x  # 모양의 오른쪽 끝이 화면 오른쪽에 오도록
-            grid_y = random.randint(-shape_min_y, GRID_ROWS - 1 - shape_max_y)
-        elif side == 2:  # 위
-            grid_x = random.randint(-shape_min_x, GRID_COLS - 1 - shape_max_x)
-            grid_y = -shape_min_y  # 모양의 위쪽 끝이 화면 위에 오도록
-        else:  # 아래
-            grid_x = random.randint(-shape_min_x, GRID_COLS - 1 - shape_max_x)
-            grid_y = GRID_ROWS - 1 - shape_max_y  # 모양의 아래쪽 끝이 화면 아래에 오도록
-        
-        enemy = Enemy(grid_x, grid_y, color, shape)
-        self.enemies.append(enemy)
+            out.fill(OBS_EMPTY)
+            swarm = self.swarm
+            cells_x, cells_y, mask = swarm.cells()
+            inside = (mask & (cells_x >= 0) & (cells_x < self.world_cols)
+                      & (cells_y >= 0) & (cells_y < self.world_rows))
+            labels = np.minimum(swarm.shape_id[:swarm.count] + 1, OBS_PLAYER - 1)
+            values = np.broadcast_to(labels[:, None], mask.shape)
+            out[cells_x[inside], cells_y[inside]] = values[inside]
+        
+        for x, y in self.player.get_grid_positions():
+            out[x, y] = OBS_PLAYER
+        return out
     
     def check_collision(self):
-        """플레이어와 적의 충돌 판정 (그리드 기반 정밀 충돌)"""
-        # 그리드 기반 정밀 충돌 판정 사용
-        for enemy in self.enemies:
-            if self.player.collides_with(enemy):
-                self.game_over = True
-                return True
+        """플레이어와 적의 충돌 판정 (점유 그리드에서 플레이어 셀만 조회)"""
+        self._sync_indices()
+        
+        player_cells = self.player.get_grid_positions()
+        if self.swarm is not None:
+            hit = self.swarm.overlaps(player_cells)
+        else:
+            hit = self.occupancy.any_occupied(player_cells)
+        
+        if hit:
+            self.game_over = True
+            return True
         
         return False
     
+    def get_time(self):
+        """
+        현재 게임 시간 반환 (밀리초)
+        
+        Returns:
+            float: 시뮬레이션 시계 (실행한 틱 수 x SIM_TICK_MS)
+        """
+        return self.sim_time
+    
+    def read_keys(self):
+        """
+        이번 틱의 키 입력 상태 반환
+        
+        Returns:
+            키 코드로 인덱싱 가능한 키 상태
+        """
+        if self.input_source is not None:
+            return self.input_source(self)
+        if self.headless:
+            return NO_KEYS
+        return pygame.key.get_pressed()
+    
     def handle_events(self):
         """이벤트 처리"""
+        # 헤드리스 모드에는 이벤트 큐가 없음
+        if self.headless:
+            return
+        
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
             
+            # F3: 프로파일러 오버레이 표시 전환
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.toggle_profiler()
+            
             # 게임 오버 상태에서 재시작 또는 종료
             if self.game_over:
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_r:
-                        self.__init__()  # 게임 재시작
+                        self.restart()
                     elif event.key == pygame.K_ESCAPE or event.key == pygame.K_q:
                         self.running = False
     
-    def update(self):
-        """게임 상태 업데이트"""
+    def update(self, keys=None):
+        """
+        게임 상태 업데이트 (한 틱)
+        
+        Args:
+            keys: 이번 틱의 키 상태 (None이면 read_keys()로 읽음)
+        """
         if self.game_over:
             return
         
         # 키 입력 처리
-        keys = pygame.key.get_pressed()
+        if keys is None:
+            keys = self.read_keys()
+        
+        # 리플레이 녹화 (틱 실행 전 상태 기준)
+        if self.recorder is not None:
+            self.recorder.record_tick(self, keys)
+        
+        # 시뮬레이션 시계 진행
+        self.tick_count += 1
+        self.sim_time += SIM_TICK_MS
         
         # ESC 키로 게임 종료
         if keys[pygame.K_ESCAPE]:
             self.running = False
         
         # 플레이어 이동
-        self.player.move(keys)
+        self.player.move(keys, self.world_cols, self.world_rows)
+        self.profiler.mark("player")
         
-        # 적 spawn (일정 시간마다)
-        current_time = pygame.time.get_ticks()
-        if current_time - self.last_spawn_time > ENEMY_SPAWN_INTERVAL:
-            self.spawn_enemy()
+        # 적 spawn (일정 시간마다 wave_size마리)
+        current_time = self.get_time()
+        if current_time - self.last_spawn_time > self.spawn_interval:
+            self.spawn_wave(self.wave_size)
             self.last_spawn_time = current_time
+        self.profiler.mark("spawn")
         
-        # 적 이동: 모든 적들과 충돌 체크 (거리 기반 최적화는 유지)
+        # 적 이동: 점유 그리드와 공간 해시로 근처 적들과만 충돌 체크
         # 먼 적부터 이동하여 앞쪽 적들이 먼저 자리 잡도록 함
-        if self.enemies:
+        if self.enemies and self.swarm is not None:
+            # 벡터화 엔진: 정렬/이동/충돌 해소를 배열 단위로 처리
+            self._sync_indices()
+            self.swarm.step(self.player.get_center())
+            self.swarm.write_back(self.enemies)
+        elif self.enemies and self.chunks is not None:
+            # 청크 월드: 플레이어 근처 청크와 이번 틱 차례인 먼 청크의 적만 이동
+            self._sync_indices()
+            self._move_chunk_enemies(*self.player.get_center())
+        elif self.enemies:
+            self._sync_indices()
+            
             # 플레이어 중심 계산
             player_center_x, player_center_y = self.player.get_center()
             
-            # 플레이어로부터의 거리 기준으로 정렬 (먼 적부터)
-            sorted_enemies = sorted(
-                self.enemies,
-                key=lambda e: (e.grid_x - player_center_x)**2 + (e.grid_y - player_center_y)**2,
-                reverse=True
-            )
+            # 플레이어로부터의 거리 기준으로 정렬 (먼 적부터, 지난 프레임 순서에서 이어 정렬)
+            sorted_enemies = self.ordering.order(self.enemies, player_center_x, player_center_y)
+            self.profiler.mark("sort")
             
-            # 각 적은 모든 다른 적들과 충돌 체크 (거리 최적화로 실제 체크는 적음)
-            for enemy in sorted_enemies:
-                enemy.move_towards_player(self.player, self.enemies)
+            # 각 적은 새 셀이 점유된 경우에만 근처 버킷의 적들과 충돌 체크
+            if self.navigator is not None:
+                field = self.navigator.field_for((int(player_center_x), int(player_center_y)))
+                for enemy in sorted_enemies:
+                    enemy.follow_flow_field(
+                        field,
+                        self.player,
+                        spatial_hash=self.spatial_hash,
+                        occupancy=self.occupancy,
+                        cols=self.world_cols,
+                        rows=self.world_rows
+                    )
+            else:
+                for enemy in sorted_enemies:
+                    enemy.move_towards_player(
+                        self.player,
+                        spatial_hash=self.spatial_hash,
+                        occupancy=self.occupancy,
+                        cols=self.world_cols,
+                        rows=self.world_rows
+                    )
+        self.profiler.mark("enemies")
         
         # 충돌 판정
         self.check_collision()
+        self.profiler.mark("collision")
     
-    def draw(self):
-        """화면 렌더링"""
+    def _move_chunk_enemies(self, center_x, center_y):
+        """
+        청크 월드의 적 이동 (가까운 청크의 적은 매 틱, 먼 청크의 적은 차례가 된 청크만 몰아서)
+        
+        움직이는 적만 골라 전체 이동과 같은 규칙(먼 적부터, 거리가 같으면 enemies 순서)으로
+        정렬하므로, 모든 청크가 가까우면 청크 없이 실행한 결과와 같음.
+        
+        Args:
+            center_x: 플레이어 중심 x
+            center_y: 플레이어 중심 y
+        """
+        active, far = self.chunks.movers(self.tick_count, center_x, center_y)
+        far_steps = dict.fromkeys(far, self.far_chunk_interval)
+        movers = active + far
+        
+        # enemies 순서(점유 그리드 id는 추가 순서대로 증가)로 맞춘 뒤 먼 적부터 안정 정렬
+        movers.sort(key=self.occupancy.entity_id)
+        movers.sort(key=lambda e: (e.grid_x - center_x)**2 + (e.grid_y - center_y)**2, reverse=True)
+        self.profiler.mark("sort")
+        
+        chunks = self.chunks
+        for enemy in movers:
+            enemy.move_towards_player(
+                self.player,
+                spatial_hash=self.spatial_hash,
+                occupancy=self.occupancy,
+                cols=self.world_cols,
+                rows=self.world_rows,
+                steps=far_steps.get(enemy, 1)
+            )
+            chunks.update(enemy)
+    
+    def render_frame(self, frozen=False):
+        """
+        현재 상태의 화면 내용 (카메라를 플레이어에 맞추고 화면에 걸친 객체만 포함)
+        
+        Args:
+            frozen: True면 객체 위치를 복사해 이후 update와 무관한 스냅샷을 만듦
+                (False면 게임 객체를 그대로 담으므로 바로 그릴 때만 사용)
+            
+        Returns:
+            RenderFrame: 화면 내용
+        """
+        objects = self.visible_objects()
+        if frozen:
+            objects = tuple(FrozenObject(obj) for obj in objects)
+        return RenderFrame(self.tick_count, objects, self.camera.offset, len(self.enemies), self.game_over)
+    
+    def draw(self, frame=None):
+        """
+        화면 렌더링
+        
+        Args:
+            frame: 그릴 RenderFrame (None이면 현재 상태, 파이프라인은 지난 틱의 스냅샷을 넘김)
+        """
+        if frame is None:
+            frame = self.render_frame()
+        if self.renderer is not None:
+            self._draw_dirty(frame)
+            return
+        
         # 화면 클리어 (검은색 배경)
         self.screen.fill(BLACK)
         
-        # 플레이어 그리기
-        self.player.draw(self.screen)
+        # 화면에 보이는 플레이어와 적들 그리기 (스프라이트 일괄 blit)
+        self.sprite_cache.draw(self.screen, frame.objects, frame.offset)
         
-        # 적들 그리기
-        for enemy in self.enemies:
-            enemy.draw(self.screen)
+        # 적 개수 표시 및 게임 오버 메시지
+        for surface, rect in self._hud_overlays(frame):
+            self.screen.blit(surface, rect)
+        
+        # 화면 업데이트 (헤드리스는 오프스크린 surface에만 그림)
+        if not self.headless:
+            pygame.display.flip()
+    
+    def _draw_dirty(self, frame):
+        """바뀐 영역만 다시 그리고 그 영역만 화면에 반영"""
+        # 게임 오버 화면 전환 시에는 전체 다시 그리기
+        if frame.game_over != self._drawn_game_over:
+            self.renderer.invalidate()
+            self._drawn_game_over = frame.game_over
+        
+        rects = self.renderer.draw(self.screen, frame.objects, self._hud_overlays(frame), frame.offset)
+        if rects and not self.headless:
+            pygame.display.update(rects)
+    
+    def visible_objects(self):
+        """
+        카메라를 플레이어에 맞추고 화면에 걸친 객체 목록 반환 (그리는 순서)
+        
+        월드가 화면 하나에 들어가면 모든 객체를 그대로 반환함. 더 크면 전체 적을
+        순회하지 않고, 객체 엔진은 공간 해시의 화면 근처 버킷만, Swarm 엔진은
+        위치 배열에 대한 벡터 비교로 화면 근처 적만 고름 (화면 가장자리 바깥의 적이
+        조금 섞일 수 있으며, 그려도 화면 밖으로 잘림). 겹친 적의 그리는 순서가
+        바뀌지 않도록 고른 적은 enemies 순서를 유지함.
+        
+        Returns:
+            list: [플레이어, 적...]
+        """
+        camera = self.camera
+        camera.follow(*self.player.get_center())
+        if camera.covers_world:
+            return [self.player] + self.enemies
+        
+        self._sync_indices()
+        min_x, min_y, max_x, max_y = camera.visible_rect()
+        if self.swarm is not None:
+            swarm = self.swarm
+            reach = shape_reach(swarm.shapes)
+            x = swarm.x[:swarm.count]
+            y = swarm.y[:swarm.count]
+            near = np.flatnonzero((x > min_x - reach) & (x < max_x + reach)
+                                  & (y > min_y - reach) & (y < max_y + reach))
+            enemies = self.enemies
+            return [self.player] + [enemies[i] for i in near.tolist()]
         
-        # 적 개수 표시
-        enemy_count_text = self.small_font.render(f"Enemies: {len(self.enemies)}", True, WHITE)
-        self.screen.blit(enemy_count_text, (10, 10))
+        # 점유 그리드 id는 enemies에 추가된 순서대로 증가함
+        reach = shape_reach(self._shape_labels)
+        near = self.spatial_hash.query_rect(min_x - reach, min_y - reach, max_x + reach, max_y + reach)
+        near.sort(key=self.occupancy.entity_id)
+        return [self.player] + near
+    
+    def _hud_overlays(self, frame=None):
+        """
+        객체 위에 그릴 텍스트 목록 (적 개수, 게임 오버 메시지)
+        
+        Args:
+            frame: HUD 값을 읽을 RenderFrame (None이면 현재 상태)
+            
+        Returns:
+            list: [(surface, rect), ...]
+        """
+        if frame is None:
+            enemy_count, game_over = len(self.enemies), self.game_over
+        else:
+            enemy_count, game_over = frame.enemy_count, frame.game_over
+        enemy_count_text = self.small_font.render(f"Enemies: {enemy_count}", True, WHITE)
+        overlays = [(enemy_count_text, enemy_count_text.get_rect(topleft=(10, 10)))]
         
         # 게임 오버 메시지
-        if self.game_over:
+        if game_over:
             game_over_text = self.font.render("GAME OVER", True, WHITE)
             restart_text = self.small_font.render("Press R to Restart or ESC to Quit", True, WHITE)
             
@@ -178,27 +776,201 @@ class Game:
             game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
             restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
             
-            self.screen.blit(game_over_text, game_over_rect)
-            self.screen.blit(restart_text, restart_rect)
+            overlays.append((game_over_text, game_over_rect))
+            overlays.append((restart_text, restart_rect))
         
-        # 화면 업데이트
-        pygame.display.flip()
+        # 프로파일러 오버레이 (일정 프레임마다 텍스트 갱신)
+        if self.show_profiler:
+            if not self._profiler_overlays or self.profiler.frames % PROFILER_REFRESH_FRAMES == 0:
+                self._profiler_overlays = self._render_profiler()
+            overlays.extend(self._profiler_overlays)
+        
+        return overlays
     
-    def run(self):
-        """메인 게임 루프"""
-        while self.running:
-            # 이벤트 처리
-            self.handle_events()
+    def toggle_profiler(self):
+        """프로파일러 오버레이 표시 전환"""
+        self.show_profiler = not self.show_profiler
+        self._profiler_overlays = []
+    
+    def _render_profiler(self):
+        """
+        프로파일러 통계 텍스트 렌더링 (화면 오른쪽 위)
+        
+        Returns:
+            list: [(surface, rect), ...]
+        """
+        overlays = []
+        top = 10
+        for line in self.profiler.report_lines(FPS):
+            text = self.profiler_font.render(line, True, WHITE, BLACK)
+            rect = text.get_rect(topright=(SCREEN_WIDTH - 10, top))
+            overlays.append((text, rect))
+            top = rect.bottom + 2
+        return overlays
+    
+    def simulate(self, ticks):
+        """
+        최대 ticks번 update를 실행 (FPS 제한 없음, 게임 오버 시 중단)
+        
+        Args:
+            ticks: 실행할 최대 틱 수
             
-            # 게임 상태 업데이트
+        Returns:
+            int: 실제로 실행한 틱 수
+        """
+        for tick in range(ticks):
+            if self.game_over or not self.running:
+                return tick
             self.update()
+        return ticks
+    
+    def start_recording(self, keyframe_interval=None):
+        """
+        리플레이 녹화 시작 (현재 상태가 첫 키프레임)
+        
+        Args:
+            keyframe_interval: 키프레임 간격 (틱, None이면 기본값)
             
-            # 화면 렌더링
-            self.draw()
+        Returns:
+            ReplayRecorder: 녹화기
+        """
+        if keyframe_interval is None:
+            self.recorder = ReplayRecorder(self)
+        else:
+            self.recorder = ReplayRecorder(self, keyframe_interval)
+        return self.recorder
+    
+    def save_recording(self):
+        """
+        녹화 중인 판을 record_dir에 저장
+        
+        Returns:
+            str: 저장한 파일 경로 (녹화 중이 아니면 None)
+        """
+        if self.recorder is None or self.record_dir is None:
+            return None
+        os.makedirs(self.record_dir, exist_ok=True)
+        name = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        path = os.path.join(self.record_dir, f"{name}.fgr")
+        self.recorder.save(path)
+        return path
+    
+    def advance(self, elapsed_ms, keys=None):
+        """
+        흐른 실제 시간만큼 고정 간격 틱을 실행
+        
+        unthrottled면 elapsed_ms 동안 가능한 만큼 틱을 실행함.
+        
+        Args:
+            elapsed_ms: 지난 프레임 이후 흐른 실제 시간 (밀리초)
+            keys: 이번 틱들에 쓸 키 상태 (None이면 틱마다 read_keys()로 읽음)
             
-            # FPS 제어 (60 FPS)
-            self.clock.tick(FPS)
+        Returns:
+            int: 실행한 틱 수
+        """
+        if self.timestep.unthrottled:
+            deadline = time.perf_counter() + 1 / FPS
+            ticks = 0
+            while self.running and not self.game_over:
+                self.update(keys)
+                ticks += 1
+                if time.perf_counter() >= deadline:
+                    break
+            return ticks
+        
+        ticks = self.timestep.advance(elapsed_ms)
+        for _ in range(ticks):
+            self.update(keys)
+        return ticks
+    
+    def run(self, on_first_frame=None):
+        """
+        메인 게임 루프 (고정 간격 시뮬레이션, 렌더링은 프레임마다 최대 한 번)
         
-        # 게임 종료
+        Args:
+            on_first_frame: 첫 프레임을 화면에 그린 직후 한 번 호출할 함수 (시작 시간 측정용)
+        """
+        if self.pipelined:
+            self._run_pipelined(on_first_frame)
+        else:
+            self._run_sequential(on_first_frame)
+        
+        # 게임 종료 (녹화 중이면 저장)
+        self.save_recording()
         pygame.quit()
         sys.exit()
+    
+    def _run_sequential(self, on_first_frame):
+        """이벤트 처리 -> 틱 실행 -> 그리기를 차례로 반복"""
+        last_time = time.perf_counter()
+        drawn = False
+        while self.running:
+            self.profiler.begin_frame()
+            
+            # 이벤트 처리
+            self.handle_events()
+            self.profiler.mark("events")
+            
+            # 흐른 시간만큼 틱 실행 (단계별 시간은 update 안에서 기록)
+            now = time.perf_counter()
+            ticks = self.advance((now - last_time) * 1000)
+            last_time = now
+            
+            # 화면 렌더링 (밀린 틱들은 한 번에 그리고, 상태가 그대로면 생략)
+            # 첫 프레임은 첫 틱을 기다리지 않고 바로 그림
+            if ticks or self.game_over or not drawn:
+                self.draw()
+                drawn = True
+                if on_first_frame is not None:
+                    on_first_frame()
+                    on_first_frame = None
+            self.profiler.mark("draw")
+            
+            # FPS 제어 (60 FPS, 최대 속도 모드는 게임 오버 전까지 대기 없음)
+            if not self.timestep.unthrottled or self.game_over:
+                self.clock.tick(FPS)
+            self.profiler.mark("wait")
+            self.profiler.end_frame()
+    
+    def _run_pipelined(self, on_first_frame):
+        """
+        틱 N+1을 작업 스레드에서 실행하는 동안 틱 N의 스냅샷을 그림
+        
+        이벤트 처리(재시작 포함)와 키 읽기는 작업 스레드가 쉬는 동안 메인 스레드에서 함.
+        작업 스레드의 update 단계 시간은 프로파일러에 기록되지 않고, 그리기보다 오래
+        걸린 만큼이 wait 단계에 들어감.
+        """
+        last_time = time.perf_counter()
+        drawn = None
+        with SimulationPipeline(self) as pipeline:
+            while self.running:
+                self.profiler.begin_frame()
+                
+                # 이벤트 처리 (재시작 등으로 상태가 바뀌었으면 front를 다시 만듦)
+                self.handle_events()
+                if pipeline.front.tick != self.tick_count:
+                    pipeline.refresh()
+                self.profiler.mark("events")
+                
+                # 흐른 시간만큼의 틱을 작업 스레드에서 시작 (키 입력은 메인 스레드에서 읽어 전달)
+                now = time.perf_counter()
+                keys = self.read_keys() if self.input_source is None else None
+                pipeline.start((now - last_time) * 1000, keys)
+                last_time = now
+                
+                # 그 동안 지난 틱의 스냅샷 그리기 (새 스냅샷이거나 게임 오버 화면일 때만)
+                frame = pipeline.front
+                if frame is not drawn or frame.game_over:
+                    self.draw(frame)
+                    drawn = frame
+                    if on_first_frame is not None:
+                        on_first_frame()
+                        on_first_frame = None
+                self.profiler.mark("draw")
+                
+                # 틱 실행이 끝나면 새 스냅샷을 front로 교체
+                pipeline.finish()
+                if not self.timestep.unthrottled or self.game_over:
+                    self.clock.tick(FPS)
+                self.profiler.mark("wait")
+                self.profiler.end_frame()
@@ -2,11 +2,16 @@
 
 import pygame
 from src.constants import GRID_WIDTH, GRID_HEIGHT, GRID_COLS, GRID_ROWS
+from src.shape import compile_shape
+from src.collision import shapes_collide
 
 
 class GameObject:
     """모든 게임 객체의 기본 클래스 (그리드 기반, 복잡한 모양 지원)"""
     
+    # 인스턴스 __dict__ 없이 고정 슬롯에 저장 (객체당 메모리 절약)
+    __slots__ = ("grid_x", "grid_y", "grid_size", "color", "_shape", "compiled_shape")
+    
     def __init__(self, grid_x, grid_y, color, grid_size=1, shape=None):
         """
         게임 객체 초기화
@@ -16,7 +21,7 @@ class GameObject:
             grid_y: 기준점 그리드 y 좌표
             color: RGB 색상 튜플
             grid_size: 그리드 크기 (shape이 None일 때)
-            shape: 상대 좌표 리스트 [(0,0), (1,0), ...] 또는 None (정사각형)
+            shape: 상대 좌표 리스트 [(0,0), (1,0), ...], Shape 또는 None (정사각형)
         """
         self.grid_x = float(grid_x)
         self.grid_y = float(grid_y)
@@ -29,6 +34,17 @@ class GameObject:
         else:
             self.shape = shape
     
+    @property
+    def shape(self):
+        """생성 시 전달된 모양 (상대 좌표 리스트 또는 Shape)"""
+        return self._shape
+    
+    @shape.setter
+    def shape(self, shape):
+        # 같은 모양을 쓰는 객체끼리 미리 계산된 Shape를 공유
+        self._shape = shape
+        self.compiled_shape = compile_shape(shape)
+    
     def get_grid_positions(self):
         """
         현재 차지하고 있는 모든 그리드 좌표 반환
@@ -36,7 +52,8 @@ class GameObject:
         Returns:
             list: [(x1, y1), (x2, y2), ...] 절대 좌표 리스트
         """
-        return [(int(self.grid_x + dx), int(self.grid_y + dy)) for dx, dy in self.shape]
+        grid_x, grid_y = self.grid_x, self.grid_y
+        return [(int(grid_x + dx), int(grid_y + dy)) for dx, dy in self.compiled_shape.offsets]
     
     def get_bounding_box(self):
         """
@@ -45,12 +62,12 @@ class GameObject:
         Returns:
             tuple: (min_x, min_y, max_x, max_y) 그리드 좌표
         """
-        positions = self.get_grid_positions()
-        if not positions:
-            return (int(self.grid_x), int(self.grid_y), int(self.grid_x), int(self.grid_y))
-        xs = [x for x, y in positions]
-        ys = [y for x, y in positions]
-        return (min(xs), min(ys), max(xs), max(ys))
+        # int() 절삭은 단조 증가이므로 모양의 최소/최대 오프셋만 변환하면 됨
+        shape = self.compiled_shape
+        return (
+            int(self.grid_x + shape.min_x), int(self.grid_y + shape.min_y),
+            int(self.grid_x + shape.max_x), int(self.grid_y + shape.max_y)
+        )
     
     def get_center(self):
         """
@@ -59,12 +76,11 @@ class GameObject:
         Returns:
             tuple: (center_x, center_y) float 좌표
         """
-        if not self.shape:
+        shape = self.compiled_shape
+        if not shape.size:
             return (self.grid_x, self.grid_y)
         
-        avg_x = sum(dx for dx, dy in self.shape) / len(self.shape)
-        avg_y = sum(dy for dx, dy in self.shape) / len(self.shape)
-        return (self.grid_x + avg_x, self.grid_y + avg_y)
+        return (self.grid_x + shape.center_x, self.grid_y + shape.center_y)
     
     def get_pixel_pos(self):
         """
@@ -80,16 +96,18 @@ class GameObject:
         pixel_height = (max_y - min_y + 1) * GRID_HEIGHT
         return (pixel_x, pixel_y, pixel_width, pixel_height)
     
-    def draw(self, screen):
+    def draw(self, screen, offset=(0, 0)):
         """
         화면에 객체를 그림 (각 그리드 셀마다 사각형)
         
         Args:
             screen: pygame display surface
+            offset: 화면 픽셀 이동량 (카메라 스크롤, Camera.offset)
         """
+        offset_x, offset_y = offset
         for grid_x, grid_y in self.get_grid_positions():
-            pixel_x = grid_x * GRID_WIDTH
-            pixel_y = grid_y * GRID_HEIGHT
+            pixel_x = grid_x * GRID_WIDTH + offset_x
+            pixel_y = grid_y * GRID_HEIGHT + offset_y
             pygame.draw.rect(screen, self.color, (pixel_x, pixel_y, GRID_WIDTH, GRID_HEIGHT))
     
     def get_rect(self):
@@ -104,7 +122,7 @@ class GameObject:
     
     def collides_with(self, other):
         """
-        다른 객체와의 그리드 기반 정밀 충돌 판정
+        다른 객체와의 그리드 기반 정밀 충돌 판정 (모양 비트마스크 사용)
         
         Args:
             other: 다른 게임 객체 (get_grid_positions 메서드 필요)
@@ -112,24 +130,35 @@ class GameObject:
         Returns:
             bool: 충돌하면 True
         """
+        other_shape = getattr(other, "compiled_shape", None)
+        if other_shape is not None:
+            return shapes_collide(
+                self.compiled_shape, self.grid_x, self.grid_y,
+                other_shape, other.grid_x, other.grid_y
+            )
+        
         my_positions = set(self.get_grid_positions())
-        other_positions = set(other.get_grid_positions())
-        return bool(my_positions & other_positions)
+        return not my_positions.isdisjoint(other.get_grid_positions())
     
-    def is_valid_position(self, new_x, new_y):
+    def is_valid_position(self, new_x, new_y, cols=GRID_COLS, rows=GRID_ROWS):
         """
-        새로운 위치가 유효한지 확인 (화면 밖으로 나가지 않는지)
+        새로운 위치가 유효한지 확인 (월드 밖으로 나가지 않는지)
         
         Args:
             new_x: 새로운 기준점 x 좌표
             new_y: 새로운 기준점 y 좌표
+            cols: 월드 가로 셀 개수
+            rows: 월드 세로 셀 개수
             
         Returns:
             bool: 유효하면 True
         """
-        for dx, dy in self.shape:
-            abs_x = int(new_x + dx)
-            abs_y = int(new_y + dy)
-            if abs_x < 0 or abs_x >= GRID_COLS or abs_y < 0 or abs_y >= GRID_ROWS:
-                return False
-        return True
+        shape = self.compiled_shape
+        if not shape.size:
+            return True
+        
+        # 경계 상자의 양 끝만 확인 (int() 절삭은 단조 증가)
+        return (
+            int(new_x + shape.min_x) >= 0 and int(new_x + shape.max_x) < cols
+            and int(new_y + shape.min_y) >= 0 and int(new_y + shape.max_y) < rows
+        )
@@ -0,0 +1,35 @@
+"""주입 가능한 키 입력 상태 (헤드리스/스크립트 입력용)"""
+
+
+class KeyState:
+    """
+    pygame.key.get_pressed()와 같은 방식으로 조회할 수 있는 키 상태
+
+    keys[pygame.K_LEFT]처럼 인덱싱하면 눌렸는지 여부(bool)를 반환하므로
+    Player.move()와 Game.update()에 그대로 넘길 수 있음.
+    """
+
+    def __init__(self, pressed=()):
+        """
+        키 상태 초기화
+
+        Args:
+            pressed: 눌린 키 코드들 (pygame.K_* 값)
+        """
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+    def __eq__(self, other):
+        return isinstance(other, KeyState) and self.pressed == other.pressed
+
+    def __hash__(self):
+        return hash(self.pressed)
+
+    def __repr__(self):
+        return f"KeyState({sorted(self.pressed)})"
+
+
+# 아무 키도 눌리지 않은 상태
+NO_KEYS = KeyState()
@@ -0,0 +1,107 @@
+"""에이전트용 관측 배열 버퍼 (선택적으로 프로세스 간 공유 메모리)
+
+Game.observe()와 VecEnv가 관측을 직접 써 넣을 미리 할당된 배열.
+shared=True면 multiprocessing.shared_memory에 배열을 두어, 다른 프로세스가
+이름으로 붙어서 복사 없이 같은 메모리를 읽을 수 있음.
+
+사용 예 (게임 프로세스):
+    buffer = ObservationBuffer(shared=True)
+    game.observe(buffer.array)
+    # buffer.name을 학습 프로세스에 전달
+
+사용 예 (학습 프로세스):
+    view = ObservationBuffer.attach(name)
+    grid = view.array  # 게임 프로세스가 쓴 내용이 그대로 보임
+"""
+
+import os
+from multiprocessing import resource_tracker, shared_memory
+import numpy as np
+
+from src.constants import GRID_COLS, GRID_ROWS
+
+OBSERVATION_SHAPE = (GRID_COLS, GRID_ROWS)
+OBSERVATION_DTYPE = np.uint8
+
+
+class ObservationBuffer:
+    """
+    관측용 uint8 배열 (일반 메모리 또는 공유 메모리)
+
+    공유 메모리는 만든 쪽이 unlink()로 해제해야 함. with 문을 쓰면
+    블록이 끝날 때 close()하고, 만든 쪽이면 unlink()까지 함.
+    """
+
+    def __init__(self, shape=OBSERVATION_SHAPE, shared=False, _memory=None):
+        """
+        버퍼 할당
+
+        Args:
+            shape: 배열 모양 (기본: GRID_COLS x GRID_ROWS, VecEnv는 (월드 수, cols, rows))
+            shared: True면 공유 메모리에 할당
+        """
+        self.shape = tuple(shape)
+        self.owner = _memory is None
+        nbytes = int(np.prod(self.shape)) * np.dtype(OBSERVATION_DTYPE).itemsize
+        if _memory is not None:
+            self._memory = _memory
+        elif shared:
+            self._memory = shared_memory.SharedMemory(create=True, size=max(1, nbytes))
+        else:
+            self._memory = None
+
+        if self._memory is None:
+            self.array = np.zeros(self.shape, dtype=OBSERVATION_DTYPE)
+        else:
+            self.array = np.ndarray(self.shape, dtype=OBSERVATION_DTYPE, buffer=self._memory.buf)
+            if self.owner:
+                self.array.fill(0)
+
+    @classmethod
+    def attach(cls, name, shape=OBSERVATION_SHAPE):
+        """
+        다른 프로세스가 만든 공유 메모리 버퍼에 연결
+
+        Args:
+            name: 만든 쪽 버퍼의 name
+            shape: 만든 쪽과 같은 배열 모양
+
+        Returns:
+            ObservationBuffer: 같은 메모리를 보는 버퍼 (unlink 권한 없음)
+        """
+        try:
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Python 3.12 이하: 붙기만 한 프로세스도 종료 시 메모리를 unlink하지 않도록 추적 해제
+            memory = shared_memory.SharedMemory(name=name)
+            if os.name == "posix":
+                resource_tracker.unregister(memory._name, "shared_memory")
+        return cls(shape, _memory=memory)
+
+    @property
+    def shared(self):
+        """공유 메모리 버퍼인지 여부"""
+        return self._memory is not None
+
+    @property
+    def name(self):
+        """공유 메모리 이름 (다른 프로세스가 attach할 때 사용, 일반 버퍼면 None)"""
+        return self._memory.name if self._memory is not None else None
+
+    def close(self):
+        """이 프로세스에서의 연결 해제 (배열은 더 이상 사용할 수 없음)"""
+        if self._memory is not None:
+            self.array = None
+            self._memory.close()
+
+    def unlink(self):
+        """공유 메모리 해제 (만든 쪽에서 모든 프로세스가 다 쓴 뒤 호출)"""
+        if self._memory is not None and self.owner:
+            self._memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+        self.unlink()
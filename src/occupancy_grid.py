@@ -0,0 +1,276 @@
+"""월드 점유 그리드 (셀 단위 충돌 판정용 NumPy 배열)"""
+
+import numpy as np
+from src.constants import GRID_COLS, GRID_ROWS
+
+
+class OccupancyGrid:
+    """
+    GRID_COLS x GRID_ROWS 크기의 셀 점유 정보
+
+    counts[x, y]: 해당 셀을 차지한 객체 수
+    ids[x, y]: 해당 셀을 차지한 객체 중 하나의 id (0이면 빈 셀)
+    labels[x, y]: ids[x, y] 객체의 라벨 (예: 모양 번호 + 1, 0이면 빈 셀)
+
+    여러 객체가 겹친 셀만 별도 딕셔너리에 점유 객체 목록을 두므로, 한 객체가
+    떠나도 ids/labels는 항상 남아 있는 객체를 가리킴.
+
+    모양 좌표가 소수이면 두 오프셋이 같은 셀로 잘릴 수 있으므로(예: grid_x=-0.5),
+    등록할 셀 목록은 중복을 없앤 뒤 기록함 (한 객체는 한 셀을 한 번만 점유).
+
+    객체마다 등록 당시의 셀 목록을 기억하므로, 객체가 이미 움직인 뒤에도
+    정확히 이전 셀만 지울 수 있음. 월드 밖 셀은 별도 딕셔너리에 보관하여
+    경계 밖에서 겹친 객체도 놓치지 않음.
+
+    watcher를 지정하면 객체의 셀이 바뀔 때마다 watcher.cells_changed(이전 셀, 새 셀)을,
+    전체를 비울 때 watcher.clear()를 호출함 (예: EdgeSpawnIndex).
+    """
+
+    def __init__(self, cols=GRID_COLS, rows=GRID_ROWS):
+        """
+        점유 그리드 초기화
+
+        Args:
+            cols: 그리드 가로 셀 개수
+            rows: 그리드 세로 셀 개수
+        """
+        self.cols = cols
+        self.rows = rows
+        self.counts = np.zeros((cols, rows), dtype=np.int32)
+        self.ids = np.zeros((cols, rows), dtype=np.int32)
+        self.labels = np.zeros((cols, rows), dtype=np.uint8)
+        self.outside = {}  # 월드 밖 셀 (x, y) -> 객체 수
+        self._shared = {}  # 겹친 셀 (x, y) -> {entity_id: label} (점유 수 2 이상인 셀만)
+        self._entries = {}  # obj -> (entity_id, cells, label)
+        self._objects = {}  # entity_id -> obj
+        self._next_id = 1
+        self.watcher = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, obj):
+        return obj in self._entries
+
+    def clear(self):
+        """모든 객체 제거"""
+        self.counts.fill(0)
+        self.ids.fill(0)
+        self.labels.fill(0)
+        self.outside.clear()
+        self._shared.clear()
+        self._entries.clear()
+        self._objects.clear()
+        if self.watcher is not None:
+            self.watcher.clear()
+
+    def in_bounds(self, x, y):
+        """셀이 월드 안에 있는지 확인"""
+        return 0 <= x < self.cols and 0 <= y < self.rows
+
+    def _stamp(self, entity_id, cells, label):
+        counts = self.counts
+        ids = self.ids
+        labels = self.labels
+        cols, rows = self.cols, self.rows
+        for x, y in cells:
+            if 0 <= x < cols and 0 <= y < rows:
+                self._stamp_cell(counts, ids, labels, x, y, (x, y), entity_id, label)
+            else:
+                self._stamp_outside((x, y))
+
+    def _erase(self, entity_id, cells):
+        counts = self.counts
+        ids = self.ids
+        labels = self.labels
+        cols, rows = self.cols, self.rows
+        for x, y in cells:
+            if 0 <= x < cols and 0 <= y < rows:
+                self._erase_cell(counts, ids, labels, x, y, (x, y), entity_id)
+            else:
+                self._erase_outside((x, y))
+
+    def _stamp_cell(self, counts, ids, labels, i, j, cell, entity_id, label):
+        """
+        점유 배열의 [i, j] 칸에 객체 기록 (청크 그리드와 공유하는 셀 단위 처리)
+
+        Args:
+            counts: 점유 수 배열
+            ids: 객체 id 배열
+            labels: 라벨 배열
+            i: 배열 안의 x 좌표
+            j: 배열 안의 y 좌표
+            cell: 월드 셀 (x, y) (겹친 셀 목록의 키)
+            entity_id: 객체 id
+            label: 객체 라벨
+        """
+        count = counts[i, j]
+        if count:
+            # 겹치는 셀: 점유 객체 목록 유지 (처음 겹칠 때 기존 객체부터 기록)
+            if count == 1:
+                self._shared[cell] = {int(ids[i, j]): int(labels[i, j])}
+            self._shared[cell][entity_id] = label
+        counts[i, j] = count + 1
+        ids[i, j] = entity_id
+        labels[i, j] = label
+
+    def _erase_cell(self, counts, ids, labels, i, j, cell, entity_id):
+        """점유 배열의 [i, j] 칸에서 객체 제거 (인자는 _stamp_cell과 같음)"""
+        count = counts[i, j] - 1
+        counts[i, j] = count
+        if count == 0:
+            ids[i, j] = 0
+            labels[i, j] = 0
+            return
+        occupants = self._shared[cell]
+        del occupants[entity_id]
+        if ids[i, j] == entity_id:
+            # 남아 있는 객체 중 하나로 교체
+            other_id, other_label = next(iter(occupants.items()))
+            ids[i, j] = other_id
+            labels[i, j] = other_label
+        if count == 1:
+            del self._shared[cell]
+
+    def _stamp_outside(self, cell):
+        self.outside[cell] = self.outside.get(cell, 0) + 1
+
+    def _erase_outside(self, cell):
+        remaining = self.outside[cell] - 1
+        if remaining:
+            self.outside[cell] = remaining
+        else:
+            del self.outside[cell]
+
+    def add(self, obj, cells=None, label=1):
+        """
+        객체를 현재 위치에 등록
+
+        Args:
+            obj: get_grid_positions()를 가진 게임 객체
+            cells: 등록할 셀 목록 (None이면 obj.get_grid_positions())
+            label: labels 배열에 기록할 값 (1~255)
+        """
+        if obj in self._entries:
+            self.remove(obj)
+        if cells is None:
+            cells = obj.get_grid_positions()
+        cells = tuple(dict.fromkeys(cells))
+        entity_id = self._next_id
+        self._next_id += 1
+        self._entries[obj] = (entity_id, cells, label)
+        self._objects[entity_id] = obj
+        self._stamp(entity_id, cells, label)
+        if self.watcher is not None:
+            self.watcher.cells_changed((), cells)
+
+    def remove(self, obj):
+        """
+        객체 제거 (등록되지 않은 객체는 무시)
+
+        Args:
+            obj: 제거할 게임 객체
+        """
+        entry = self._entries.pop(obj, None)
+        if entry is None:
+            return
+        entity_id, cells, _ = entry
+        del self._objects[entity_id]
+        self._erase(entity_id, cells)
+        if self.watcher is not None:
+            self.watcher.cells_changed(cells, ())
+
+    def move(self, obj, cells=None):
+        """
+        객체의 점유 셀 갱신 (셀이 바뀌지 않았으면 아무것도 하지 않음)
+
+        Args:
+            obj: 이동한 게임 객체
+            cells: 새 셀 목록 (None이면 obj.get_grid_positions())
+        """
+        if cells is None:
+            cells = obj.get_grid_positions()
+        cells = tuple(dict.fromkeys(cells))
+        entry = self._entries.get(obj)
+        if entry is None:
+            self.add(obj, cells)
+            return
+        entity_id, old_cells, label = entry
+        if old_cells == cells:
+            return
+        self._erase(entity_id, old_cells)
+        self._stamp(entity_id, cells, label)
+        self._entries[obj] = (entity_id, cells, label)
+        if self.watcher is not None:
+            self.watcher.cells_changed(old_cells, cells)
+
+    def cells_of(self, obj):
+        """등록된 객체의 점유 셀 반환 (없으면 None)"""
+        entry = self._entries.get(obj)
+        return entry[1] if entry is not None else None
+
+    def entity_id(self, obj):
+        """등록된 객체의 id 반환 (등록 순서대로 증가, 없으면 None)"""
+        entry = self._entries.get(obj)
+        return entry[0] if entry is not None else None
+
+    def count_at(self, x, y):
+        """셀을 차지한 객체 수 반환"""
+        if 0 <= x < self.cols and 0 <= y < self.rows:
+            return int(self.counts[x, y])
+        return self.outside.get((x, y), 0)
+
+    def entity_at(self, x, y):
+        """셀을 차지한 객체 중 하나 반환 (없으면 None)"""
+        if 0 <= x < self.cols and 0 <= y < self.rows:
+            return self._objects.get(int(self.ids[x, y]))
+        return None
+
+    def write_labels(self, out):
+        """
+        셀 라벨을 (cols, rows) 배열에 복사
+
+        Args:
+            out: 기록할 배열
+        """
+        np.copyto(out, self.labels)
+
+    def any_occupied(self, cells):
+        """
+        셀 목록 중 하나라도 점유되어 있는지 확인
+
+        Args:
+            cells: [(x, y), ...] 셀 목록
+
+        Returns:
+            bool: 점유된 셀이 있으면 True
+        """
+        counts = self.counts
+        cols, rows = self.cols, self.rows
+        for x, y in cells:
+            if 0 <= x < cols and 0 <= y < rows:
+                if counts[x, y]:
+                    return True
+            elif (x, y) in self.outside:
+                return True
+        return False
+
+    def is_free_for(self, obj, cells):
+        """
+        obj 자신을 제외한 다른 객체가 셀 목록을 차지하고 있지 않은지 확인
+
+        Args:
+            obj: 기준 객체 (등록된 셀은 점유 수에서 제외)
+            cells: 확인할 셀 목록
+
+        Returns:
+            bool: 다른 객체와 겹치는 셀이 없으면 True
+        """
+        own_cells = self.cells_of(obj) or ()
+        for cell in cells:
+            occupied = self.count_at(*cell)
+            if cell in own_cells:
+                occupied -= 1
+            if occupied > 0:
+                return False
+        return True
@@ -0,0 +1,82 @@
+"""프레임마다 점진적으로 갱신하는 먼 적 -> 가까운 적 순서"""
+
+
+class FarToNearOrder:
+    """
+    플레이어 중심에서 먼 적부터의 처리 순서를 지난 프레임 순서에서 이어 정렬
+
+    결과는 sorted(enemies, key=거리 제곱, reverse=True)와 같음
+    (거리가 같으면 enemies 리스트 순서). 적은 한 틱에 조금씩만 움직이므로
+    지난 순서는 거의 정렬되어 있고, 파이썬 정렬(timsort)은 이미 정렬된 구간을
+    그대로 이어 붙이므로 비교 횟수가 거의 n번에 그침.
+
+    순서는 enemies 리스트 인덱스의 순열로 기억하므로 거리 계산은 리스트
+    순서대로 한 번만 하고, 람다 호출 없이 정렬함.
+    """
+
+    def __init__(self):
+        """순서 초기화"""
+        self._permutation = []  # 지난 프레임의 처리 순서 (enemies 인덱스)
+        self._enemies = None
+        self._count = 0
+
+    def __len__(self):
+        return len(self._permutation)
+
+    def clear(self):
+        """기억한 순서 제거 (다음 호출 때 처음부터 정렬)"""
+        self._permutation = []
+        self._enemies = None
+        self._count = 0
+
+    def _sync(self, enemies):
+        """enemies 리스트가 바뀌었으면 순서에 반영 (뒤에 추가된 적만 있으면 이어 붙임)"""
+        count = len(enemies)
+        if enemies is self._enemies and count == self._count:
+            return
+        if enemies is self._enemies and count > self._count:
+            # spawn으로 뒤에 추가된 적들
+            self._permutation.extend(range(self._count, count))
+        else:
+            self._permutation = list(range(count))
+        self._enemies = enemies
+        self._count = count
+
+    def order(self, enemies, center_x, center_y):
+        """
+        이번 프레임의 처리 순서 (먼 적부터)
+
+        Args:
+            enemies: 적 리스트 (append 외의 변경은 새 리스트로 교체해야 감지됨)
+            center_x: 플레이어 중심 x
+            center_y: 플레이어 중심 y
+
+        Returns:
+            list: 먼 적부터 정렬된 적 리스트
+        """
+        self._sync(enemies)
+        keys = [(e.grid_x - center_x)**2 + (e.grid_y - center_y)**2 for e in enemies]
+
+        # 지난 순서에서 출발하는 안정 정렬 (거의 정렬된 입력)
+        permutation = sorted(self._permutation, key=keys.__getitem__, reverse=True)
+
+        # 거리가 같은 적들은 지난 순서가 아니라 리스트 순서를 따라야 함
+        if len(set(keys)) != len(keys):
+            self._fix_ties(permutation, keys)
+
+        self._permutation = permutation
+        return [enemies[i] for i in permutation]
+
+    @staticmethod
+    def _fix_ties(permutation, keys):
+        """거리가 같은 연속 구간을 리스트 인덱스 순으로 재정렬"""
+        start = 0
+        count = len(permutation)
+        while start < count:
+            key = keys[permutation[start]]
+            end = start + 1
+            while end < count and keys[permutation[end]] == key:
+                end += 1
+            if end - start > 1:
+                permutation[start:end] = sorted(permutation[start:end])
+            start = end
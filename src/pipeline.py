@@ -0,0 +1,158 @@
+"""시뮬레이션과 렌더링을 겹쳐 실행하는 파이프라인 (시뮬레이션은 작업 스레드, 그리기는 메인 스레드)
+
+한 프레임의 흐름:
+    메인 스레드                          작업 스레드
+    이벤트 처리, 키 읽기
+    start(): 틱 N+1 시작 요청     ->     game.advance() (틱 N+1...)
+    front(틱 N 스냅샷) 그리기             끝나면 새 스냅샷을 back으로 만듦
+    finish(): 작업 완료 대기, back을 front로 교체
+
+front는 이미 만들어진 RenderFrame이고 작업 스레드는 새 back만 만들므로, 그리는 동안
+게임 상태가 바뀌어도 화면에는 틱 N의 상태가 그대로 그려짐. pygame의 blit/fill/flip은
+SDL 호출 동안 GIL을 놓으므로 그리는 동안 시뮬레이션 코드가 실제로 함께 실행됨.
+이벤트 처리와 게임 상태 변경(재시작 등)은 작업 스레드가 쉬는 finish()와 start() 사이에서만 함.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from src.game_object import GameObject
+
+
+class FrozenObject(GameObject):
+    """
+    그리기용으로 복사한 게임 객체 (위치/색상/모양 고정, 원본 객체와 같은 객체로 취급)
+
+    DirtyRectRenderer가 지난 프레임의 같은 객체를 찾을 수 있도록 해시와 비교는
+    원본 객체 기준임.
+    """
+
+    __slots__ = ("source",)
+
+    def __init__(self, source):
+        """
+        객체 복사
+
+        Args:
+            source: 원본 게임 객체
+        """
+        self.source = source
+        self.grid_x = source.grid_x
+        self.grid_y = source.grid_y
+        self.grid_size = source.grid_size
+        self.color = source.color
+        self._shape = self.compiled_shape = source.compiled_shape
+
+    def __hash__(self):
+        return hash(self.source)
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenObject):
+            return self.source is other.source
+        return self.source is other
+
+
+class RenderFrame:
+    """
+    한 틱의 화면 내용 (그릴 객체, 카메라 이동량, HUD 값)
+
+    만든 뒤에는 바꾸지 않음. Game.render_frame(frozen=True)로 만든 프레임은
+    이후 update와 무관하게 그 틱의 모습을 유지함.
+    """
+
+    __slots__ = ("tick", "objects", "offset", "enemy_count", "game_over")
+
+    def __init__(self, tick, objects, offset, enemy_count, game_over):
+        """
+        프레임 생성
+
+        Args:
+            tick: 이 프레임의 틱 번호
+            objects: 그릴 객체들 (그리는 순서대로)
+            offset: 화면 픽셀 이동량 (Camera.offset)
+            enemy_count: HUD에 표시할 적 수
+            game_over: 게임 오버 여부
+        """
+        self.tick = tick
+        self.objects = objects
+        self.offset = offset
+        self.enemy_count = enemy_count
+        self.game_over = game_over
+
+
+class SimulationPipeline:
+    """
+    게임 시뮬레이션을 작업 스레드 하나에서 실행하고 이중 버퍼 스냅샷을 넘겨 주는 파이프라인
+
+    front는 메인 스레드가 그리는 프레임, 작업 스레드는 틱을 실행한 뒤 새 프레임(back)을
+    만들고 finish()에서 front와 교체됨. 틱을 하나도 실행하지 않았으면 front를 그대로 둠.
+    """
+
+    def __init__(self, game):
+        """
+        파이프라인 시작 (현재 상태를 첫 front로 사용)
+
+        Args:
+            game: 실행할 Game
+        """
+        self.game = game
+        self.front = game.render_frame(frozen=True)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="simulation")
+        self._pending = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def busy(self):
+        """작업 스레드가 틱을 실행 중인지 여부"""
+        return self._pending is not None
+
+    def refresh(self):
+        """
+        front를 현재 게임 상태로 다시 만듦 (작업 스레드가 쉬는 동안 재시작 등으로 상태가 바뀐 경우)
+        """
+        if self.busy:
+            raise RuntimeError("시뮬레이션 실행 중에는 front를 다시 만들 수 없음")
+        self.front = self.game.render_frame(frozen=True)
+
+    def start(self, elapsed_ms, keys=None):
+        """
+        작업 스레드에서 흐른 시간만큼 틱 실행 시작
+
+        Args:
+            elapsed_ms: 지난 프레임 이후 흐른 실제 시간 (밀리초)
+            keys: 이번 틱들에 쓸 키 상태 (None이면 틱마다 game.read_keys())
+        """
+        if self.busy:
+            raise RuntimeError("이전 틱 실행이 끝나지 않음")
+        self._pending = self._executor.submit(self._step, elapsed_ms, keys)
+
+    def _step(self, elapsed_ms, keys):
+        game = self.game
+        ticks = game.advance(elapsed_ms, keys)
+        return ticks, game.render_frame(frozen=True) if ticks else None
+
+    def finish(self):
+        """
+        틱 실행이 끝나기를 기다린 뒤 새 프레임을 front로 교체
+
+        Returns:
+            int: 실행한 틱 수 (작업 스레드의 예외는 여기서 다시 발생)
+        """
+        if not self.busy:
+            return 0
+        pending, self._pending = self._pending, None
+        ticks, back = pending.result()
+        if back is not None:
+            self.front = back
+        return ticks
+
+    def close(self):
+        """실행 중인 틱을 마치고 작업 스레드 종료"""
+        try:
+            self.finish()
+        finally:
+            self._executor.shutdown(wait=True)
@@ -2,12 +2,14 @@
 
 import pygame
 from src.game_object import GameObject
-from src.constants import PLAYER_SHAPE, GREEN, PLAYER_SPEED_GRID
+from src.constants import PLAYER_SHAPE, GREEN, PLAYER_SPEED_GRID, PLAYER_MOVE_DELAY, GRID_COLS, GRID_ROWS
 
 
 class Player(GameObject):
     """게임의 주인공 캐릭터 (그리드 기반, + 모양)"""
     
+    __slots__ = ("speed", "move_cooldown", "move_delay")
+    
     def __init__(self, grid_x, grid_y):
         """
         플레이어 초기화
@@ -21,15 +23,17 @@ class Player(GameObject):
         
         # 키 입력 쿨다운 (너무 빠른 이동 방지)
         self.move_cooldown = 0
-        self.move_delay = 3  # 프레임 수
+        self.move_delay = PLAYER_MOVE_DELAY  # 시뮬레이션 틱 수
     
-    def move(self, keys):
+    def move(self, keys, cols=GRID_COLS, rows=GRID_ROWS):
         """
         키 입력에 따라 플레이어 이동 (그리드 단위)
-        화면 밖으로 나가지 못하도록 제한
+        월드 밖으로 나가지 못하도록 제한
         
         Args:
             keys: pygame.key.get_pressed()로 얻은 키 상태
+            cols: 월드 가로 셀 개수
+            rows: 월드 세로 셀 개수
         """
         # 쿨다운 감소
         if self.move_cooldown > 0:
@@ -42,28 +46,28 @@ class Player(GameObject):
         # 왼쪽 이동
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
             new_x = self.grid_x - self.speed
-            if self.is_valid_position(new_x, new_y):
+            if self.is_valid_position(new_x, new_y, cols, rows):
                 self.grid_x = new_x
                 moved = True
         
         # 오른쪽 이동
         elif keys[pygame.K_RIGHT] or keys[pygame.K_d]:
             new_x = self.grid_x + self.speed
-            if self.is_valid_position(new_x, new_y):
+            if self.is_valid_position(new_x, new_y, cols, rows):
                 self.grid_x = new_x
                 moved = True
         
         # 위로 이동
         elif keys[pygame.K_UP] or keys[pygame.K_w]:
             new_y = self.grid_y - self.speed
-            if self.is_valid_position(new_x, new_y):
+            if self.is_valid_position(new_x, new_y, cols, rows):
                 self.grid_y = new_y
                 moved = True
         
         # 아래로 이동
         elif keys[pygame.K_DOWN] or keys[pygame.K_s]:
             new_y = self.grid_y + self.speed
-            if self.is_valid_position(new_x, new_y):
+            if self.is_valid_position(new_x, new_y, cols, rows):
                 self.grid_y = new_y
                 moved = True
         
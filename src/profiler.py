@@ -0,0 +1,145 @@
+"""프레임 단계별 시간 측정 (고정 크기 링 버퍼)"""
+
+import threading
+import time
+import numpy as np
+from src.constants import PROFILER_HISTORY
+
+# Game.run 한 프레임의 측정 단계 (표시 순서)
+FRAME_PHASES = ("events", "player", "spawn", "sort", "enemies", "collision", "draw", "wait")
+
+
+class FrameProfiler:
+    """
+    프레임마다 단계별 소요 시간을 링 버퍼에 기록하고 최근 구간 통계를 계산
+
+    사용 순서 (한 프레임):
+        profiler.begin_frame()
+        ... 단계 실행 ... profiler.mark("events")
+        ... 단계 실행 ... profiler.mark("draw")
+        profiler.end_frame()
+
+    mark(name)은 직전 mark(또는 begin_frame) 이후 흐른 시간을 name 단계에
+    더함. 프레임 밖에서 호출된 mark는 무시되므로 update만 따로 호출해도 됨.
+    begin_frame을 호출한 스레드가 아닌 곳의 mark도 무시함 (파이프라인의 작업 스레드).
+    """
+
+    def __init__(self, phases=FRAME_PHASES, capacity=PROFILER_HISTORY):
+        """
+        프로파일러 초기화
+
+        Args:
+            phases: 측정할 단계 이름들
+            capacity: 기억할 최근 프레임 수
+        """
+        self.phases = tuple(phases)
+        self.capacity = capacity
+        self._rows = {name: row for row, name in enumerate(self.phases)}
+        # 단계별 시간 (초), 마지막 행은 프레임 전체 시간
+        self._samples = np.zeros((len(self.phases) + 1, capacity))
+        self._index = 0
+        self.frames = 0  # 지금까지 기록된 프레임 수
+        self._frame_start = None
+        self._last = None
+        self._thread = None
+
+    def __len__(self):
+        """버퍼에 남아 있는 프레임 수"""
+        return min(self.frames, self.capacity)
+
+    def clear(self):
+        """기록 모두 제거"""
+        self._samples.fill(0.0)
+        self._index = 0
+        self.frames = 0
+        self._frame_start = None
+        self._last = None
+
+    def begin_frame(self):
+        """프레임 측정 시작"""
+        self._samples[:, self._index] = 0.0
+        self._thread = threading.get_ident()
+        self._frame_start = self._last = time.perf_counter()
+
+    def mark(self, name):
+        """
+        직전 표시 이후 흐른 시간을 단계에 기록
+
+        Args:
+            name: 단계 이름 (phases 중 하나)
+        """
+        if self._last is None or threading.get_ident() != self._thread:
+            return
+        now = time.perf_counter()
+        self._samples[self._rows[name], self._index] += now - self._last
+        self._last = now
+
+    def end_frame(self):
+        """프레임 측정 종료 (전체 시간 기록 후 다음 칸으로 이동)"""
+        if self._frame_start is None:
+            return
+        self._samples[-1, self._index] = time.perf_counter() - self._frame_start
+        self._index = (self._index + 1) % self.capacity
+        self.frames += 1
+        self._frame_start = self._last = None
+
+    def _recent(self):
+        """버퍼에 남아 있는 프레임들의 샘플 (초)"""
+        return self._samples[:, :len(self)]
+
+    def stats(self):
+        """
+        최근 프레임들의 단계별 통계
+
+        Returns:
+            dict: 단계 이름 -> (p50, p95, max) 밀리초, "frame"은 프레임 전체
+        """
+        samples = self._recent()
+        if samples.shape[1] == 0:
+            return {name: (0.0, 0.0, 0.0) for name in self.phases + ("frame",)}
+        p50, p95 = np.percentile(samples, (50, 95), axis=1) * 1000
+        peak = samples.max(axis=1) * 1000
+        return {
+            name: (float(p50[row]), float(p95[row]), float(peak[row]))
+            for row, name in enumerate(self.phases + ("frame",))
+        }
+
+    def fps(self):
+        """
+        최근 프레임들의 실제 FPS
+
+        Returns:
+            float: 평균 프레임 시간 기준 FPS (기록이 없으면 0)
+        """
+        frame_times = self._recent()[-1]
+        if frame_times.size == 0 or frame_times.mean() <= 0:
+            return 0.0
+        return float(1.0 / frame_times.mean())
+
+    def slowest_phase(self):
+        """
+        가장 최근 프레임에서 가장 오래 걸린 단계
+
+        Returns:
+            tuple: (단계 이름, 밀리초), 기록이 없으면 None
+        """
+        if not self.frames:
+            return None
+        column = self._samples[:-1, (self._index - 1) % self.capacity]
+        row = int(column.argmax())
+        return self.phases[row], float(column[row] * 1000)
+
+    def report_lines(self, target_fps):
+        """
+        화면 표시용 텍스트 줄들
+
+        Args:
+            target_fps: 목표 FPS
+
+        Returns:
+            list: 문자열 리스트 (FPS 줄 + 단계별 p50/p95/max)
+        """
+        lines = [f"FPS {self.fps():5.1f} / {target_fps}   (p50 / p95 / max ms)"]
+        for name, (p50, p95, peak) in self.stats().items():
+            lines.append(f"{name:<10}{p50:7.2f}{p95:7.2f}{peak:7.2f}")
+        return lines
@@ -0,0 +1,143 @@
+"""변경된 영역만 다시 그리는 렌더러 (dirty rectangle 방식)"""
+
+import pygame
+from src.constants import GRID_WIDTH, GRID_HEIGHT, BLACK
+
+
+def cells_rect(cells):
+    """
+    셀 목록을 감싸는 픽셀 Rect 반환
+
+    Args:
+        cells: [(x, y), ...] 그리드 좌표 목록 (비어 있지 않아야 함)
+
+    Returns:
+        pygame.Rect: 픽셀 영역
+    """
+    xs = [x for x, y in cells]
+    ys = [y for x, y in cells]
+    min_x, min_y = min(xs), min(ys)
+    return pygame.Rect(
+        min_x * GRID_WIDTH, min_y * GRID_HEIGHT,
+        (max(xs) - min_x + 1) * GRID_WIDTH, (max(ys) - min_y + 1) * GRID_HEIGHT
+    )
+
+
+class DirtyRectRenderer:
+    """
+    객체별로 지난 프레임에 차지한 셀을 기억해 두고, 바뀐 영역만 지우고 다시 그림
+
+    한 프레임의 처리 순서:
+    1. 셀이 바뀐 객체의 이전/현재 영역, 사라진 객체의 이전 영역, HUD 영역을 dirty로 표시
+    2. dirty 영역마다 배경색으로 지움
+    3. 그 영역과 겹치는 객체만 원래 순서대로 다시 그리고 HUD를 맨 위에 그림
+    4. dirty 영역 목록을 반환 (pygame.display.update에 전달)
+
+    dirty 영역 밖의 픽셀은 이전 프레임과 같으므로 전체를 다시 그린 결과와 일치함.
+    """
+
+    def __init__(self, background=BLACK, sprite_cache=None):
+        """
+        렌더러 초기화
+
+        Args:
+            background: 배경색
+            sprite_cache: 객체를 그릴 SpriteCache (None이면 GameObject.draw 사용)
+        """
+        self.background = background
+        self.sprite_cache = sprite_cache
+        self._previous = {}  # obj -> (cells, rect)
+        self._previous_overlays = []  # 지난 프레임 HUD 영역
+        self._offset = (0, 0)  # 지난 프레임 카메라 이동량
+        self._needs_full_redraw = True
+
+    def invalidate(self):
+        """다음 프레임을 전체 다시 그리기로 표시 (게임 오버 전환, 재시작 등)"""
+        self._needs_full_redraw = True
+
+    def draw(self, screen, objects, overlays=(), offset=(0, 0)):
+        """
+        변경된 영역만 다시 그림 (카메라가 움직였으면 전체 다시 그림)
+
+        Args:
+            screen: 그릴 surface
+            objects: 그릴 게임 객체들 (그리는 순서대로, 화면 밖 객체는 빼도 됨)
+            overlays: 객체 위에 그릴 (surface, rect) 목록 (HUD 텍스트 등)
+            offset: 화면 픽셀 이동량 (카메라 스크롤, Camera.offset)
+
+        Returns:
+            list: 화면에 반영해야 할 pygame.Rect 목록
+        """
+        if offset != self._offset:
+            self._offset = offset
+            self._needs_full_redraw = True
+
+        current = {}
+        for obj in objects:
+            cells = tuple(obj.get_grid_positions())
+            current[obj] = (cells, cells_rect(cells).move(offset) if cells else None)
+
+        if self._needs_full_redraw:
+            screen.fill(self.background)
+            self._draw_objects(screen, objects)
+            for surface, rect in overlays:
+                screen.blit(surface, rect)
+            self._previous = current
+            self._previous_overlays = [pygame.Rect(rect) for surface, rect in overlays]
+            self._needs_full_redraw = False
+            return [screen.get_rect()]
+
+        # 1. dirty 영역 수집
+        dirty = []
+        previous = self._previous
+        for obj, (cells, rect) in current.items():
+            old = previous.pop(obj, None)
+            if old is None:
+                if rect is not None:
+                    dirty.append(rect)
+            elif old[0] != cells:
+                if old[1] is not None:
+                    dirty.append(old[1])
+                if rect is not None:
+                    dirty.append(rect)
+        # 이번 프레임에 없는 객체 (제거됨)
+        for cells, rect in previous.values():
+            if rect is not None:
+                dirty.append(rect)
+        # HUD는 내용이 바뀔 수 있으므로 지난 영역과 현재 영역을 항상 다시 그림
+        overlay_rects = [pygame.Rect(rect) for surface, rect in overlays]
+        dirty.extend(self._previous_overlays)
+        dirty.extend(overlay_rects)
+        self._previous = current
+        self._previous_overlays = overlay_rects
+
+        if not dirty:
+            return []
+
+        # 2~3. dirty 영역마다 잘라내기(clip)를 걸고 지운 뒤, 겹치는 객체만 원래 순서로 다시 그림
+        #      (영역 밖 픽셀을 건드리지 않아야 겹친 객체의 그리기 순서가 유지됨)
+        objects_in_rect = [[] for _ in dirty]
+        for obj in objects:
+            rect = current[obj][1]
+            if rect is not None:
+                for index in rect.collidelistall(dirty):
+                    objects_in_rect[index].append(obj)
+
+        old_clip = screen.get_clip()
+        for rect, rect_objects in zip(dirty, objects_in_rect):
+            screen.set_clip(rect)
+            screen.fill(self.background)
+            self._draw_objects(screen, rect_objects)
+            for surface, overlay_rect in overlays:
+                screen.blit(surface, overlay_rect)
+        screen.set_clip(old_clip)
+
+        return dirty
+
+    def _draw_objects(self, screen, objects):
+        """객체들을 순서대로 그림 (스프라이트 캐시가 있으면 일괄 blit)"""
+        if self.sprite_cache is not None:
+            self.sprite_cache.draw(screen, objects, self._offset)
+        else:
+            for obj in objects:
+                obj.draw(screen, self._offset)
@@ -0,0 +1,390 @@
+"""게임 리플레이 녹화/재생 (시드 + 틱별 입력 + 주기적 키프레임)
+
+파일 구조 (리틀 엔디언):
+    헤더        magic "FGRP", 버전, 시드, 밸런스 설정, 틱 수, 키프레임 간격
+    옵션        Swarm 사용 여부, pathing, 월드 크기, 청크 설정, spawner, 웨이브 크기
+    입력 로그   틱마다 1바이트 키 비트마스크 (zlib 압축)
+    키프레임    (틱, 오프셋, 길이) 인덱스 테이블 + 상태 스냅샷들 (src.snapshot 형식)
+
+키프레임 k는 k틱을 실행한 직후의 전체 상태이고, inputs[k]는 k+1번째 틱의 입력임.
+임의의 틱으로 이동할 때는 그 틱 이전의 가장 가까운 키프레임을 복원한 뒤
+남은 입력만 다시 실행함.
+
+사용 예:
+    python -m src.replay replays/20260101-120000.fgr
+    python -m src.replay replays/20260101-120000.fgr --seek 3600
+"""
+
+import argparse
+import bisect
+import numbers
+import os
+import struct
+import sys
+import time
+import zlib
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from src.constants import (
+    REPLAY_KEYFRAME_INTERVAL, GRID_COLS, GRID_ROWS, ACTIVE_CHUNK_RADIUS, FAR_CHUNK_INTERVAL
+)
+from src.input_state import KeyState
+from src.snapshot import capture_snapshot, restore_snapshot, dumps, loads
+
+REPLAY_MAGIC = b"FGRP"
+REPLAY_VERSION = 1
+
+# 비트 -> 같은 동작으로 취급되는 키들 (Player.move/Game.update가 확인하는 키)
+INPUT_BITS = (
+    (pygame.K_LEFT, pygame.K_a),
+    (pygame.K_RIGHT, pygame.K_d),
+    (pygame.K_UP, pygame.K_w),
+    (pygame.K_DOWN, pygame.K_s),
+    (pygame.K_ESCAPE,),
+)
+
+# 비트마스크 -> KeyState (재생 시 매 틱 새로 만들지 않도록 미리 생성)
+_DECODED_KEYS = [
+    KeyState(keys[0] for bit, keys in enumerate(INPUT_BITS) if mask & (1 << bit))
+    for mask in range(1 << len(INPUT_BITS))
+]
+
+_HEADER = struct.Struct("<4sHBqddIIII")
+_KEYFRAME_ENTRY = struct.Struct("<IQI")
+# Swarm 사용 여부, pathing, 월드 가로/세로 셀 수, 청크 크기(0이면 청크 없음)/활성 반경/먼 청크 간격,
+# spawner, 웨이브 크기, 압축된 입력 길이
+_OPTIONS = struct.Struct("<BBIIIIIBII")
+
+# Game pathing 설정 <-> 파일에 저장하는 번호
+PATHINGS = ("direct", "flow")
+PATHING_CODES = {name: code for code, name in enumerate(PATHINGS)}
+
+# Game spawner 설정 <-> 파일에 저장하는 번호
+SPAWNERS = ("random", "indexed")
+SPAWNER_CODES = {name: code for code, name in enumerate(SPAWNERS)}
+
+# 헤더에 저장할 수 있는 시드 범위 (부호 있는 64비트 정수)
+SEED_MIN = -(1 << 63)
+SEED_MAX = (1 << 63) - 1
+
+
+def check_seed(seed):
+    """
+    리플레이 헤더에 저장할 수 있는 시드인지 확인
+
+    Args:
+        seed: None 또는 SEED_MIN~SEED_MAX 범위의 정수
+
+    Returns:
+        int: 정수로 변환한 시드 (None이면 None)
+
+    Raises:
+        ValueError: 정수가 아니거나 64비트 범위를 벗어난 시드
+    """
+    if seed is None:
+        return None
+    if isinstance(seed, bool) or not isinstance(seed, numbers.Integral):
+        raise ValueError(f"시드는 정수여야 함: {seed!r}")
+    seed = int(seed)
+    if not SEED_MIN <= seed <= SEED_MAX:
+        raise ValueError(f"시드는 64비트 정수 범위({SEED_MIN}~{SEED_MAX}) 안이어야 함: {seed}")
+    return seed
+
+
+def encode_keys(keys):
+    """
+    키 상태를 1바이트 비트마스크로 변환
+
+    Args:
+        keys: 키 코드로 인덱싱 가능한 키 상태
+
+    Returns:
+        int: INPUT_BITS 순서의 비트마스크
+    """
+    mask = 0
+    for bit, codes in enumerate(INPUT_BITS):
+        if any(keys[code] for code in codes):
+            mask |= 1 << bit
+    return mask
+
+
+def decode_keys(mask):
+    """
+    비트마스크를 KeyState로 변환
+
+    Args:
+        mask: encode_keys 결과
+
+    Returns:
+        KeyState: 재생용 키 상태
+    """
+    return _DECODED_KEYS[mask]
+
+
+class ReplayRecorder:
+    """
+    게임의 틱별 입력과 주기적 키프레임을 기록
+
+    Game.update가 매 틱 입력을 확정한 직후 record_tick을 호출함.
+    """
+
+    def __init__(self, game, keyframe_interval=REPLAY_KEYFRAME_INTERVAL):
+        """
+        녹화 시작 (현재 상태를 첫 키프레임으로 저장)
+
+        Args:
+            game: 녹화할 Game 인스턴스
+            keyframe_interval: 키프레임 간격 (틱)
+        """
+        self.keyframe_interval = keyframe_interval
+        self.replay = Replay(
+            seed=game.seed,
+            use_swarm=game.use_swarm,
+            params={
+                "enemy_speed": game.enemy_speed,
+                "spawn_interval": game.spawn_interval,
+                "max_enemies": game.max_enemies,
+                "pathing": game.pathing,
+                "world_cols": game.world_cols,
+                "world_rows": game.world_rows,
+                "chunk_size": game.chunk_size,
+                "active_chunk_radius": game.active_chunk_radius,
+                "far_chunk_interval": game.far_chunk_interval,
+                "spawner": game.spawner,
+                "wave_size": game.wave_size,
+            },
+            start_tick=game.tick_count,
+            keyframe_interval=keyframe_interval,
+        )
+        self.replay.keyframes.append((game.tick_count, dumps(capture_snapshot(game))))
+
+    def record_tick(self, game, keys):
+        """
+        한 틱의 입력 기록 (틱 실행 전에 호출)
+
+        Args:
+            game: 녹화 중인 Game 인스턴스
+            keys: 이번 틱에 사용할 키 상태
+        """
+        tick = game.tick_count
+        replay = self.replay
+        if (tick - replay.start_tick) % self.keyframe_interval == 0 and replay.keyframes[-1][0] != tick:
+            replay.keyframes.append((tick, dumps(capture_snapshot(game))))
+        replay.inputs.append(encode_keys(keys))
+
+    def save(self, path):
+        """녹화 내용을 파일로 저장"""
+        self.replay.save(path)
+
+
+class Replay:
+    """
+    녹화된 세션 (시드, 설정, 틱별 입력, 키프레임)
+
+    play()는 헤드리스 게임으로 최대 속도 재생, seek()는 키프레임에서
+    출발해 원하는 틱의 상태를 만듦.
+    """
+
+    def __init__(self, seed=None, use_swarm=False, params=None, start_tick=0,
+                 keyframe_interval=REPLAY_KEYFRAME_INTERVAL, inputs=None, keyframes=None):
+        """
+        리플레이 초기화
+
+        Args:
+            seed: 녹화한 게임의 시드 (참고용, 실제 난수 상태는 키프레임에 저장)
+            use_swarm: 녹화한 게임의 Swarm 엔진 사용 여부
+            params: Game 설정 키워드 인자 (enemy_speed, spawn_interval, max_enemies, pathing,
+                world_cols, world_rows, chunk_size, active_chunk_radius, far_chunk_interval,
+                spawner, wave_size)
+            start_tick: 첫 입력의 틱 번호 (= 첫 키프레임의 틱)
+            keyframe_interval: 키프레임 간격 (틱)
+            inputs: 틱별 키 비트마스크
+            keyframes: [(틱, 스냅샷 바이트), ...] (틱 오름차순)
+        """
+        self.seed = check_seed(seed)
+        self.use_swarm = use_swarm
+        self.params = dict(params or {})
+        self.start_tick = start_tick
+        self.keyframe_interval = keyframe_interval
+        self.inputs = bytearray(inputs or b"")
+        self.keyframes = list(keyframes or [])
+
+    @property
+    def end_tick(self):
+        """마지막 입력까지 실행한 뒤의 틱 번호"""
+        return self.start_tick + len(self.inputs)
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def save(self, path):
+        """
+        바이너리 파일로 저장
+
+        Args:
+            path: 저장 경로
+        """
+        inputs = zlib.compress(bytes(self.inputs), 9)
+        header = _HEADER.pack(
+            REPLAY_MAGIC, REPLAY_VERSION, self.seed is not None,
+            self.seed if self.seed is not None else 0,
+            self.params["enemy_speed"], self.params["spawn_interval"], self.params["max_enemies"],
+            self.start_tick, len(self.inputs), self.keyframe_interval,
+        )
+        index = []
+        offset = 0
+        for tick, state in self.keyframes:
+            index.append(_KEYFRAME_ENTRY.pack(tick, offset, len(state)))
+            offset += len(state)
+
+        with open(path, "wb") as f:
+            f.write(header)
+            f.write(_OPTIONS.pack(
+                self.use_swarm, PATHING_CODES[self.params.get("pathing", "direct")],
+                self.params.get("world_cols", GRID_COLS), self.params.get("world_rows", GRID_ROWS),
+                self.params.get("chunk_size") or 0,
+                self.params.get("active_chunk_radius", ACTIVE_CHUNK_RADIUS),
+                self.params.get("far_chunk_interval", FAR_CHUNK_INTERVAL),
+                SPAWNER_CODES[self.params.get("spawner", "random")], self.params.get("wave_size", 1),
+                len(inputs)
+            ))
+            f.write(inputs)
+            f.write(struct.pack("<I", len(self.keyframes)))
+            f.write(b"".join(index))
+            for tick, state in self.keyframes:
+                f.write(state)
+
+    @classmethod
+    def load(cls, path):
+        """
+        바이너리 파일에서 읽기
+
+        Args:
+            path: 리플레이 파일 경로
+
+        Returns:
+            Replay: 읽은 리플레이
+
+        Raises:
+            ValueError: 리플레이 파일이 아니거나 지원하지 않는 버전인 경우
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+
+        (magic, version, has_seed, seed, enemy_speed, spawn_interval, max_enemies,
+         start_tick, tick_count, keyframe_interval) = _HEADER.unpack_from(data, 0)
+        if magic != REPLAY_MAGIC:
+            raise ValueError(f"리플레이 파일이 아님: {path}")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"지원하지 않는 리플레이 버전: {version}")
+        pos = _HEADER.size
+
+        (use_swarm, pathing, world_cols, world_rows, chunk_size, active_chunk_radius, far_chunk_interval,
+         spawner, wave_size, input_size) = _OPTIONS.unpack_from(data, pos)
+        pos += _OPTIONS.size
+        inputs = zlib.decompress(data[pos:pos + input_size])
+        pos += input_size
+        if len(inputs) != tick_count:
+            raise ValueError(f"입력 로그 길이가 맞지 않음: {len(inputs)} != {tick_count}")
+
+        (keyframe_count,) = struct.unpack_from("<I", data, pos)
+        pos += 4
+        entries = [
+            _KEYFRAME_ENTRY.unpack_from(data, pos + i * _KEYFRAME_ENTRY.size)
+            for i in range(keyframe_count)
+        ]
+        blob_start = pos + keyframe_count * _KEYFRAME_ENTRY.size
+        keyframes = [
+            (tick, data[blob_start + offset:blob_start + offset + length])
+            for tick, offset, length in entries
+        ]
+
+        return cls(
+            seed=seed if has_seed else None,
+            use_swarm=bool(use_swarm),
+            params={"enemy_speed": enemy_speed, "spawn_interval": spawn_interval,
+                    "max_enemies": max_enemies, "pathing": PATHINGS[pathing],
+                    "world_cols": world_cols, "world_rows": world_rows,
+                    "chunk_size": chunk_size or None, "active_chunk_radius": active_chunk_radius,
+                    "far_chunk_interval": far_chunk_interval, "spawner": SPAWNERS[spawner],
+                    "wave_size": wave_size},
+            start_tick=start_tick,
+            keyframe_interval=keyframe_interval,
+            inputs=inputs,
+            keyframes=keyframes,
+        )
+
+    def make_game(self):
+        """녹화와 같은 설정의 헤드리스 게임 생성"""
+        from src.game import Game  # game 모듈이 녹화를 위해 이 모듈을 import하므로 지연 import
+        return Game(headless=True, seed=self.seed, use_swarm=self.use_swarm, **self.params)
+
+    def seek(self, tick, game=None):
+        """
+        원하는 틱 직후의 상태로 게임을 맞춤 (가장 가까운 이전 키프레임에서 출발)
+
+        Args:
+            tick: 목표 틱 (start_tick 이상 end_tick 이하)
+            game: 상태를 덮어쓸 게임 (None이면 새 헤드리스 게임)
+
+        Returns:
+            Game: 목표 틱 상태의 게임
+        """
+        if not self.start_tick <= tick <= self.end_tick:
+            raise ValueError(f"틱 범위를 벗어남: {tick} (가능: {self.start_tick}~{self.end_tick})")
+        if game is None:
+            game = self.make_game()
+
+        ticks = [keyframe_tick for keyframe_tick, _ in self.keyframes]
+        keyframe_tick, state = self.keyframes[bisect.bisect_right(ticks, tick) - 1]
+        restore_snapshot(game, loads(state))
+        self._run(game, keyframe_tick, tick)
+        return game
+
+    def play(self, game=None):
+        """
+        처음부터 끝까지 최대 속도로 재생
+
+        Args:
+            game: 재생에 사용할 게임 (None이면 새 헤드리스 게임)
+
+        Returns:
+            Game: 재생이 끝난 게임
+        """
+        return self.seek(self.end_tick, game)
+
+    def _run(self, game, from_tick, to_tick):
+        """녹화된 입력으로 from_tick 이후부터 to_tick까지 실행"""
+        inputs = self.inputs
+        update = game.update
+        for tick in range(from_tick, to_tick):
+            update(keys=_DECODED_KEYS[inputs[tick - self.start_tick]])
+
+
+def main(argv=None):
+    """리플레이 재생 진입점"""
+    parser = argparse.ArgumentParser(description="Fighter Game 리플레이 재생")
+    parser.add_argument("path", help="리플레이 파일")
+    parser.add_argument("--seek", type=int, default=None, help="이 틱의 상태로 이동 (기본: 끝까지)")
+    args = parser.parse_args(argv)
+
+    replay = Replay.load(args.path)
+    started = time.perf_counter()
+    if args.seek is None:
+        game = replay.play()
+    else:
+        game = replay.seek(args.seek)
+    elapsed = time.perf_counter() - started
+
+    print(f"틱 {game.tick_count} / {replay.end_tick}, 적 {len(game.enemies)}, "
+          f"게임 오버 {game.game_over}, 재생 {elapsed:.2f}초 "
+          f"(키프레임 {len(replay.keyframes)}개, 입력 {len(replay)}틱)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
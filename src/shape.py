@@ -0,0 +1,91 @@
+"""미리 계산된 모양 정보 (중심점, 경계, 오프셋 공유)"""
+
+from src.constants import PLAYER_SHAPE, ENEMY_SHAPES
+
+
+class Shape:
+    """
+    상대 좌표 리스트를 한 번만 분석해 둔 불변 모양 객체
+
+    같은 좌표 구성의 모양은 compile_shape()가 항상 같은 인스턴스를 반환하므로
+    같은 모양을 쓰는 모든 GameObject가 이 객체를 공유함.
+    리스트처럼 순회/len()/인덱싱이 가능해 기존 shape 리스트 자리에 그대로 쓸 수 있음.
+    """
+
+    def __init__(self, offsets):
+        """
+        모양 분석
+
+        Args:
+            offsets: 상대 좌표 리스트 [(0,0), (1,0), ...]
+        """
+        self.offsets = tuple((int(dx), int(dy)) for dx, dy in offsets)
+        self.dxs = tuple(dx for dx, dy in self.offsets)
+        self.dys = tuple(dy for dx, dy in self.offsets)
+        self.size = len(self.offsets)
+
+        if self.offsets:
+            # GameObject.get_center의 기존 계산식과 같은 부동소수점 결과
+            self.center_x = sum(self.dxs) / self.size
+            self.center_y = sum(self.dys) / self.size
+            self.min_x, self.max_x = min(self.dxs), max(self.dxs)
+            self.min_y, self.max_y = min(self.dys), max(self.dys)
+        else:
+            self.center_x = self.center_y = 0.0
+            self.min_x = self.max_x = self.min_y = self.max_y = 0
+
+        self.width = self.max_x - self.min_x + 1
+        self.height = self.max_y - self.min_y + 1
+
+        # 경계 상자 기준 행별 비트마스크 (행 dy - min_y의 비트 dx - min_x)
+        row_masks = [0] * self.height if self.offsets else []
+        for dx, dy in self.offsets:
+            row_masks[dy - self.min_y] |= 1 << (dx - self.min_x)
+        self.row_masks = tuple(row_masks)
+
+    def __iter__(self):
+        return iter(self.offsets)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        return self.offsets[index]
+
+    def __eq__(self, other):
+        if isinstance(other, Shape):
+            return self.offsets == other.offsets
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.offsets)
+
+    def __repr__(self):
+        return f"Shape({list(self.offsets)})"
+
+
+_shape_cache = {}
+
+
+def compile_shape(shape):
+    """
+    모양을 Shape로 변환 (같은 좌표 구성이면 같은 인스턴스 반환)
+
+    Args:
+        shape: 상대 좌표 리스트 또는 Shape
+
+    Returns:
+        Shape: 공유되는 모양 객체
+    """
+    if isinstance(shape, Shape):
+        return shape
+    key = tuple((int(dx), int(dy)) for dx, dy in shape)
+    compiled = _shape_cache.get(key)
+    if compiled is None:
+        compiled = _shape_cache[key] = Shape(key)
+    return compiled
+
+
+# 게임에서 쓰는 모양들 (모듈 로드 시 한 번만 계산)
+COMPILED_PLAYER_SHAPE = compile_shape(PLAYER_SHAPE)
+COMPILED_ENEMY_SHAPES = [compile_shape(shape) for shape in ENEMY_SHAPES]
@@ -0,0 +1,222 @@
+"""게임 전체 상태 스냅샷 (버전 관리되는 numpy 배열 묶음)
+
+상태를 이름 붙은 numpy 배열들로 모아 한 번에 쓰고 읽음. 배열 데이터는
+정렬된 오프셋에 그대로 저장되므로 파일을 메모리 매핑해 복사 없이 읽을 수 있음.
+
+바이너리 구조 (리틀 엔디언):
+    헤더        magic "FGSS", 버전, 배열 수
+    배열 목록   배열마다 (이름, dtype, 차원 수, 모양, 오프셋, 바이트 수)
+    데이터      _ALIGNMENT 바이트 단위로 정렬된 배열 원본 바이트
+
+배열 구성 (SNAPSHOT_VERSION 1):
+    counters        int64   [tick_count, game_over, running, player.move_cooldown,
+                             rng 버전, gauss_next 유무]
+    times           float64 [sim_time, last_spawn_time, gauss_next, player.grid_x, player.grid_y]
+    rng             uint32  random.Random 내부 상태 (625)
+    shape_sizes     int32   스냅샷에 쓰인 모양별 셀 수
+    shape_offsets   int32   모양 상대 좌표를 이어 붙인 (셀 수 합, 2)
+    enemy_x/enemy_y/enemy_speed  float64 (적 수)
+    enemy_shape     uint16  적별 모양 번호 (shape_sizes 순서)
+    enemy_color     uint8   (적 수, 3)
+"""
+
+import mmap
+import struct
+import numpy as np
+
+from src.shape import compile_shape
+
+SNAPSHOT_MAGIC = b"FGSS"
+SNAPSHOT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHH")
+_ENTRY = struct.Struct("<16s8sBQQQQ")
+_ALIGNMENT = 64
+
+
+def capture_snapshot(game):
+    """
+    게임 상태를 배열 묶음으로 저장
+
+    Args:
+        game: Game 인스턴스
+
+    Returns:
+        dict: 배열 이름 -> numpy 배열
+    """
+    rng_version, rng_words, gauss_next = game.rng.getstate()
+    player = game.player
+    enemies = game.enemies
+    count = len(enemies)
+
+    shapes = []
+    shape_ids = {}
+    enemy_shape = np.empty(count, dtype=np.uint16)
+    for index, enemy in enumerate(enemies):
+        shape = enemy.compiled_shape
+        shape_id = shape_ids.get(shape)
+        if shape_id is None:
+            shape_id = shape_ids[shape] = len(shapes)
+            shapes.append(shape)
+        enemy_shape[index] = shape_id
+
+    return {
+        "counters": np.array([
+            game.tick_count, game.game_over, game.running, player.move_cooldown,
+            rng_version, gauss_next is not None
+        ], dtype=np.int64),
+        "times": np.array([
+            game.sim_time, game.last_spawn_time, gauss_next or 0.0, player.grid_x, player.grid_y
+        ], dtype=np.float64),
+        "rng": np.array(rng_words, dtype=np.uint32),
+        "shape_sizes": np.array([shape.size for shape in shapes], dtype=np.int32),
+        "shape_offsets": np.array(
+            [offset for shape in shapes for offset in shape.offsets], dtype=np.int32
+        ).reshape(-1, 2),
+        "enemy_x": np.fromiter((e.grid_x for e in enemies), dtype=np.float64, count=count),
+        "enemy_y": np.fromiter((e.grid_y for e in enemies), dtype=np.float64, count=count),
+        "enemy_speed": np.fromiter((e.speed for e in enemies), dtype=np.float64, count=count),
+        "enemy_shape": enemy_shape,
+        "enemy_color": np.array([e.color[:3] for e in enemies], dtype=np.uint8).reshape(count, 3),
+    }
+
+
+def restore_snapshot(game, arrays):
+    """
+    배열 묶음의 상태를 게임에 복원
+
+    Args:
+        game: 같은 밸런스 설정으로 만든 Game 인스턴스
+        arrays: capture_snapshot 또는 loads 결과
+    """
+    (tick_count, game_over, running, move_cooldown,
+     rng_version, has_gauss) = arrays["counters"].tolist()
+    sim_time, last_spawn_time, gauss_next, player_x, player_y = arrays["times"].tolist()
+
+    game.rng.setstate((rng_version, tuple(arrays["rng"].tolist()),
+                       gauss_next if has_gauss else None))
+    game.tick_count = tick_count
+    game.sim_time = sim_time
+    game.last_spawn_time = last_spawn_time
+    game.game_over = bool(game_over)
+    game.running = bool(running)
+    game.player.grid_x = player_x
+    game.player.grid_y = player_y
+    game.player.move_cooldown = move_cooldown
+
+    shapes = []
+    start = 0
+    offsets = arrays["shape_offsets"].tolist()
+    for size in arrays["shape_sizes"].tolist():
+        shapes.append(compile_shape(offsets[start:start + size]))
+        start += size
+
+    colors = [tuple(color) for color in arrays["enemy_color"].tolist()]
+    # 기존 적 객체는 풀에 반환하고 재사용
+    # 새 리스트로 교체하면 공간 해시/점유 그리드(또는 Swarm)가 다음 사용 때 다시 구성됨
+    pool = game.enemy_pool
+    pool.release_all(game.enemies)
+    game.enemies = [
+        pool.acquire(x, y, color, shapes[shape_id], speed=speed)
+        for x, y, speed, shape_id, color in zip(
+            arrays["enemy_x"].tolist(), arrays["enemy_y"].tolist(),
+            arrays["enemy_speed"].tolist(), arrays["enemy_shape"].tolist(), colors
+        )
+    ]
+
+
+def _align(offset):
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def dumps(arrays):
+    """
+    배열 묶음을 바이트로 변환
+
+    Args:
+        arrays: 배열 이름 -> numpy 배열 (1차원 또는 2차원)
+
+    Returns:
+        bytes: loads로 읽을 수 있는 스냅샷
+    """
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+    offset = _align(_HEADER.size + _ENTRY.size * len(arrays))
+    entries = []
+    for name, array in arrays.items():
+        shape = tuple(array.shape) + (0,) * (2 - array.ndim)
+        entries.append(_ENTRY.pack(
+            name.encode("ascii"), array.dtype.newbyteorder("<").str.encode("ascii"),
+            array.ndim, shape[0], shape[1], offset, array.nbytes
+        ))
+        offset = _align(offset + array.nbytes)
+
+    buffer = bytearray(offset)
+    _HEADER.pack_into(buffer, 0, SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(arrays))
+    buffer[_HEADER.size:_HEADER.size + _ENTRY.size * len(arrays)] = b"".join(entries)
+    for entry, array in zip(entries, arrays.values()):
+        start = _ENTRY.unpack(entry)[5]
+        buffer[start:start + array.nbytes] = array.astype(array.dtype.newbyteorder("<")).tobytes()
+    return bytes(buffer)
+
+
+def loads(buffer):
+    """
+    바이트(또는 메모리 매핑)에서 배열 묶음을 읽음 (복사 없이 버퍼를 참조하는 뷰)
+
+    Args:
+        buffer: dumps 결과 또는 그 내용을 담은 버퍼
+
+    Returns:
+        dict: 배열 이름 -> 읽기 전용 numpy 배열
+
+    Raises:
+        ValueError: 스냅샷이 아니거나 지원하지 않는 버전인 경우
+    """
+    if len(buffer) < _HEADER.size:
+        raise ValueError("스냅샷 데이터가 너무 짧음")
+    magic, version, count = _HEADER.unpack_from(buffer, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("스냅샷 데이터가 아님")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"지원하지 않는 스냅샷 버전: {version}")
+
+    arrays = {}
+    for index in range(count):
+        name, dtype, ndim, rows, cols, offset, nbytes = _ENTRY.unpack_from(
+            buffer, _HEADER.size + index * _ENTRY.size
+        )
+        dtype = np.dtype(dtype.rstrip(b"\0").decode("ascii"))
+        shape = (rows, cols)[:ndim]
+        array = np.frombuffer(buffer, dtype=dtype, count=nbytes // dtype.itemsize, offset=offset)
+        arrays[name.rstrip(b"\0").decode("ascii")] = array.reshape(shape)
+    return arrays
+
+
+def save_snapshot(game, path):
+    """
+    게임 상태를 파일로 저장
+
+    Args:
+        game: Game 인스턴스
+        path: 저장 경로
+    """
+    with open(path, "wb") as f:
+        f.write(dumps(capture_snapshot(game)))
+
+
+def load_snapshot(path, use_mmap=True):
+    """
+    스냅샷 파일 읽기
+
+    Args:
+        path: 스냅샷 파일 경로
+        use_mmap: True면 파일을 메모리 매핑해 복사 없이 읽음
+
+    Returns:
+        dict: 배열 이름 -> numpy 배열 (restore_snapshot에 전달)
+    """
+    with open(path, "rb") as f:
+        if not use_mmap:
+            return loads(f.read())
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return loads(mapped)
@@ -0,0 +1,130 @@
+"""균일 격자 기반 공간 해시 (근처 객체만 빠르게 조회)"""
+
+import math
+from src.constants import SPATIAL_HASH_CELL_SIZE
+
+
+class SpatialHash:
+    """
+    버킷 좌표로 객체를 분류해 두는 공간 해시
+
+    각 항목은 (x, y) 좌표 하나로 등록되며, 좌표가 속한 버킷에 저장됨.
+    조회 시에는 요청 영역과 겹치는 버킷들만 확인하므로 전체 순회가 필요 없음.
+    """
+
+    def __init__(self, cell_size=SPATIAL_HASH_CELL_SIZE):
+        """
+        공간 해시 초기화
+
+        Args:
+            cell_size: 버킷 한 변의 크기 (그리드 단위)
+        """
+        self.cell_size = cell_size
+        self.buckets = {}  # (bx, by) -> {item: None} (삽입 순서 유지)
+        self.item_buckets = {}  # item -> (bx, by)
+
+    def __len__(self):
+        return len(self.item_buckets)
+
+    def __contains__(self, item):
+        return item in self.item_buckets
+
+    def _bucket_of(self, x, y):
+        """좌표가 속한 버킷 좌표 반환"""
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def clear(self):
+        """모든 항목 제거"""
+        self.buckets.clear()
+        self.item_buckets.clear()
+
+    def insert(self, item, x, y):
+        """
+        항목 등록
+
+        Args:
+            item: 등록할 객체 (hashable)
+            x: 기준 x 좌표
+            y: 기준 y 좌표
+        """
+        key = self._bucket_of(x, y)
+        self.item_buckets[item] = key
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = {}
+        bucket[item] = None
+
+    def remove(self, item):
+        """
+        항목 제거 (등록되지 않은 항목은 무시)
+
+        Args:
+            item: 제거할 객체
+        """
+        key = self.item_buckets.pop(item, None)
+        if key is None:
+            return
+        bucket = self.buckets[key]
+        del bucket[item]
+        if not bucket:
+            del self.buckets[key]
+
+    def update(self, item, x, y):
+        """
+        항목의 좌표 갱신 (버킷이 바뀔 때만 재배치)
+
+        Args:
+            item: 갱신할 객체
+            x: 새 기준 x 좌표
+            y: 새 기준 y 좌표
+        """
+        key = self._bucket_of(x, y)
+        old_key = self.item_buckets.get(item)
+        if old_key == key:
+            return
+        if old_key is not None:
+            self.remove(item)
+        self.item_buckets[item] = key
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = {}
+        bucket[item] = None
+
+    def query(self, x, y, radius):
+        """
+        (x, y) 주변 radius 범위와 겹치는 버킷의 항목들 반환
+
+        버킷 단위로 걸러내므로 결과에는 범위 밖 항목이 섞일 수 있음.
+        정확한 거리 판정은 호출하는 쪽에서 수행해야 함.
+
+        Args:
+            x: 중심 x 좌표
+            y: 중심 y 좌표
+            radius: 조회 반경 (그리드 단위)
+
+        Returns:
+            list: 후보 항목 리스트
+        """
+        return self.query_rect(x - radius, y - radius, x + radius, y + radius)
+
+    def query_rect(self, min_x, min_y, max_x, max_y):
+        """
+        사각형 영역과 겹치는 버킷의 항목들 반환
+
+        Args:
+            min_x, min_y: 영역 좌상단 좌표
+            max_x, max_y: 영역 우하단 좌표 (포함)
+
+        Returns:
+            list: 후보 항목 리스트
+        """
+        min_bx, min_by = self._bucket_of(min_x, min_y)
+        max_bx, max_by = self._bucket_of(max_x, max_y)
+        buckets = self.buckets
+        result = []
+        for bx in range(min_bx, max_bx + 1):
+            for by in range(min_by, max_by + 1):
+                bucket = buckets.get((bx, by))
+                if bucket:
+                    result.extend(bucket)
+        return result
@@ -0,0 +1,180 @@
+"""월드 경계의 빈 spawn 자리 색인 (적이 이미 있는 자리에는 spawn하지 않음)
+
+모양마다 월드 경계에 붙는 모든 spawn 위치(앵커)를 미리 만들어 두고, 각 앵커가
+덮는 셀 중 점유된 셀 수를 기록함. OccupancyGrid의 watcher로 등록하면 적이
+움직일 때 바뀐 셀 중 경계 띠 안의 셀만 확인해 앵커의 빈 자리 여부를 갱신하므로,
+spawn할 때는 셀을 검사하지 않고 빈 앵커 중 하나를 바로 고름.
+
+빈 앵커는 모양별 펜윅 트리(앵커 순서대로의 빈 자리 누적 개수)로 관리하여
+k번째 빈 앵커를 O(log 앵커 수)에 찾음. 같은 점유 상태면 갱신 순서와 관계없이
+항상 같은 앵커를 고르므로 스냅샷/리플레이에서 색인을 다시 만들어도 결과가 같음.
+"""
+
+from src.constants import GRID_COLS, GRID_ROWS
+from src.shape import COMPILED_ENEMY_SHAPES
+
+
+def edge_anchors(shape, cols=GRID_COLS, rows=GRID_ROWS):
+    """
+    모양이 월드 경계에 붙는 모든 기준점 위치 (random_edge_spawn이 고를 수 있는 위치)
+
+    Args:
+        shape: Shape
+        cols: 월드 가로 셀 개수
+        rows: 월드 세로 셀 개수
+
+    Returns:
+        list: [(grid_x, grid_y), ...] 왼쪽, 오른쪽, 위, 아래 변 순서 (모서리는 한 번만)
+    """
+    left, right = -shape.min_x, cols - 1 - shape.max_x
+    top, bottom = -shape.min_y, rows - 1 - shape.max_y
+    anchors = []
+    if left <= right and top <= bottom:
+        anchors += [(left, y) for y in range(top, bottom + 1)]
+        anchors += [(right, y) for y in range(top, bottom + 1)]
+        anchors += [(x, top) for x in range(left, right + 1)]
+        anchors += [(x, bottom) for x in range(left, right + 1)]
+    return list(dict.fromkeys(anchors))
+
+
+class EdgeSpawnIndex:
+    """
+    모양별 빈 경계 앵커 색인
+
+    앵커가 덮는 셀에 적이 하나라도 있으면 막힌 앵커. cells_changed로 받은 셀 변경 중
+    경계 띠(어떤 앵커가 덮는 셀) 밖의 셀은 딕셔너리 조회 한 번으로 건너뜀.
+    """
+
+    def __init__(self, cols=GRID_COLS, rows=GRID_ROWS, shapes=COMPILED_ENEMY_SHAPES):
+        """
+        앵커 색인 초기화 (모든 앵커가 빈 상태)
+
+        Args:
+            cols: 월드 가로 셀 개수
+            rows: 월드 세로 셀 개수
+            shapes: spawn할 모양 목록 (모양 번호 순서)
+        """
+        self.shapes = list(shapes)
+        self.anchors = [edge_anchors(shape, cols, rows) for shape in self.shapes]
+
+        # 경계 띠의 셀 -> 그 셀을 덮는 (모양 번호, 앵커 번호) 목록
+        cover = {}
+        for shape_index, (shape, anchors) in enumerate(zip(self.shapes, self.anchors)):
+            for anchor_index, (x, y) in enumerate(anchors):
+                for dx, dy in shape.offsets:
+                    cover.setdefault((x + dx, y + dy), []).append((shape_index, anchor_index))
+        self._cover = {cell: tuple(anchors) for cell, anchors in cover.items()}
+        self.clear()
+
+    def clear(self):
+        """모든 셀이 빈 상태로 초기화"""
+        self._counts = {}  # 경계 띠의 점유된 셀 -> 점유 수
+        self._blocked = [[0] * len(anchors) for anchors in self.anchors]  # 앵커별 점유된 셀 수
+        self._free = [len(anchors) for anchors in self.anchors]
+        # 모든 앵커가 비어 있으면 펜윅 트리의 i번 칸은 i가 담당하는 구간 길이(i & -i)
+        self._trees = [[i & -i for i in range(len(anchors) + 1)] for anchors in self.anchors]
+
+    def free_count(self, shape_index):
+        """모양의 빈 앵커 수"""
+        return self._free[shape_index]
+
+    def is_free(self, shape_index, anchor_index):
+        """앵커가 비어 있는지 확인"""
+        return not self._blocked[shape_index][anchor_index]
+
+    def cells_changed(self, old_cells, new_cells):
+        """
+        객체가 old_cells에서 new_cells로 옮겨 간 것을 반영 (OccupancyGrid watcher)
+
+        Args:
+            old_cells: 이전 셀 목록 (새로 추가된 객체면 비어 있음)
+            new_cells: 새 셀 목록 (제거된 객체면 비어 있음)
+        """
+        cover = self._cover
+        counts = self._counts
+        # 새 셀을 먼저 더해 이전/새 셀에 모두 있는 셀이 잠깐 비지 않게 함
+        for cell in new_cells:
+            anchors = cover.get(cell)
+            if anchors is not None:
+                count = counts.get(cell, 0)
+                counts[cell] = count + 1
+                if not count:
+                    self._block(anchors)
+        for cell in old_cells:
+            anchors = cover.get(cell)
+            if anchors is not None:
+                count = counts[cell] - 1
+                if count:
+                    counts[cell] = count
+                else:
+                    del counts[cell]
+                    self._release(anchors)
+
+    def _block(self, anchors):
+        for shape_index, anchor_index in anchors:
+            blocked = self._blocked[shape_index]
+            if not blocked[anchor_index]:
+                self._free[shape_index] -= 1
+                self._add(self._trees[shape_index], anchor_index, -1)
+            blocked[anchor_index] += 1
+
+    def _release(self, anchors):
+        for shape_index, anchor_index in anchors:
+            blocked = self._blocked[shape_index]
+            blocked[anchor_index] -= 1
+            if not blocked[anchor_index]:
+                self._free[shape_index] += 1
+                self._add(self._trees[shape_index], anchor_index, 1)
+
+    @staticmethod
+    def _add(tree, index, delta):
+        index += 1
+        size = len(tree)
+        while index < size:
+            tree[index] += delta
+            index += index & -index
+
+    def nth_free(self, shape_index, rank):
+        """
+        앵커 순서로 rank번째(0부터) 빈 앵커 찾기
+
+        Args:
+            shape_index: 모양 번호
+            rank: 0 이상 free_count(shape_index) 미만
+
+        Returns:
+            tuple: (grid_x, grid_y) 앵커 위치
+        """
+        tree = self._trees[shape_index]
+        size = len(tree) - 1
+        position = 0
+        step = 1 << size.bit_length()
+        while step:
+            next_position = position + step
+            if next_position <= size and tree[next_position] <= rank:
+                position = next_position
+                rank -= tree[next_position]
+            step >>= 1
+        return self.anchors[shape_index][position]
+
+    def pick(self, rng):
+        """
+        무작위 모양과 그 모양의 빈 앵커 고르기
+
+        모양을 먼저 고르고(random_edge_spawn과 같은 방식), 그 모양의 빈 앵커가 없으면
+        빈 앵커가 남은 모양 중에서 다시 고름.
+
+        Args:
+            rng: random.Random
+
+        Returns:
+            tuple: (모양 번호, grid_x, grid_y), 빈 앵커가 하나도 없으면 None
+        """
+        shape_index = rng.randint(0, len(self.shapes) - 1)
+        if not self._free[shape_index]:
+            candidates = [index for index, free in enumerate(self._free) if free]
+            if not candidates:
+                return None
+            shape_index = rng.choice(candidates)
+        grid_x, grid_y = self.nth_free(shape_index, rng.randrange(self._free[shape_index]))
+        return shape_index, grid_x, grid_y
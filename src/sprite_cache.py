@@ -0,0 +1,96 @@
+"""모양/색상별 미리 그려둔 스프라이트 캐시"""
+
+import pygame
+from src.constants import GRID_WIDTH, GRID_HEIGHT
+
+
+class SpriteCache:
+    """
+    (Shape, 색상) 조합마다 셀들을 한 번만 그려 둔 surface를 보관하고,
+    여러 객체를 Surface.blits 한 번으로 그림
+
+    스프라이트는 그릴 대상 surface와 같은 픽셀 포맷으로 만들어지며,
+    셀이 없는 부분은 colorkey로 투명 처리됨. 셀마다 pygame.draw.rect를
+    호출하던 GameObject.draw와 같은 픽셀 결과를 냄.
+    """
+
+    def __init__(self):
+        """스프라이트 캐시 초기화"""
+        self._sprites = {}  # (Shape, color) -> Surface
+        self._format_source = None
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def clear(self):
+        """캐시된 스프라이트 모두 제거"""
+        self._sprites.clear()
+        self._format_source = None
+
+    def get(self, shape, color, target):
+        """
+        모양/색상 스프라이트 반환 (처음 요청 시 생성)
+
+        Args:
+            shape: Shape (GameObject.compiled_shape)
+            color: RGB 색상
+            target: 스프라이트를 그릴 surface (픽셀 포맷 기준)
+
+        Returns:
+            pygame.Surface: 모양의 경계 상자 크기 스프라이트
+        """
+        if target is not self._format_source:
+            # 그릴 대상이 바뀌면 픽셀 포맷이 다를 수 있으므로 다시 생성
+            self._sprites.clear()
+            self._format_source = target
+
+        key = (shape, color)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._render(shape, color, target)
+            self._sprites[key] = sprite
+        return sprite
+
+    def _render(self, shape, color, target):
+        """스프라이트 생성 (셀이 없는 부분은 colorkey로 투명)"""
+        colorkey = (0, 0, 0) if tuple(color[:3]) != (0, 0, 0) else (255, 255, 255)
+        sprite = pygame.Surface((shape.width * GRID_WIDTH, shape.height * GRID_HEIGHT), 0, target)
+        sprite.fill(colorkey)
+        for dx, dy in shape.offsets:
+            pygame.draw.rect(sprite, color, (
+                (dx - shape.min_x) * GRID_WIDTH, (dy - shape.min_y) * GRID_HEIGHT,
+                GRID_WIDTH, GRID_HEIGHT
+            ))
+        sprite.set_colorkey(colorkey)
+        return sprite
+
+    def draw(self, screen, objects, offset=(0, 0)):
+        """
+        객체들을 스프라이트로 그림 (연속된 객체는 blits 한 번으로 묶음)
+
+        기준점이 음수 영역에 걸친 객체는 int() 절삭 때문에 셀 배치가 모양과
+        달라질 수 있으므로 GameObject.draw로 직접 그림 (그리는 순서는 유지).
+
+        Args:
+            screen: 그릴 surface
+            objects: 그릴 게임 객체들 (그리는 순서대로)
+            offset: 화면 픽셀 이동량 (카메라 스크롤, Camera.offset)
+        """
+        offset_x, offset_y = offset
+        batch = []
+        for obj in objects:
+            shape = obj.compiled_shape
+            if not shape.size:
+                continue
+            left = obj.grid_x + shape.min_x
+            top = obj.grid_y + shape.min_y
+            if left >= 0 and top >= 0:
+                sprite = self.get(shape, obj.color, screen)
+                batch.append((sprite, (int(left) * GRID_WIDTH + offset_x, int(top) * GRID_HEIGHT + offset_y)))
+            else:
+                if batch:
+                    screen.blits(batch, doreturn=False)
+                    batch = []
+                obj.draw(screen, offset)
+        if batch:
+            screen.blits(batch, doreturn=False)
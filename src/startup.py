@@ -0,0 +1,88 @@
+"""콜드 스타트 시간 측정 (프로세스 실행부터 첫 프레임까지)
+
+무거운 모듈보다 먼저 import되도록 표준 라이브러리만 사용함.
+"""
+
+import os
+import time
+
+
+def process_uptime():
+    """
+    프로세스가 실행된 뒤 흐른 시간
+
+    Linux의 /proc 정보로 계산함 (해상도는 커널 클럭 틱, 보통 10ms).
+
+    Returns:
+        float: 초 단위 시간 (알 수 없는 플랫폼이면 None)
+    """
+    try:
+        with open("/proc/self/stat") as f:
+            stat = f.read()
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        # 프로세스 이름에 공백이 있을 수 있으므로 마지막 ')' 뒤부터 나눔 (3번째 필드부터)
+        start_ticks = int(stat[stat.rindex(")") + 2:].split()[19])  # 22번째 필드 starttime
+        return max(0.0, uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class StartupTimer:
+    """
+    시작 단계별 시간 기록
+
+    생성 시점이 기준점이며, 그 전에 흐른 시간(인터프리터 시작 등)은
+    process_uptime()으로 구할 수 있으면 "interpreter" 단계로 보고함.
+    """
+
+    def __init__(self):
+        """기준점 기록"""
+        self.origin = time.perf_counter()
+        self.before_origin = process_uptime()
+        self.marks = []
+
+    def mark(self, name):
+        """
+        단계 종료 시점 기록
+
+        Args:
+            name: 방금 끝난 단계 이름
+        """
+        self.marks.append((name, time.perf_counter()))
+
+    def phases(self):
+        """
+        단계별 소요 시간
+
+        Returns:
+            list: [(단계 이름, 밀리초), ...]
+        """
+        phases = []
+        if self.before_origin is not None:
+            phases.append(("interpreter", self.before_origin * 1000))
+        last = self.origin
+        for name, when in self.marks:
+            phases.append((name, (when - last) * 1000))
+            last = when
+        return phases
+
+    def total_ms(self):
+        """
+        프로세스 실행(알 수 없으면 기준점)부터 마지막 기록까지의 시간
+
+        Returns:
+            float: 밀리초
+        """
+        return sum(ms for _, ms in self.phases())
+
+    def report_lines(self):
+        """
+        단계별 시간 보고 텍스트
+
+        Returns:
+            list: 출력할 줄 목록
+        """
+        lines = [f"  {name:<12} {ms:8.1f} ms" for name, ms in self.phases()]
+        lines.append(f"  {'total':<12} {self.total_ms():8.1f} ms")
+        return ["cold start:"] + lines
@@ -0,0 +1,473 @@
+"""적 무리 벡터화 엔진 (구조체 배열 방식)"""
+
+import numpy as np
+from src.constants import (
+    ENEMY_SHAPES, ENEMY_SPEED_GRID, GRID_COLS, GRID_ROWS,
+    COLLISION_CHECK_DISTANCE
+)
+from src.shape import compile_shape
+
+
+class Swarm:
+    """
+    모든 적의 위치, 속도, 모양 id를 NumPy 배열로 관리하는 이동 엔진
+
+    Enemy.move_towards_player를 먼 적부터 차례로 호출하는 것과 같은 결과를
+    내도록 설계됨:
+    1. 방향 벡터, 제안 위치, 경계 판정, 처리 순서를 한 번에 계산
+    2. 제안 셀이 다른 적의 현재/제안 셀과 전혀 겹치지 않는 적은 순서와
+       무관하게 이동이 확정되므로 일괄 승인
+    3. 나머지(경합 중인 적)만 먼 적부터 순서대로 기존 lock-in 규칙으로 판정
+
+    worlds > 1이면 크기가 같은 독립된 월드 여러 개의 적을 한 배열에 담아
+    한 번에 이동시킴 (적마다 월드 번호를 두고, 서로 다른 월드의 적은 상호작용 없음).
+    """
+
+    def __init__(self, shapes=ENEMY_SHAPES, capacity=256, cols=GRID_COLS, rows=GRID_ROWS, worlds=1):
+        """
+        무리 엔진 초기화
+
+        Args:
+            shapes: 미리 등록할 모양 리스트 (모양 id는 등록 순서)
+            capacity: 초기 배열 크기 (부족하면 자동으로 늘어남)
+            cols: 월드 가로 셀 개수
+            rows: 월드 세로 셀 개수
+            worlds: 독립된 월드 수
+        """
+        self.cols = cols
+        self.rows = rows
+        self.worlds = worlds
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.shape_id = np.zeros(capacity, dtype=np.int32)
+        self.world = np.zeros(capacity, dtype=np.int64)
+
+        # 모양 테이블 (모양 id -> 오프셋/마스크/중심점)
+        self.shapes = []
+        self._shape_ids = {}
+        self._offset_x = np.zeros((0, 1), dtype=np.int64)
+        self._offset_y = np.zeros((0, 1), dtype=np.int64)
+        self._offset_mask = np.zeros((0, 1), dtype=bool)
+        self._centroid_x = np.zeros(0, dtype=np.float64)
+        self._centroid_y = np.zeros(0, dtype=np.float64)
+        for shape in shapes:
+            self.register_shape(shape)
+
+    def __len__(self):
+        return self.count
+
+    def register_shape(self, shape):
+        """
+        모양을 등록하고 모양 id 반환 (이미 등록된 모양은 기존 id)
+
+        Args:
+            shape: 상대 좌표 리스트 [(0,0), (1,0), ...] 또는 Shape
+
+        Returns:
+            int: 모양 id
+        """
+        compiled = compile_shape(shape)
+        shape_id = self._shape_ids.get(compiled)
+        if shape_id is not None:
+            return shape_id
+
+        shape_id = len(self.shapes)
+        self._shape_ids[compiled] = shape_id
+        self.shapes.append(compiled)
+
+        width = max(1, max(len(s) for s in self.shapes))
+        offset_x = np.zeros((len(self.shapes), width), dtype=np.int64)
+        offset_y = np.zeros((len(self.shapes), width), dtype=np.int64)
+        offset_mask = np.zeros((len(self.shapes), width), dtype=bool)
+        centroid_x = np.zeros(len(self.shapes), dtype=np.float64)
+        centroid_y = np.zeros(len(self.shapes), dtype=np.float64)
+        for i, compiled_shape in enumerate(self.shapes):
+            for k, (dx, dy) in enumerate(compiled_shape.offsets):
+                offset_x[i, k] = dx
+                offset_y[i, k] = dy
+                offset_mask[i, k] = True
+            centroid_x[i] = compiled_shape.center_x
+            centroid_y[i] = compiled_shape.center_y
+        self._offset_x = offset_x
+        self._offset_y = offset_y
+        self._offset_mask = offset_mask
+        self._centroid_x = centroid_x
+        self._centroid_y = centroid_y
+        return shape_id
+
+    def _grow(self, needed):
+        capacity = len(self.x)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+        for name in ("x", "y", "speed", "shape_id", "world"):
+            old = getattr(self, name)
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def clear(self):
+        """모든 적 제거 (모양 테이블은 유지)"""
+        self.count = 0
+
+    def add(self, grid_x, grid_y, shape_id, speed=ENEMY_SPEED_GRID, world=0):
+        """
+        적 추가
+
+        Args:
+            grid_x: 기준점 그리드 x 좌표
+            grid_y: 기준점 그리드 y 좌표
+            shape_id: register_shape()로 얻은 모양 id
+            speed: 이동 속도 (그리드/프레임)
+            world: 적이 속한 월드 번호
+
+        Returns:
+            int: 추가된 적의 인덱스
+        """
+        self._grow(self.count + 1)
+        index = self.count
+        self.x[index] = grid_x
+        self.y[index] = grid_y
+        self.speed[index] = speed
+        self.shape_id[index] = shape_id
+        self.world[index] = world
+        self.count += 1
+        return index
+
+    def remove_worlds(self, worlds):
+        """
+        지정한 월드들의 적을 모두 제거 (나머지 적의 상대 순서는 유지)
+
+        Args:
+            worlds: 월드별 bool 배열 (True인 월드의 적 제거)
+        """
+        n = self.count
+        keep = ~np.asarray(worlds, dtype=bool)[self.world[:n]]
+        kept = int(keep.sum())
+        if kept == n:
+            return
+        for name in ("x", "y", "speed", "shape_id", "world"):
+            array = getattr(self, name)
+            array[:kept] = array[:n][keep]
+        self.count = kept
+
+    def counts_by_world(self):
+        """
+        월드별 적 수
+
+        Returns:
+            np.ndarray: (worlds,) 적 수 배열
+        """
+        return np.bincount(self.world[:self.count], minlength=self.worlds)
+
+    def load(self, enemies):
+        """
+        Enemy 객체 리스트로부터 배열 재구성 (인덱스 = 리스트 순서)
+
+        Args:
+            enemies: Enemy 객체 리스트
+        """
+        self.clear()
+        self._grow(len(enemies))
+        for enemy in enemies:
+            self.add(enemy.grid_x, enemy.grid_y, self.register_shape(enemy.compiled_shape), enemy.speed)
+
+    def write_back(self, enemies):
+        """
+        배열의 위치를 Enemy 객체들에 반영
+
+        Args:
+            enemies: load()에 사용한 것과 같은 순서의 Enemy 객체 리스트
+        """
+        for enemy, grid_x, grid_y in zip(enemies, self.x[:self.count].tolist(),
+                                         self.y[:self.count].tolist()):
+            enemy.grid_x = grid_x
+            enemy.grid_y = grid_y
+
+    def _cells(self, x, y, shape_id):
+        """(n, K) 셀 좌표 배열과 유효 슬롯 마스크 반환 (int() 절삭과 동일)"""
+        cells_x = np.trunc(x[:, None] + self._offset_x[shape_id]).astype(np.int64)
+        cells_y = np.trunc(y[:, None] + self._offset_y[shape_id]).astype(np.int64)
+        return cells_x, cells_y, self._offset_mask[shape_id]
+
+    def cells(self):
+        """
+        모든 적이 차지한 셀 좌표
+
+        Returns:
+            tuple: (cells_x, cells_y, mask) (적 수, 모양 최대 셀 수) 배열,
+                mask가 False인 슬롯은 사용하지 않음
+        """
+        n = self.count
+        return self._cells(self.x[:n], self.y[:n], self.shape_id[:n])
+
+    def _counts_at(self, values, queries):
+        """values에 queries의 각 값이 몇 번 나오는지 (queries와 같은 모양의 배열)"""
+        if self.worlds == 1:
+            return np.bincount(values, minlength=self.cols * self.rows)[queries]
+        # 월드가 많으면 전체 셀 크기의 bincount 대신 정렬 기반으로 셈
+        ids, counts = np.unique(values, return_counts=True)
+        if not ids.size:
+            return np.zeros(queries.shape, dtype=np.int64)
+        position = np.minimum(np.searchsorted(ids, queries), ids.size - 1)
+        return np.where(ids[position] == queries, counts[position], 0)
+
+    def grid_positions(self, index):
+        """
+        적 하나가 차지한 그리드 좌표 리스트 반환
+
+        Args:
+            index: 적 인덱스
+
+        Returns:
+            list: [(x1, y1), ...] 절대 좌표 리스트
+        """
+        grid_x = float(self.x[index])
+        grid_y = float(self.y[index])
+        return [(int(grid_x + dx), int(grid_y + dy))
+                for dx, dy in self.shapes[self.shape_id[index]].offsets]
+
+    def step(self, player_center):
+        """
+        모든 적을 플레이어 중심을 향해 한 프레임 이동
+
+        Args:
+            player_center: (center_x, center_y) 플레이어 중심점,
+                또는 월드별 중심점 (worlds, 2) 배열
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        cols, rows = self.cols, self.rows
+        x = self.x[:n]
+        y = self.y[:n]
+        shape_id = self.shape_id[:n]
+        world = self.world[:n]
+        if isinstance(player_center, np.ndarray):
+            pcx = player_center[world, 0]
+            pcy = player_center[world, 1]
+        else:
+            pcx, pcy = player_center
+
+        # 처리 순서: 먼 적부터 (sorted(..., reverse=True)와 같은 안정 정렬,
+        # 전체를 한 번에 정렬해도 같은 월드 적끼리의 상대 순서는 월드별 정렬과 같음)
+        sort_key = (x - pcx) ** 2 + (y - pcy) ** 2
+        order = np.argsort(-sort_key, kind="stable")
+
+        # 방향 벡터와 제안 위치 (일괄 계산)
+        dx = pcx - (x + self._centroid_x[shape_id])
+        dy = pcy - (y + self._centroid_y[shape_id])
+        distance = np.sqrt(dx ** 2 + dy ** 2)
+        moving = distance > 0
+        safe_distance = np.where(moving, distance, 1.0)
+        new_x = np.where(moving, x + (dx / safe_distance) * self.speed[:n], x)
+        new_y = np.where(moving, y + (dy / safe_distance) * self.speed[:n], y)
+
+        old_cx, old_cy, mask = self._cells(x, y, shape_id)
+        new_cx, new_cy, _ = self._cells(new_x, new_y, shape_id)
+
+        # 경계 판정
+        new_inside = (new_cx >= 0) & (new_cx < cols) & (new_cy >= 0) & (new_cy < rows)
+        candidate = moving & np.all(new_inside | ~mask, axis=1)
+        old_inside = (old_cx >= 0) & (old_cx < cols) & (old_cy >= 0) & (old_cy < rows)
+
+        # 이전 셀이 월드 밖에 있는 적이 있는 월드 (그 월드는 일괄 승인 없이 전부 순서대로 판정)
+        outside = ~np.all(old_inside | ~mask, axis=1)
+        if self.worlds == 1:
+            unsafe = np.full(n, outside.any())
+        else:
+            unsafe_world = np.zeros(self.worlds, dtype=bool)
+            unsafe_world[world[outside]] = True
+            unsafe = unsafe_world[world]
+
+        # 다른 적의 현재 셀/제안 셀과 겹치지 않는 적은 순서와 무관하게 이동 확정
+        cand_mask = mask & candidate[:, None]
+        if self.worlds == 1:
+            old_flat = old_cx * rows + old_cy
+            new_flat = np.where(cand_mask, new_cx * rows + new_cy, 0)
+        else:
+            world_base = world[:, None] * cols
+            old_flat = (world_base + old_cx) * rows + old_cy
+            new_flat = np.where(cand_mask, (world_base + new_cx) * rows + new_cy, 0)
+
+        same_old = (old_flat[:, None, :] == new_flat[:, :, None]) & mask[:, None, :]
+        same_new = (new_flat[:, None, :] == new_flat[:, :, None]) & mask[:, None, :]
+        others_old = self._counts_at(old_flat[mask & old_inside], new_flat) - same_old.sum(axis=2)
+        others_new = self._counts_at(new_flat[cand_mask], new_flat) - same_new.sum(axis=2)
+        clear_cells = ~cand_mask | ((others_old == 0) & (others_new == 0))
+        free = candidate & np.all(clear_cells, axis=1) & ~unsafe
+
+        accepted = free.copy()
+        contested = np.flatnonzero(candidate & ~free)
+        if contested.size:
+            self._resolve_contested(
+                contested, order, accepted, x, y, new_x, new_y, shape_id, world,
+                old_cx, old_cy, new_cx, new_cy, mask, cand_mask,
+                old_flat, new_flat, unsafe
+            )
+
+        self.x[:n] = np.where(accepted, new_x, x)
+        self.y[:n] = np.where(accepted, new_y, y)
+
+    def _resolve_contested(self, contested, order, accepted, x, y, new_x, new_y, shape_id, world,
+                           old_cx, old_cy, new_cx, new_cy, mask, cand_mask,
+                           old_flat, new_flat, unsafe):
+        """경합 중인 적들을 먼 적부터 순서대로 기존 충돌 규칙으로 판정"""
+        n = len(x)
+        rank = np.empty(n, dtype=np.int64)
+        rank[order] = np.arange(n)
+        contested = contested[np.argsort(rank[contested], kind="stable")]
+
+        # 경합 셀을 이전 위치 또는 제안 위치로 차지하는 적 목록
+        # (이전 셀이 월드 밖에 있는 월드는 셀 번호가 겹칠 수 있으므로 모든 적)
+        contested_flat = np.unique(new_flat[contested][mask[contested]])
+        old_sel = mask & (np.isin(old_flat, contested_flat) | unsafe[:, None])
+        new_sel = cand_mask & np.isin(new_flat, contested_flat)
+        old_owner = np.nonzero(old_sel)[0]
+        new_owner = np.nonzero(new_sel)[0]
+
+        # 관련된 적만 파이썬 리스트로 변환 (전역 인덱스 -> 지역 인덱스)
+        involved = np.unique(np.concatenate([contested, old_owner, new_owner]))
+        local = np.empty(n, dtype=np.int64)
+        local[involved] = np.arange(len(involved))
+
+        # (월드, 셀) -> 그 셀을 차지하는 적들 (다른 월드의 적은 서로 후보가 되지 않음)
+        nearby = {}
+        old_world = np.broadcast_to(world[:, None], old_sel.shape)
+        for w, cx, cy, owner in zip(old_world[old_sel].tolist(), old_cx[old_sel].tolist(),
+                                    old_cy[old_sel].tolist(), local[old_owner].tolist()):
+            nearby.setdefault((w, cx, cy), set()).add(owner)
+        for w, cx, cy, owner in zip(old_world[new_sel].tolist(), new_cx[new_sel].tolist(),
+                                    new_cy[new_sel].tolist(), local[new_owner].tolist()):
+            nearby.setdefault((w, cx, cy), set()).add(owner)
+
+        rank_list = rank[involved].tolist()
+        accepted_list = accepted[involved].tolist()
+        x_list, y_list = x[involved].tolist(), y[involved].tolist()
+        new_x_list, new_y_list = new_x[involved].tolist(), new_y[involved].tolist()
+        centroid_x = self._centroid_x[shape_id[involved]].tolist()
+        centroid_y = self._centroid_y[shape_id[involved]].tolist()
+        world_list = world[involved].tolist()
+        cell_count = mask[involved].sum(axis=1).tolist()
+        old_cx_list, old_cy_list = old_cx[involved].tolist(), old_cy[involved].tolist()
+        new_cx_list, new_cy_list = new_cx[involved].tolist(), new_cy[involved].tolist()
+        old_cells = {}
+        new_cells = {}
+
+        def cells_of(index, moved):
+            cache = new_cells if moved else old_cells
+            cells = cache.get(index)
+            if cells is None:
+                k = cell_count[index]
+                if moved:
+                    cells = set(zip(new_cx_list[index][:k], new_cy_list[index][:k]))
+                else:
+                    cells = set(zip(old_cx_list[index][:k], old_cy_list[index][:k]))
+                cache[index] = cells
+            return cells
+
+        for j in local[contested].tolist():
+            rank_j = rank_list[j]
+            old_x, old_y = x_list[j], y_list[j]
+            moved_x, moved_y = new_x_list[j], new_y_list[j]
+            my_new_cells = cells_of(j, True)
+            my_old_cells = cells_of(j, False)
+
+            others = set()
+            world_j = world_list[j]
+            for cell_x, cell_y in my_new_cells:
+                owners = nearby.get((world_j, cell_x, cell_y))
+                if owners:
+                    others |= owners
+            others.discard(j)
+
+            move_valid = True
+            for i in others:
+                # 먼저 처리되어 이동이 확정된 적은 새 위치, 나머지는 이전 위치
+                moved = rank_list[i] < rank_j and accepted_list[i]
+                if moved:
+                    other_center_x = new_x_list[i] + centroid_x[i]
+                    other_center_y = new_y_list[i] + centroid_y[i]
+                else:
+                    other_center_x = x_list[i] + centroid_x[i]
+                    other_center_y = y_list[i] + centroid_y[i]
+
+                # 맨해튼 거리 조기 컷오프 (Enemy.move_towards_player와 동일)
+                if abs(moved_x - other_center_x) + abs(moved_y - other_center_y) > COLLISION_CHECK_DISTANCE:
+                    continue
+
+                other_cells = cells_of(i, moved)
+                if my_new_cells.isdisjoint(other_cells):
+                    continue
+
+                if not my_old_cells.isdisjoint(other_cells):
+                    # 이미 겹쳐있었음 - 거리가 멀어지면 이동 허용 (lock-in 탈출)
+                    old_distance_sq = (old_x - other_center_x)**2 + (old_y - other_center_y)**2
+                    new_distance_sq = (moved_x - other_center_x)**2 + (moved_y - other_center_y)**2
+                    if new_distance_sq > old_distance_sq:
+                        continue
+
+                move_valid = False
+                break
+
+            accepted_list[j] = move_valid
+
+        accepted[involved] = accepted_list
+
+    def overlaps(self, cells):
+        """
+        주어진 셀 중 하나라도 적이 차지하고 있는지 확인
+
+        Args:
+            cells: [(x, y), ...] 셀 목록 (예: 플레이어의 그리드 좌표)
+
+        Returns:
+            bool: 겹치는 적이 있으면 True
+        """
+        n = self.count
+        if n == 0 or not cells:
+            return False
+        cells_x, cells_y, mask = self._cells(self.x[:n], self.y[:n], self.shape_id[:n])
+        query = np.asarray(cells, dtype=np.int64)
+        hit = ((cells_x[..., None] == query[:, 0]) & (cells_y[..., None] == query[:, 1])).any(axis=2)
+        return bool((hit & mask).any())
+
+    def overlaps_by_world(self, cells_x, cells_y):
+        """
+        월드마다 주어진 셀 중 하나라도 그 월드의 적이 차지하고 있는지 확인
+
+        Args:
+            cells_x: (worlds, 셀 수) 월드별 조회 셀 x 좌표 (예: 월드별 플레이어 셀)
+            cells_y: (worlds, 셀 수) 월드별 조회 셀 y 좌표
+
+        Returns:
+            np.ndarray: (worlds,) bool 배열
+        """
+        hit_world = np.zeros(self.worlds, dtype=bool)
+        n = self.count
+        if n == 0:
+            return hit_world
+        enemy_x, enemy_y, mask = self.cells()
+        world = self.world[:n]
+        query_x = cells_x[world][:, None, :]
+        query_y = cells_y[world][:, None, :]
+        hit = ((enemy_x[..., None] == query_x) & (enemy_y[..., None] == query_y)).any(axis=2)
+        hit_world[world[(hit & mask).any(axis=1)]] = True
+        return hit_world
+
+    def cell_counts(self):
+        """
+        월드 셀별 적 점유 수 배열 반환 (cols x rows, 월드 밖 셀은 제외)
+
+        Returns:
+            np.ndarray: 점유 수 배열
+        """
+        n = self.count
+        cells_x, cells_y, mask = self._cells(self.x[:n], self.y[:n], self.shape_id[:n])
+        inside = mask & (cells_x >= 0) & (cells_x < self.cols) & (cells_y >= 0) & (cells_y < self.rows)
+        flat = cells_x[inside] * self.rows + cells_y[inside]
+        counts = np.bincount(flat, minlength=self.cols * self.rows)
+        return counts.reshape(self.cols, self.rows)
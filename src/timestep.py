@@ -0,0 +1,71 @@
+"""고정 시간 간격 시뮬레이션용 누적기"""
+
+from src.constants import SIM_TICK_MS, MAX_TICKS_PER_FRAME
+
+_EPSILON_MS = 1e-9
+
+
+class FixedTimestep:
+    """
+    실제 흐른 시간을 누적해 두고 고정 길이 틱 단위로 꺼내 주는 누적기
+
+    렌더링이 느려져도 흐른 시간만큼 틱을 여러 번 실행하므로 게임 속도가
+    일정하게 유지됨. 한 프레임에 실행하는 틱 수는 max_ticks로 제한하고,
+    그보다 더 밀린 시간은 버림 (한 번 밀리면 계속 밀리는 현상 방지).
+
+    time_scale로 빨리 감기 배율을 지정할 수 있고, unthrottled면 렌더 간격
+    동안 가능한 만큼 틱을 실행함 (FPS 제한 없음).
+    """
+
+    def __init__(self, tick_ms=SIM_TICK_MS, max_ticks=MAX_TICKS_PER_FRAME, time_scale=1.0,
+                 unthrottled=False):
+        """
+        누적기 초기화
+
+        Args:
+            tick_ms: 한 틱의 시뮬레이션 시간 (밀리초)
+            max_ticks: 한 프레임에 실행할 최대 틱 수 (time_scale 배 적용)
+            time_scale: 빨리 감기 배율 (1.0이면 실시간)
+            unthrottled: True면 시간 누적 대신 렌더 간격 동안 최대한 실행
+        """
+        self.tick_ms = tick_ms
+        self.max_ticks = max_ticks
+        self.time_scale = time_scale
+        self.unthrottled = unthrottled
+        self.accumulator = 0.0
+        self.dropped_ms = 0.0  # 따라잡지 못해 버린 시뮬레이션 시간 (누적)
+
+    def reset(self):
+        """누적된 시간 초기화"""
+        self.accumulator = 0.0
+        self.dropped_ms = 0.0
+
+    def advance(self, elapsed_ms):
+        """
+        흐른 실제 시간을 누적하고 이번 프레임에 실행할 틱 수 반환
+
+        Args:
+            elapsed_ms: 지난 호출 이후 흐른 실제 시간 (밀리초)
+
+        Returns:
+            int: 실행할 틱 수 (0이면 아직 다음 틱 시각이 아님)
+        """
+        self.accumulator += elapsed_ms * self.time_scale
+        # 부동소수점 오차로 정확히 한 틱 분량이 조금 모자라게 계산되는 경우 보정
+        ticks = int((self.accumulator + _EPSILON_MS) // self.tick_ms)
+
+        limit = max(1, int(self.max_ticks * self.time_scale))
+        if ticks > limit:
+            # 너무 밀린 시간은 버리고 다음 프레임부터 다시 실시간으로 진행
+            self.dropped_ms += (ticks - limit) * self.tick_ms
+            ticks = limit
+
+        self.accumulator = max(0.0, self.accumulator - ticks * self.tick_ms)
+        if self.accumulator >= self.tick_ms:
+            self.accumulator %= self.tick_ms
+        return ticks
+
+    @property
+    def alpha(self):
+        """다음 틱까지 진행된 비율 (0 이상 1 미만, 보간용)"""
+        return self.accumulator / self.tick_ms
@@ -0,0 +1,251 @@
+"""여러 게임 월드를 한 프로세스에서 동시에 진행하는 벡터화 환경 (에이전트 학습용)
+
+N개의 독립된 월드를 한 틱씩 같이 진행함. 행동, 관측, 보상, 종료 여부는 모두
+월드 축이 첫 번째인 NumPy 배열로 주고받음.
+
+월드마다 Game을 두지 않고, 모든 월드의 적을 Swarm 하나(worlds=N)에 담아 한 번에
+이동시키며, 플레이어 이동과 충돌 판정도 배열 연산으로 처리함. 월드별 파이썬
+코드는 적 spawn(spawn 간격마다 한 번)과 월드 재시작 때만 실행됨.
+
+각 월드는 같은 시드, 같은 입력의 Game(headless=True)과 같은 결과를 냄
+(Game.update의 틱 순서: 플레이어 이동 -> spawn -> 적 이동 -> 충돌 판정).
+
+사용 예:
+    env = VecEnv(64, seed=0)
+    observations = env.reset()
+    observations, rewards, dones, infos = env.step(actions)  # actions: (64,) 정수
+"""
+
+import random
+import numpy as np
+import pygame
+
+from src.constants import (
+    GRID_COLS, GRID_ROWS, SIM_TICK_MS, ENEMY_SPEED_GRID, ENEMY_SPAWN_INTERVAL,
+    MAX_ENEMIES, PLAYER_SPEED_GRID, PLAYER_MOVE_DELAY, OBS_EMPTY, OBS_PLAYER
+)
+from src.input_state import KeyState, NO_KEYS
+from src.shape import COMPILED_PLAYER_SHAPE
+from src.swarm import Swarm
+from src.observation import ObservationBuffer
+from src.game import random_edge_spawn
+
+# 행동 번호: 0 정지, 1 왼쪽, 2 오른쪽, 3 위, 4 아래
+ACTION_DELTAS = np.array([(0, 0), (-1, 0), (1, 0), (0, -1), (0, 1)], dtype=np.int64)
+NUM_ACTIONS = len(ACTION_DELTAS)
+
+# 행동 번호별 같은 효과의 키 입력 (Game과 결과 비교, 리플레이 변환용)
+ACTION_KEYS = (
+    NO_KEYS,
+    KeyState([pygame.K_LEFT]),
+    KeyState([pygame.K_RIGHT]),
+    KeyState([pygame.K_UP]),
+    KeyState([pygame.K_DOWN]),
+)
+
+
+class VecEnv:
+    """
+    N개 월드를 같이 진행하는 환경
+
+    보상은 살아남은 틱마다 1.0 (이번 틱에 잡히면 0.0).
+    끝난 월드는 auto_reset이면 step 안에서 다음 시드로 바로 다시 시작함.
+    """
+
+    def __init__(self, num_envs, seed=0, enemy_speed=ENEMY_SPEED_GRID,
+                 spawn_interval=ENEMY_SPAWN_INTERVAL, max_enemies=MAX_ENEMIES,
+                 max_episode_ticks=None, auto_reset=True, shared_memory=False):
+        """
+        환경 초기화
+
+        Args:
+            num_envs: 월드 수
+            seed: 첫 시드 (월드 i의 첫 판은 seed + i, 이후 판은 재시작 순서대로 이어지는 시드)
+            enemy_speed: 적의 한 틱당 이동 그리드
+            spawn_interval: 적 spawn 간격 (밀리초, 시뮬레이션 시계 기준)
+            max_enemies: 월드별 최대 적 수
+            max_episode_ticks: 한 판의 최대 틱 수 (넘으면 잘라서 종료, None이면 제한 없음)
+            auto_reset: True면 끝난 월드를 step 안에서 바로 재시작
+            shared_memory: True면 관측 배열을 공유 메모리에 두어 다른 프로세스가
+                observation_buffer.name으로 붙어 복사 없이 읽을 수 있음 (다 쓰면 close() 호출)
+        """
+        if num_envs < 1:
+            raise ValueError(f"월드 수는 1 이상이어야 함: {num_envs}")
+        self.num_envs = num_envs
+        self.enemy_speed = enemy_speed
+        self.spawn_interval = spawn_interval
+        self.max_enemies = max_enemies
+        self.max_episode_ticks = max_episode_ticks
+        self.auto_reset = auto_reset
+        self.cols = GRID_COLS
+        self.rows = GRID_ROWS
+
+        self.swarm = Swarm(cols=self.cols, rows=self.rows, worlds=num_envs)
+
+        # 월드별 상태 (Game의 같은 이름 속성과 대응)
+        self.player_x = np.zeros(num_envs, dtype=np.int64)
+        self.player_y = np.zeros(num_envs, dtype=np.int64)
+        self.move_cooldown = np.zeros(num_envs, dtype=np.int64)
+        self.tick_count = np.zeros(num_envs, dtype=np.int64)
+        self.sim_time = np.zeros(num_envs, dtype=np.float64)
+        self.last_spawn_time = np.zeros(num_envs, dtype=np.float64)
+        self.enemy_count = np.zeros(num_envs, dtype=np.int64)
+        self.seeds = np.zeros(num_envs, dtype=np.int64)
+        self.episodes = np.zeros(num_envs, dtype=np.int64)  # 끝난 판 수
+        self._rngs = [None] * num_envs
+        self._next_seed = seed
+
+        # 플레이어 모양 (경계 판정과 셀 계산용)
+        player_shape = COMPILED_PLAYER_SHAPE
+        self._player_dx = np.array(player_shape.dxs, dtype=np.int64)
+        self._player_dy = np.array(player_shape.dys, dtype=np.int64)
+        self._player_bounds = (player_shape.min_x, player_shape.max_x,
+                               player_shape.min_y, player_shape.max_y)
+        self._player_center = np.array([player_shape.center_x, player_shape.center_y])
+
+        self.observation_buffer = ObservationBuffer((num_envs, self.cols, self.rows), shared=shared_memory)
+        self.observations = self.observation_buffer.array
+        self.reset()
+
+    def close(self):
+        """관측 버퍼 해제 (공유 메모리면 unlink까지)"""
+        self.observations = None
+        self.observation_buffer.close()
+        self.observation_buffer.unlink()
+
+    def reset(self):
+        """
+        모든 월드를 새 시드로 다시 시작
+
+        Returns:
+            np.ndarray: (num_envs, cols, rows) 관측
+        """
+        self._reset_worlds(np.ones(self.num_envs, dtype=bool))
+        return self.observe()
+
+    def _reset_worlds(self, worlds):
+        """지정한 월드들을 다음 시드로 다시 시작 (월드 번호 순으로 시드 배정)"""
+        indices = np.flatnonzero(worlds)
+        self.swarm.remove_worlds(worlds)
+        self.player_x[indices] = self.cols // 2
+        self.player_y[indices] = self.rows // 2
+        self.move_cooldown[indices] = 0
+        self.tick_count[indices] = 0
+        self.sim_time[indices] = 0.0
+        self.last_spawn_time[indices] = 0.0
+        self.enemy_count[indices] = 0
+        for index in indices.tolist():
+            self.seeds[index] = self._next_seed
+            self._rngs[index] = random.Random(self._next_seed)
+            self._next_seed += 1
+
+    def step(self, actions):
+        """
+        모든 월드를 한 틱 진행
+
+        Args:
+            actions: (num_envs,) 행동 번호 배열 (0 정지, 1 왼쪽, 2 오른쪽, 3 위, 4 아래)
+
+        Returns:
+            tuple: (observations, rewards, dones, infos)
+                observations: (num_envs, cols, rows) uint8 관측
+                    (auto_reset이면 끝난 월드는 새 판의 첫 관측)
+                rewards: (num_envs,) float32 생존 보상
+                dones: (num_envs,) bool, 이번 틱에 판이 끝났는지
+                infos: dict, "episode_ticks" (끝난 시점의 틱 수 포함),
+                    "truncated" (최대 틱 수로 잘렸는지), "seeds" (이번 틱을 진행한 판의 시드)
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        if actions.shape != (self.num_envs,):
+            raise ValueError(f"행동 배열 모양이 {(self.num_envs,)}이어야 함: {actions.shape}")
+        if actions.size and (actions.min() < 0 or actions.max() >= NUM_ACTIONS):
+            raise ValueError(f"행동 번호는 0~{NUM_ACTIONS - 1} 범위여야 함")
+
+        # 시뮬레이션 시계 진행
+        self.tick_count += 1
+        self.sim_time += SIM_TICK_MS
+
+        self._move_players(actions)
+        self._spawn_due()
+
+        # 적 이동 (모든 월드를 한 번에)
+        centers = np.empty((self.num_envs, 2))
+        centers[:, 0] = self.player_x + self._player_center[0]
+        centers[:, 1] = self.player_y + self._player_center[1]
+        self.swarm.step(centers)
+
+        # 충돌 판정
+        player_cells_x = self.player_x[:, None] + self._player_dx
+        player_cells_y = self.player_y[:, None] + self._player_dy
+        caught = self.swarm.overlaps_by_world(player_cells_x, player_cells_y)
+
+        truncated = np.zeros(self.num_envs, dtype=bool)
+        if self.max_episode_ticks is not None:
+            truncated = ~caught & (self.tick_count >= self.max_episode_ticks)
+        dones = caught | truncated
+        rewards = np.where(caught, 0.0, 1.0).astype(np.float32)
+        infos = {
+            "episode_ticks": self.tick_count.copy(),
+            "truncated": truncated,
+            "seeds": self.seeds.copy(),
+        }
+
+        if dones.any():
+            self.episodes += dones
+            if self.auto_reset:
+                self._reset_worlds(dones)
+        return self.observe(), rewards, dones, infos
+
+    def _move_players(self, actions):
+        """Player.move와 같은 규칙으로 모든 월드의 플레이어 이동 (쿨다운 중이면 쿨다운만 감소)"""
+        cooling = self.move_cooldown > 0
+        self.move_cooldown[cooling] -= 1
+
+        delta = ACTION_DELTAS[actions] * PLAYER_SPEED_GRID
+        new_x = self.player_x + delta[:, 0]
+        new_y = self.player_y + delta[:, 1]
+        min_x, max_x, min_y, max_y = self._player_bounds
+        valid = ((new_x + min_x >= 0) & (new_x + max_x < self.cols)
+                 & (new_y + min_y >= 0) & (new_y + max_y < self.rows))
+        moved = ~cooling & (actions != 0) & valid
+
+        self.player_x[moved] = new_x[moved]
+        self.player_y[moved] = new_y[moved]
+        self.move_cooldown[moved] = PLAYER_MOVE_DELAY
+
+    def _spawn_due(self):
+        """spawn 시각이 된 월드마다 적 하나 spawn (Game.spawn_enemy와 같은 난수 순서)"""
+        due = np.flatnonzero(self.sim_time - self.last_spawn_time > self.spawn_interval)
+        for index in due.tolist():
+            if self.enemy_count[index] < self.max_enemies:
+                shape_index, grid_x, grid_y = random_edge_spawn(self._rngs[index])
+                self.swarm.add(float(grid_x), float(grid_y), shape_index, self.enemy_speed, world=index)
+                self.enemy_count[index] += 1
+            self.last_spawn_time[index] = self.sim_time[index]
+
+    def observe(self):
+        """
+        모든 월드의 현재 상태를 관측 배열에 기록
+
+        셀 값은 빈 칸 OBS_EMPTY, 적이 있으면 그 적의 모양 번호 + 1,
+        플레이어 셀은 OBS_PLAYER.
+
+        Returns:
+            np.ndarray: (num_envs, cols, rows) uint8 관측 (self.observations)
+        """
+        observations = self.observations
+        observations.fill(OBS_EMPTY)
+
+        swarm = self.swarm
+        cells_x, cells_y, mask = swarm.cells()
+        inside = mask & (cells_x >= 0) & (cells_x < self.cols) & (cells_y >= 0) & (cells_y < self.rows)
+        n = swarm.count
+        worlds = np.broadcast_to(swarm.world[:n, None], mask.shape)
+        labels = np.minimum(swarm.shape_id[:n] + 1, OBS_PLAYER - 1)
+        values = np.broadcast_to(labels[:, None], mask.shape)
+        observations[worlds[inside], cells_x[inside], cells_y[inside]] = values[inside]
+
+        env_index = np.arange(self.num_envs)[:, None]
+        observations[env_index, self.player_x[:, None] + self._player_dx,
+                     self.player_y[:, None] + self._player_dy] = OBS_PLAYER
+        return observations
@@ -0,0 +1,54 @@
+"""헤드리스 일괄 실행기 테스트"""
+
+from src.batch_runner import parameter_grid, run_game, run_batch, aggregate
+from src.bots import make_policy
+from src.game import Game
+
+
+class TestBatchRunner:
+    """일괄 실행기 테스트"""
+
+    def test_parameter_grid(self):
+        """모든 조합을 만듦"""
+        grid = parameter_grid([0.1, 0.2], [1000, 2000, 3000], [30])
+        assert len(grid) == 6
+        assert {"enemy_speed": 0.2, "spawn_interval": 3000, "max_enemies": 30} in grid
+
+    def test_run_game_is_deterministic(self):
+        """같은 시드/정책이면 같은 생존 시간"""
+        params = {"enemy_speed": 0.2, "spawn_interval": 500, "max_enemies": 10}
+        first = run_game(params, "random", seed=3, max_ticks=2000)
+        second = run_game(params, "random", seed=3, max_ticks=2000)
+        assert first["survival_ticks"] == second["survival_ticks"]
+        assert first["survival_ticks"] <= 2000
+
+    def test_reused_game_matches_fresh_game(self):
+        """재사용한 게임의 결과가 새로 만든 게임과 같음"""
+        params = {"enemy_speed": 0.2, "spawn_interval": 500, "max_enemies": 10}
+        run_game(params, "flee", seed=5, max_ticks=1000)  # 다른 시드로 한 판 진행한 게임을 재사용
+        reused = run_game(params, "random", seed=3, max_ticks=2000)
+
+        game = Game(headless=True, seed=3, input_source=make_policy("random", 3), **params)
+        game.simulate(2000)
+        assert reused["survival_ticks"] == game.tick_count
+        assert reused["enemies"] == len(game.enemies)
+
+    def test_pool_matches_single_process(self):
+        """프로세스 풀 결과가 한 프로세스 실행과 같음"""
+        grid = parameter_grid([0.2], [500, 1000], [10])
+        serial = run_batch(grid, ["idle", "flee"], runs=2, max_ticks=1500, workers=1)
+        pooled = run_batch(grid, ["idle", "flee"], runs=2, max_ticks=1500, workers=2)
+
+        assert len(serial) == 2 * 2 * 2
+        assert [r["survival_ticks"] for r in serial] == [r["survival_ticks"] for r in pooled]
+
+    def test_aggregate(self):
+        """조합별로 묶어 통계를 냄"""
+        grid = parameter_grid([0.2], [500], [10])
+        results = run_batch(grid, ["idle", "flee"], runs=3, max_ticks=1500, workers=1)
+        summaries = aggregate(results)
+
+        assert len(summaries) == 2
+        assert all(s["runs"] == 3 for s in summaries)
+        assert all(0 <= s["game_over_rate"] <= 1 for s in summaries)
+        assert all(s["survival_p10_s"] <= s["survival_p50_s"] <= s["survival_p90_s"] for s in summaries)
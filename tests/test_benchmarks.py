@@ -0,0 +1,74 @@
+"""벤치마크 스크립트 동작 테스트"""
+
+import json
+import pytest
+import pygame
+from benchmarks.bench_game import build_enemies, run_scenario, scaling_exponents, compare, main
+from src.player import Player
+from src.constants import GRID_COLS, GRID_ROWS
+
+
+@pytest.fixture(scope="module")
+def init_pygame():
+    """pygame 초기화 픽스처"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+class TestBenchmarkScenarios:
+    """벤치마크 시나리오 테스트"""
+    
+    def test_build_enemies_no_overlap(self, init_pygame):
+        """자리가 충분하면 적끼리, 그리고 플레이어와 겹치지 않게 배치"""
+        player = Player(grid_x=GRID_COLS // 2, grid_y=GRID_ROWS // 2)
+        enemies, overlapping = build_enemies(200, "mixed", "jammed", player, seed=0)
+        
+        assert overlapping == 0
+        cells = [cell for enemy in enemies for cell in enemy.get_grid_positions()]
+        assert len(cells) == len(set(cells))
+        assert set(cells).isdisjoint(player.get_grid_positions())
+    
+    def test_run_scenario_reports_metrics(self, init_pygame):
+        """시나리오 결과에 필요한 지표가 들어있는지 테스트"""
+        result = run_scenario(30, "L", "sparse", ticks=5)
+        
+        assert result["ticks"] == 5
+        assert result["ticks_per_sec"] > 0
+        assert result["frame_p99_ms"] >= result["frame_p50_ms"] > 0
+    
+    def test_scaling_exponent(self):
+        """선형 증가 데이터의 기울기는 1이어야 함"""
+        results = [
+            {"layout": "sparse", "mix": "mixed", "count": n, "frame_p50_ms": n * 0.01}
+            for n in (10, 100, 1000)
+        ]
+        assert scaling_exponents(results)["sparse/mixed"] == pytest.approx(1.0)
+    
+    def test_main_writes_and_compares(self, init_pygame, tmp_path):
+        """결과 파일 저장 및 비교 실행 테스트"""
+        args = ["--counts", "30", "--mixes", "square", "--layouts", "sparse",
+                "--ticks", "3", "--output-dir", str(tmp_path), "--label", "base"]
+        assert main(args) == 0
+        
+        saved = json.loads((tmp_path / "base.json").read_text(encoding="utf-8"))
+        assert saved["results"][0]["name"] == "sparse/square/30"
+        
+        # 자기 자신과 비교 (임계값을 크게 잡아 회귀 없음)
+        args[-1] = "next"
+        assert main(args + ["--compare", str(tmp_path / "base.json"), "--threshold", "100"]) == 0
+    
+    def test_compare_matches_same_settings_only(self, init_pygame):
+        """이름이 같아도 설정이 다른 시나리오와는 비교하지 않음"""
+        result = run_scenario(30, "L", "sparse", ticks=3, draw=False)
+        slower = dict(result, frame_p50_ms=result["frame_p50_ms"] * 10)
+        
+        assert len(compare([slower], {"results": [result]}, 0.1)) == 1
+        for field, value in [("pathing", "flow"), ("world", [200, 200]), ("chunk_size", 16),
+                             ("dirty_rects", True), ("engine", "swarm")]:
+            assert compare([dict(slower, **{field: value})], {"results": [result]}, 0.1) == []
+        
+        # 설정 항목이 없는 이전 결과는 파일의 settings로 비교
+        old = {k: v for k, v in result.items() if k not in ("pathing", "world", "draw")}
+        assert len(compare([slower], {"settings": {"draw": False}, "results": [old]}, 0.1)) == 1
+        assert compare([slower], {"results": [old]}, 0.1) == []
@@ -0,0 +1,72 @@
+"""입력 정책 테스트"""
+
+import pytest
+import pygame
+from src.bots import make_policy, RandomWalkPolicy, FleePolicy
+from src.input_state import NO_KEYS
+from src.enemy import Enemy
+from src.game import Game
+from src.constants import RED, GRID_COLS
+
+
+@pytest.fixture(scope="module")
+def init_pygame():
+    """pygame 초기화 픽스처"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+class TestPolicies:
+    """입력 정책 테스트"""
+
+    def test_make_policy(self):
+        """이름으로 정책 생성, 모르는 이름은 오류"""
+        assert isinstance(make_policy("flee"), FleePolicy)
+        with pytest.raises(ValueError):
+            make_policy("teleport")
+
+    def test_random_walk_is_seeded(self, init_pygame):
+        """같은 시드면 같은 입력열"""
+        game = Game(headless=True, seed=1)
+        first = RandomWalkPolicy(seed=7)
+        second = RandomWalkPolicy(seed=7)
+        assert [first(game) for _ in range(100)] == [second(game) for _ in range(100)]
+
+    def test_flee_moves_away_from_nearest_enemy(self, init_pygame):
+        """가장 가까운 적의 반대쪽으로 이동"""
+        game = Game(headless=True, seed=1)
+        policy = FleePolicy()
+        assert policy(game) == NO_KEYS
+
+        center_x, center_y = game.player.get_center()
+        game.enemies = [Enemy(center_x - 4, center_y, RED)]
+        keys = policy(game)
+        assert keys[pygame.K_UP] or keys[pygame.K_DOWN] or keys[pygame.K_RIGHT]
+        assert not keys[pygame.K_LEFT]
+
+    def test_flee_uses_world_bounds(self, init_pygame):
+        """화면보다 큰 월드에서는 화면 크기가 아니라 월드 경계를 벽으로 봄"""
+        game = Game(headless=True, seed=1, world_cols=GRID_COLS * 3, world_rows=GRID_COLS * 3)
+        player = game.player
+        # 화면 크기 기준으로는 오른쪽 끝이지만 월드 안쪽인 위치
+        player.grid_x = GRID_COLS - 1 - player.compiled_shape.max_x
+        center_x, center_y = player.get_center()
+        # 아래쪽 약간 왼쪽의 적: 가까운 축(x)부터 벌리므로 오른쪽으로 가야 함
+        enemy = Enemy(center_x, center_y, RED)
+        enemy_x, enemy_y = enemy.get_center()
+        enemy.grid_x += center_x - enemy_x - 1
+        enemy.grid_y += center_y - enemy_y + 4
+        game.enemies = [enemy]
+
+        keys = FleePolicy()(game)
+        assert keys[pygame.K_RIGHT]
+
+    def test_flee_survives_longer_than_idle(self, init_pygame):
+        """도망 정책이 가만히 있는 것보다 오래 버팀"""
+        def survival(policy):
+            game = Game(headless=True, seed=2, input_source=make_policy(policy, 2))
+            game.simulate(20000)
+            return game.tick_count
+
+        assert survival("flee") > survival("idle")
@@ -0,0 +1,138 @@
+"""카메라와 큰 월드 (화면 밖 객체 컬링) 테스트"""
+
+import pytest
+import pygame
+from src.camera import Camera, shape_reach
+from src.game import Game
+from src.input_state import KeyState
+from src.sprite_cache import SpriteCache
+from src.shape import COMPILED_ENEMY_SHAPES, compile_shape
+from src.constants import GRID_COLS, GRID_ROWS, GRID_WIDTH, GRID_HEIGHT
+from benchmarks.bench_game import build_enemies
+
+WORLD = (240, 180)
+
+
+@pytest.fixture(scope="module")
+def init_pygame():
+    """pygame 초기화 픽스처"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def screen_bytes(game):
+    """화면 픽셀 비교용 바이트"""
+    return pygame.image.tobytes(game.screen, "RGB")
+
+
+def on_screen(game, enemy):
+    """적의 셀 중 하나라도 카메라 영역에 있는지 (전체 순회 기준)"""
+    min_x, min_y, max_x, max_y = game.camera.visible_rect()
+    return any(min_x <= x <= max_x and min_y <= y <= max_y for x, y in enemy.get_grid_positions())
+
+
+def large_game(use_swarm=False, count=3000, **options):
+    """적이 겹치지 않게 가득 찬 큰 월드 게임"""
+    game = Game(headless=True, seed=0, use_swarm=use_swarm,
+                world_cols=WORLD[0], world_rows=WORLD[1], **options)
+    game.enemies, _ = build_enemies(count, "mixed", "sparse", game.player, 0, *WORLD)
+    game.last_spawn_time = float("inf")
+    return game
+
+
+class TestCamera:
+    """Camera 테스트"""
+
+    def test_follow_centers_and_clamps(self):
+        """따라갈 점을 가운데 두되 월드 경계 밖은 보이지 않음"""
+        camera = Camera(view_cols=10, view_rows=8, world_cols=100, world_rows=50)
+
+        assert camera.follow(50.5, 25.5)
+        assert (camera.x, camera.y) == (45, 21)
+        assert not camera.follow(50.9, 25.1)
+
+        camera.follow(2, 3)
+        assert (camera.x, camera.y) == (0, 0)
+        camera.follow(99, 49)
+        assert (camera.x, camera.y) == (90, 42)
+        assert camera.visible_rect() == (90, 42, 99, 49)
+        assert camera.offset == (-90 * GRID_WIDTH, -42 * GRID_HEIGHT)
+        assert camera.to_screen(91, 43) == (GRID_WIDTH, GRID_HEIGHT)
+
+    def test_small_world_stays_at_origin(self):
+        """월드가 화면보다 작거나 같으면 움직이지 않음"""
+        camera = Camera(world_cols=GRID_COLS, world_rows=GRID_ROWS // 2)
+
+        assert camera.covers_world
+        assert not camera.follow(GRID_COLS - 1, GRID_ROWS - 1)
+        assert camera.offset == (0, 0)
+
+    def test_shape_reach(self):
+        """기준점/중심점에서 셀까지의 최대 거리 + 1"""
+        assert shape_reach([compile_shape([(0, 0)])]) == 1
+        assert shape_reach(COMPILED_ENEMY_SHAPES) == 3
+        assert shape_reach([compile_shape([(-4, 0), (0, 0)])]) == 5
+
+
+class TestLargeWorld:
+    """화면보다 큰 월드 테스트"""
+
+    def test_player_moves_beyond_screen(self, init_pygame):
+        """플레이어는 화면 크기가 아니라 월드 경계까지 이동"""
+        game = Game(headless=True, seed=0, world_cols=WORLD[0], world_rows=WORLD[1],
+                    input_source=lambda game: KeyState([pygame.K_RIGHT]), spawn_interval=10 ** 9)
+        assert (game.player.grid_x, game.player.grid_y) == (WORLD[0] // 2, WORLD[1] // 2)
+
+        game.simulate(4 * WORLD[0])
+
+        assert game.player.get_bounding_box()[2] == WORLD[0] - 1
+        game.draw()
+        assert game.camera.x == WORLD[0] - GRID_COLS
+
+    def test_spawns_on_world_edges(self, init_pygame):
+        """적은 월드 경계에서 생김"""
+        game = Game(headless=True, seed=4, world_cols=WORLD[0], world_rows=WORLD[1],
+                    spawn_interval=0, max_enemies=200)
+        for _ in range(200):
+            game.spawn_enemy()
+
+        for enemy in game.enemies:
+            min_x, min_y, max_x, max_y = enemy.get_bounding_box()
+            assert min_x >= 0 and min_y >= 0 and max_x < WORLD[0] and max_y < WORLD[1]
+            assert min_x == 0 or min_y == 0 or max_x == WORLD[0] - 1 or max_y == WORLD[1] - 1
+
+    @pytest.mark.parametrize("use_swarm", [False, True])
+    def test_visible_objects_cover_screen(self, init_pygame, use_swarm):
+        """컬링 결과에 화면에 걸친 적이 모두 들어 있고 전체보다 훨씬 적음"""
+        game = large_game(use_swarm)
+        for _ in range(3):
+            game.update()
+            game.game_over = False
+
+        visible = game.visible_objects()
+
+        assert visible[0] is game.player
+        expected = {enemy for enemy in game.enemies if on_screen(game, enemy)}
+        assert expected <= set(visible[1:])
+        assert len(visible) < len(game.enemies) / 4
+
+    @pytest.mark.parametrize("dirty_rects", [False, True])
+    def test_draw_matches_drawing_everything(self, init_pygame, dirty_rects):
+        """화면에 보이는 적만 그려도 모든 적을 그린 결과와 같음 (스크롤 포함)"""
+        game = large_game(dirty_rects=dirty_rects, count=1500,
+                          input_source=lambda game: KeyState([pygame.K_LEFT, pygame.K_UP]))
+        reference = pygame.Surface(game.screen.get_size())
+        reference_sprites = SpriteCache()
+
+        for _ in range(40):
+            game.update()
+            game.game_over = False
+            game.draw()
+
+            reference.fill((0, 0, 0))
+            reference_sprites.draw(reference, [game.player] + game.enemies, game.camera.offset)
+            for surface, rect in game._hud_overlays():
+                reference.blit(surface, rect)
+            assert screen_bytes(game) == pygame.image.tobytes(reference, "RGB")
+        assert game.camera.x < WORLD[0] // 2 - GRID_COLS // 2
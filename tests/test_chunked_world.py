@@ -0,0 +1,175 @@
+"""청크 월드 (ChunkedOccupancyGrid, ChunkIndex, Game(chunk_size=...)) 테스트"""
+
+import random
+import numpy as np
+import pytest
+import pygame
+from src.chunked_world import ChunkedOccupancyGrid, ChunkIndex
+from src.occupancy_grid import OccupancyGrid
+from src.game import Game
+from src.enemy import Enemy
+from src.constants import ENEMY_SHAPES, ENEMY_COLORS, RED
+
+PARAMS = {"enemy_speed": 0.3, "spawn_interval": 50, "max_enemies": 200}
+
+
+@pytest.fixture(scope="module")
+def init_pygame():
+    """pygame 초기화 픽스처"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def random_enemy(rng, cols, rows):
+    """월드 안 무작위 위치의 적 (모양 일부는 경계 밖으로 나갈 수 있음)"""
+    shape_index = rng.randint(0, len(ENEMY_SHAPES) - 1)
+    return Enemy(rng.uniform(0, cols), rng.uniform(0, rows), ENEMY_COLORS[shape_index], ENEMY_SHAPES[shape_index])
+
+
+class TestChunkedOccupancyGrid:
+    """청크 점유 그리드 테스트"""
+
+    def test_matches_dense_grid(self, init_pygame):
+        """추가/이동/제거 후 조회 결과가 OccupancyGrid와 같음"""
+        rng = random.Random(3)
+        cols, rows = 45, 37
+        dense = OccupancyGrid(cols, rows)
+        chunked = ChunkedOccupancyGrid(cols, rows, chunk_size=8)
+        enemies = [random_enemy(rng, cols, rows) for _ in range(120)]
+        for index, enemy in enumerate(enemies):
+            dense.add(enemy, label=index % 5 + 1)
+            chunked.add(enemy, label=index % 5 + 1)
+
+        for _ in range(300):
+            enemy = rng.choice(enemies)
+            if rng.random() < 0.2 and enemy in dense:
+                dense.remove(enemy)
+                chunked.remove(enemy)
+                continue
+            enemy.grid_x = rng.uniform(0, cols)
+            enemy.grid_y = rng.uniform(0, rows)
+            if enemy in dense:
+                dense.move(enemy)
+                chunked.move(enemy)
+
+        for x in range(-1, cols + 1):
+            for y in range(-1, rows + 1):
+                assert chunked.count_at(x, y) == dense.count_at(x, y)
+                assert (chunked.entity_at(x, y) is None) == (dense.entity_at(x, y) is None)
+        cells = [(x, y) for x in range(cols) for y in range(rows)]
+        for enemy in enemies:
+            if enemy in dense:
+                assert chunked.is_free_for(enemy, cells[:50]) == dense.is_free_for(enemy, cells[:50])
+
+        labels = np.zeros((cols, rows), dtype=np.uint8)
+        chunked.write_labels(labels)
+        assert np.array_equal(labels > 0, dense.labels > 0)
+
+    def test_fractional_position_shared_cell(self, init_pygame):
+        """모양 셀이 겹쳐 잘리는 음수 소수 위치도 OccupancyGrid와 같이 처리"""
+        dense = OccupancyGrid(40, 30)
+        chunked = ChunkedOccupancyGrid(40, 30, chunk_size=8)
+        other = Enemy(0, 10, RED)
+        enemy = Enemy(-0.5, 10, RED, ENEMY_SHAPES[2])
+        for grid in (dense, chunked):
+            grid.add(other)
+            grid.add(enemy)
+
+        for x in (5.0, -0.5, 12.25):
+            enemy.grid_x = x
+            dense.move(enemy)
+            chunked.move(enemy)
+            assert chunked.cells_of(enemy) == dense.cells_of(enemy)
+            for cell in [(0, 10), (0, 11), (1, 10), (5, 10), (12, 10)]:
+                assert chunked.count_at(*cell) == dense.count_at(*cell)
+                assert chunked.entity_at(*cell) is dense.entity_at(*cell)
+
+        chunked.remove(enemy)
+        chunked.remove(other)
+        assert not chunked.chunks and not chunked._shared
+
+    def test_allocates_only_occupied_chunks(self, init_pygame):
+        """적이 있는 청크만 배열이 있고, 비면 해제됨"""
+        grid = ChunkedOccupancyGrid(10000, 10000, chunk_size=32)
+        enemy = Enemy(5000, 70, RED)
+        grid.add(enemy)
+        assert list(grid.chunks) == [(156, 2)]
+
+        enemy.grid_x = 40
+        grid.move(enemy)
+        assert list(grid.chunks) == [(1, 2)]
+
+        grid.remove(enemy)
+        assert not grid.chunks
+
+
+class TestChunkIndex:
+    """청크 색인 테스트"""
+
+    def test_movers_by_distance_and_turn(self, init_pygame):
+        """가까운 청크는 매 틱, 먼 청크는 차례가 된 틱에만 고름"""
+        index = ChunkIndex(chunk_size=10, active_radius=1, far_interval=4)
+        near = Enemy(12, 12, RED)
+        far = Enemy(52, 12, RED)  # 청크 (5, 1)
+        index.insert(near)
+        index.insert(far)
+
+        turns = []
+        for tick in range(8):
+            active, due = index.movers(tick, 5.5, 5.5)
+            assert active == [near]
+            turns.append(due == [far])
+        assert turns == [tick % 4 == 2 for tick in range(8)]
+
+    def test_frozen_far_chunks(self, init_pygame):
+        """far_interval이 0이면 먼 청크는 고르지 않음"""
+        index = ChunkIndex(chunk_size=10, active_radius=0, far_interval=0)
+        index.insert(Enemy(52, 12, RED))
+        assert all(index.movers(tick, 5, 5) == ([], []) for tick in range(10))
+
+
+class TestChunkedGame:
+    """청크 월드 게임 테스트"""
+
+    @pytest.mark.parametrize("seed", [0, 1])
+    def test_all_active_matches_dense(self, init_pygame, seed):
+        """모든 청크가 활성 범위 안이면 청크 없이 실행한 결과와 같음"""
+        dense = Game(headless=True, seed=seed, **PARAMS)
+        chunked = Game(headless=True, seed=seed, chunk_size=8, active_chunk_radius=100, **PARAMS)
+
+        while not dense.game_over:
+            dense.update()
+            chunked.update()
+            assert chunked.game_over == dense.game_over
+            assert ([(e.grid_x, e.grid_y) for e in chunked.enemies]
+                    == [(e.grid_x, e.grid_y) for e in dense.enemies])
+        assert np.array_equal(chunked.observe(), dense.observe())
+
+    def test_far_chunks_move_coarsely(self, init_pygame):
+        """먼 청크의 적은 멈추거나 far_chunk_interval 틱마다 그만큼 몰아서 이동"""
+        frozen = Game(headless=True, seed=0, world_cols=400, world_rows=400, chunk_size=16,
+                      active_chunk_radius=1, far_chunk_interval=0, spawn_interval=10 ** 9)
+        coarse = Game(headless=True, seed=0, world_cols=400, world_rows=400, chunk_size=16,
+                      active_chunk_radius=1, far_chunk_interval=4, spawn_interval=10 ** 9)
+        for game in (frozen, coarse):
+            game.enemies = [Enemy(5, 200.5, RED, speed=0.25), Enemy(190, 199, RED, speed=0.25)]
+
+        positions = []
+        for _ in range(8):
+            frozen.update()
+            coarse.update()
+            positions.append(coarse.enemies[0].grid_x)
+
+        assert (frozen.enemies[0].grid_x, frozen.enemies[0].grid_y) == (5, 200.5)
+        assert frozen.enemies[1].grid_x > 190
+        assert len(set(positions)) == 3
+        assert positions[-1] == pytest.approx(5 + 2.0)
+        assert coarse.enemies[1].grid_x == frozen.enemies[1].grid_x
+
+    def test_rejects_swarm_and_flow(self, init_pygame):
+        """청크 월드는 Swarm 엔진, 흐름장 이동과 함께 쓸 수 없음"""
+        with pytest.raises(ValueError):
+            Game(headless=True, chunk_size=16, use_swarm=True)
+        with pytest.raises(ValueError):
+            Game(headless=True, chunk_size=16, pathing="flow")
@@ -0,0 +1,133 @@
+"""비트마스크 충돌 판정 테스트"""
+
+import math
+import random
+import pytest
+import pygame
+from src.collision import anchor_cell, masks_overlap, shapes_collide
+from src.shape import compile_shape, COMPILED_ENEMY_SHAPES, COMPILED_PLAYER_SHAPE
+from src.enemy import Enemy
+from src.player import Player
+from src.constants import ENEMY_SHAPES, RED
+
+
+@pytest.fixture(scope="module")
+def init_pygame():
+    """pygame 초기화 픽스처"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def reference(shape_a, ax, ay, shape_b, bx, by):
+    """기존 셀 집합 교집합 방식"""
+    cells_a = {(int(ax + dx), int(ay + dy)) for dx, dy in shape_a}
+    return not cells_a.isdisjoint((int(bx + dx), int(by + dy)) for dx, dy in shape_b)
+
+
+ALL_SHAPES = COMPILED_ENEMY_SHAPES + [
+    COMPILED_PLAYER_SHAPE,
+    compile_shape([(-1, 0), (0, 0), (1, -1)]),  # 음수 오프셋
+    compile_shape([(0, 0), (2, 2)]),  # 떨어진 셀
+]
+
+
+class TestRowMasks:
+    """모양 비트마스크 테스트"""
+
+    def test_l_shape_masks(self):
+        """L자 모양의 행별 비트"""
+        shape = compile_shape(ENEMY_SHAPES[1])  # (0,0), (0,1), (0,2), (1,2)
+
+        assert shape.row_masks == (0b01, 0b01, 0b11)
+
+    def test_negative_offsets(self):
+        """음수 오프셋은 경계 상자 기준으로 옮겨 저장"""
+        shape = compile_shape([(-1, 0), (0, 0), (1, -1)])
+
+        assert shape.row_masks == (0b100, 0b011)
+
+    def test_empty_shape(self):
+        """빈 모양은 마스크도 없고 아무것과도 충돌하지 않음"""
+        empty = compile_shape([])
+
+        assert empty.row_masks == ()
+        assert not shapes_collide(empty, 0, 0, COMPILED_PLAYER_SHAPE, 0, 0)
+
+
+class TestMasksOverlap:
+    """비트마스크 겹침 판정 테스트"""
+
+    def test_aabb_reject(self):
+        """경계 상자가 떨어져 있으면 False"""
+        assert not masks_overlap((0b11,), 0, 0, 2, (0b11,), 2, 0, 2)
+        assert not masks_overlap((0b1,), 0, 0, 1, (0b1,), 0, 1, 1)
+
+    def test_shift_both_directions(self):
+        """어느 쪽이 왼쪽에 있어도 같은 결과"""
+        assert masks_overlap((0b10,), 0, 0, 2, (0b1,), 1, 0, 1)
+        assert masks_overlap((0b1,), 1, 0, 1, (0b10,), 0, 0, 2)
+        assert not masks_overlap((0b01,), 0, 0, 2, (0b1,), 1, 0, 1)
+
+
+class TestAnchorCell:
+    """절삭이 평행 이동과 같은지 판정 테스트"""
+
+    def test_regular_coordinates(self):
+        """일반 좌표는 경계 상자 왼쪽 위 셀"""
+        shape = compile_shape([(-1, 0), (0, 0), (1, -1)])
+
+        assert anchor_cell(shape, 5.7, 3.2) == (4, 2)
+
+    def test_unsafe_coordinates_fall_back(self):
+        """음수 좌표나 다음 정수에 아주 가까운 좌표는 None"""
+        shape = COMPILED_PLAYER_SHAPE
+
+        assert anchor_cell(shape, -0.5, 3.0) is None
+        assert anchor_cell(shape, math.nextafter(4.0, 0.0), 3.0) is None
+        assert anchor_cell(compile_shape([(-1, 0)]), 0.5, 0.0) is None
+
+
+class TestShapesCollide:
+    """셀 집합 방식과 같은 결과인지 테스트"""
+
+    def test_random_positions_match_reference(self):
+        """무작위 모양/좌표 쌍에서 기존 방식과 같은 결과"""
+        rng = random.Random(0)
+        for _ in range(20000):
+            shape_a = rng.choice(ALL_SHAPES)
+            shape_b = rng.choice(ALL_SHAPES)
+            ax, ay = rng.uniform(-2, 8), rng.uniform(-2, 8)
+            bx, by = ax + rng.uniform(-4, 4), ay + rng.uniform(-4, 4)
+
+            assert shapes_collide(shape_a, ax, ay, shape_b, bx, by) == \
+                reference(shape_a, ax, ay, shape_b, bx, by)
+
+    def test_truncation_edge_cases(self):
+        """음수 절삭, 반올림 경계 좌표에서도 같은 결과"""
+        edges = [
+            -1.0, -0.5, -1e-12, 0.0, 0.5, 1.0,
+            math.nextafter(1.0, 0.0), math.nextafter(3.0, 0.0),
+            2.0 ** 52 - 0.5, 2.0 ** 52 + 1.0,
+        ]
+        for shape_a in ALL_SHAPES:
+            for shape_b in ALL_SHAPES:
+                for ax in edges:
+                    for bx in edges:
+                        for offset in (-1.0, 0.0, 1.0):
+                            assert shapes_collide(shape_a, ax, 0.5, shape_b, bx + offset, 0.5) == \
+                                reference(shape_a, ax, 0.5, shape_b, bx + offset, 0.5)
+                            assert shapes_collide(shape_a, 0.5, ax, shape_b, 0.5, bx + offset) == \
+                                reference(shape_a, 0.5, ax, shape_b, 0.5, bx + offset)
+
+    def test_collides_with_uses_same_result(self, init_pygame):
+        """GameObject.collides_with도 셀 집합 방식과 같은 결과"""
+        rng = random.Random(1)
+        player = Player(10, 10)
+        for _ in range(2000):
+            shape = rng.choice(ENEMY_SHAPES)
+            enemy = Enemy(rng.uniform(7, 13), rng.uniform(7, 13), RED, shape)
+            expected = not set(enemy.get_grid_positions()).isdisjoint(player.get_grid_positions())
+
+            assert enemy.collides_with(player) == expected
+            assert player.collides_with(enemy) == expected
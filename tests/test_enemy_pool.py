@@ -0,0 +1,133 @@
+"""EnemyPool과 슬롯 엔티티 테스트"""
+
+import pytest
+import pygame
+from src.enemy_pool import EnemyPool
+from src.enemy import Enemy
+from src.player import Player
+from src.game import Game
+from src.constants import RED, BLUE, ENEMY_SHAPES
+
+
+@pytest.fixture(scope="module")
+def init_pygame():
+    """pygame 초기화 픽스처"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+class TestSlots:
+    """__slots__ 테스트"""
+
+    def test_entities_have_no_dict(self, init_pygame):
+        """엔티티 인스턴스에 __dict__가 없는지 테스트"""
+        assert not hasattr(Enemy(1, 2, RED), "__dict__")
+        assert not hasattr(Player(3, 4), "__dict__")
+
+    def test_unknown_attribute_rejected(self, init_pygame):
+        """선언하지 않은 속성은 설정할 수 없음"""
+        enemy = Enemy(1, 2, RED)
+        with pytest.raises(AttributeError):
+            enemy.unknown = 1
+
+
+class TestEnemyPool:
+    """적 재사용 풀 테스트"""
+
+    def test_acquire_creates_when_empty(self, init_pygame):
+        """보관된 객체가 없으면 새로 생성"""
+        pool = EnemyPool()
+        enemy = pool.acquire(5, 6, RED, ENEMY_SHAPES[1], speed=0.2)
+
+        assert isinstance(enemy, Enemy)
+        assert pool.created == 1
+        assert pool.reused == 0
+
+    def test_reused_enemy_matches_fresh_one(self, init_pygame):
+        """재사용한 적은 새로 만든 적과 상태가 같아야 함"""
+        pool = EnemyPool()
+        old = pool.acquire(5, 6, RED, ENEMY_SHAPES[1], speed=0.2)
+        old.grid_x += 3.5
+        pool.release(old)
+
+        enemy = pool.acquire(10, 11, BLUE, ENEMY_SHAPES[2], speed=0.05)
+        fresh = Enemy(10, 11, BLUE, ENEMY_SHAPES[2], speed=0.05)
+
+        assert enemy is old
+        assert pool.reused == 1
+        assert len(pool) == 0
+        for name in ("grid_x", "grid_y", "color", "speed", "compiled_shape"):
+            assert getattr(enemy, name) == getattr(fresh, name)
+        assert enemy.get_grid_positions() == fresh.get_grid_positions()
+
+    def test_max_free_limits_storage(self, init_pygame):
+        """max_free보다 많이 반환하면 나머지는 버림"""
+        pool = EnemyPool(max_free=2)
+        enemies = [Enemy(i, 0, RED) for i in range(5)]
+
+        pool.release(enemies[0])
+        pool.release_all(enemies[1:])
+
+        assert len(pool) == 2
+
+    def test_release_all_unbounded(self, init_pygame):
+        """제한이 없으면 모두 보관"""
+        pool = EnemyPool()
+        pool.release_all(Enemy(i, 0, RED) for i in range(5))
+
+        assert len(pool) == 5
+
+
+class TestGamePooling:
+    """게임의 풀 사용 테스트"""
+
+    def test_despawn_returns_enemy_to_pool(self, init_pygame):
+        """제거한 적은 인덱스에서 빠지고 다음 spawn에서 재사용"""
+        game = Game(headless=True, seed=1)
+        game.spawn_enemy()
+        game.spawn_enemy()
+        removed = game.enemies[0]
+
+        game.despawn_enemy(removed)
+
+        assert removed not in game.enemies
+        assert len(game.spatial_hash) == len(game.enemies)
+        assert len(game.occupancy) == len(game.enemies)
+
+        game.spawn_enemy()
+        assert game.enemies[-1] is removed
+        assert game.enemy_pool.reused == 1
+
+    def test_restart_keeps_pool(self, init_pygame):
+        """재시작하면 이전 판의 적 객체가 다음 판에서 재사용됨"""
+        game = Game(headless=True, seed=1)
+        for _ in range(3):
+            game.spawn_enemy()
+        old_enemies = list(game.enemies)
+        pool = game.enemy_pool
+
+        game.restart()
+
+        assert game.enemy_pool is pool
+        assert game.enemies == []
+        assert len(pool) == 3
+
+        game.spawn_enemy()
+        assert game.enemies[0] in old_enemies
+
+    def test_pooled_game_is_deterministic(self, init_pygame):
+        """재사용한 적으로 진행한 게임도 새 게임과 같은 결과"""
+        first = Game(headless=True, seed=4)
+        for _ in range(5):
+            first.spawn_enemy()
+        first.restart()
+
+        second = Game(headless=True, seed=4)
+        for game in (first, second):
+            for _ in range(300):
+                game.update()
+
+        assert [(e.grid_x, e.grid_y, e.color) for e in first.enemies] == \
+            [(e.grid_x, e.grid_y, e.color) for e in second.enemies]
+        assert first.game_over == second.game_over
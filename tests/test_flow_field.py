@@ -0,0 +1,184 @@
+"""흐름장 테스트"""
+
+import numpy as np
+import pytest
+import pygame
+from src.flow_field import FlowField, FlowFieldNavigator
+from src.enemy import Enemy
+from src.occupancy_grid import OccupancyGrid
+from src.player import Player
+from src.game import Game
+from src.snapshot import capture_snapshot, restore_snapshot
+from src.bots import make_policy
+from src.constants import RED, FLOW_FIELD_RADIUS
+
+
+@pytest.fixture(scope="module")
+def init_pygame():
+    """pygame 초기화 픽스처"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+class TestFlowField:
+    """흐름장 계산 테스트"""
+
+    def test_distance_is_chebyshev_without_obstacles(self):
+        """장애물이 없으면 8방향 걸음 수 = 체비쇼프 거리"""
+        field = FlowField((3, 4), cols=10, rows=8)
+        xs, ys = np.meshgrid(np.arange(10), np.arange(8), indexing="ij")
+        expected = np.maximum(abs(xs - 3), abs(ys - 4))
+        assert np.array_equal(field.distance, expected)
+
+    def test_directions_lead_to_target(self):
+        """방향을 따라가면 목표 셀에 도착"""
+        field = FlowField((7, 2), cols=12, rows=12)
+        for start in [(0, 0), (11, 11), (0, 11), (7, 10)]:
+            x, y = start
+            for _ in range(20):
+                dx, dy = field.direction_at(x, y)
+                if dx == 0 and dy == 0:
+                    break
+                x, y = x + round(dx / max(abs(dx), abs(dy))), y + round(dy / max(abs(dx), abs(dy)))
+            assert (x, y) == (7, 2)
+
+    def test_straight_line_is_preferred(self):
+        """같은 행에 있으면 대각선이 아니라 곧장 이동"""
+        field = FlowField((5, 5), cols=11, rows=11)
+        assert field.direction_at(0.5, 5.5) == (1.0, 0.0)
+        assert field.direction_at(5.2, 5.9) == (0.0, 0.0)
+
+    def test_routes_around_obstacles(self):
+        """막힌 셀을 돌아가는 거리"""
+        blocked = np.zeros((7, 7), dtype=bool)
+        blocked[3, 0:6] = True  # x=3 세로 벽, 아래쪽 끝만 열림
+        field = FlowField((6, 0), cols=7, rows=7, blocked=blocked)
+
+        assert field.distance_at(3, 2) == -1
+        assert field.distance_at(0, 0) == 12  # 벽 아래로 돌아감
+        assert field.direction_at(0, 0)[1] > 0  # 처음엔 아래로
+
+    def test_radius_bounds_field(self):
+        """계산 범위 안은 전체 계산과 같고, 밖은 도달 불가(-1)이며 방향 없음"""
+        full = FlowField((50, 60), cols=200, rows=150)
+        bounded = FlowField((50, 60), cols=200, rows=150, radius=10)
+
+        assert bounded.window == (21, 21) and bounded.origin == (40, 50)
+        for cell in [(40, 50), (60, 70), (45, 66), (50, 60)]:
+            assert bounded.distance_at(*cell) == full.distance_at(*cell)
+            assert bounded.direction_at(*cell) == full.direction_at(*cell)
+        assert bounded.distance_at(39, 60) == -1
+        assert bounded.direction_at(150.5, 20.5) == (0.0, 0.0)
+
+    def test_direction_avoiding_crowded_cell(self):
+        """다음 칸이 붐비면 걸음 수가 같은 빈 이웃으로 돌아가고, 비어 있으면 direction_at과 같음"""
+        field = FlowField((8, 2), cols=9, rows=5)
+        crowded = {(4, 2)}
+
+        assert field.direction_at(3.5, 2.5) == (1.0, 0.0)
+        assert field.direction_avoiding(3.5, 2.5, lambda x, y: False, 3) == (1.0, 0.0)
+        direction_x, direction_y = field.direction_avoiding(3.5, 2.5, lambda x, y: (x, y) in crowded, 3)
+        assert direction_x > 0 and direction_y != 0
+
+        # 모든 이웃이 붐비면 원래 방향 유지
+        assert field.direction_avoiding(3.5, 2.5, lambda x, y: True, 3) == (1.0, 0.0)
+        assert field.direction_avoiding(8.5, 2.5, lambda x, y: True, 3) == (0.0, 0.0)
+
+    def test_navigator_lru(self):
+        """같은 셀은 다시 계산하지 않고, 오래된 흐름장부터 버림"""
+        navigator = FlowFieldNavigator(cols=10, rows=10, cache_size=2)
+        first = navigator.field_for((1, 1))
+        assert navigator.field_for((1, 1)) is first
+        navigator.field_for((2, 2))
+        navigator.field_for((1, 1))  # (1, 1)이 최근 사용
+        navigator.field_for((3, 3))  # (2, 2) 제거
+
+        assert len(navigator) == 2
+        assert navigator.field_for((1, 1)) is first
+        assert (navigator.hits, navigator.misses) == (3, 3)
+        navigator.field_for((2, 2))
+        assert navigator.misses == 4
+
+
+class TestFlowPathing:
+    """흐름장 이동 테스트"""
+
+    def test_enemy_follows_field(self, init_pygame):
+        """적이 흐름장 방향으로 이동"""
+        player = Player(30, 30)
+        field = FlowField(tuple(int(c) for c in player.get_center()))
+        enemy = Enemy(10, 31, RED)
+        enemy.follow_flow_field(field, player)
+        assert enemy.grid_x > 10
+        assert enemy.grid_y == 31
+
+    def test_enemy_steps_around_crowded_cell(self, init_pygame):
+        """앞 칸을 다른 적이 차지했으면 대각선으로 비켜 가고, crowd_cost=0이면 곧장 감"""
+        player = Player(30, 30)
+        field = FlowField(tuple(int(c) for c in player.get_center()))
+        for crowd_cost, sidestep in [(2, True), (0, False)]:
+            occupancy = OccupancyGrid()
+            enemy = Enemy(10, 31, RED)
+            blocker = Enemy(11, 31, RED)
+            occupancy.add(enemy)
+            occupancy.add(blocker)
+            assert field.direction_at(*enemy.get_center()) == (1.0, 0.0)
+            enemy.follow_flow_field(field, player, occupancy=occupancy, crowd_cost=crowd_cost)
+            assert (enemy.grid_y != 31) == sidestep
+            assert enemy.grid_x > 10
+
+    def test_game_with_flow_pathing(self, init_pygame):
+        """흐름장 모드 게임이 적을 플레이어에게 보냄"""
+        game = Game(headless=True, seed=2, pathing="flow")
+        game.simulate(3000)
+        assert game.game_over
+        assert game.navigator.misses == 1  # 플레이어가 움직이지 않으면 한 번만 계산
+
+    def test_game_reuses_field_on_return(self, init_pygame):
+        """플레이어가 A -> B -> A로 움직이면 A의 흐름장을 다시 계산하지 않음"""
+        game = Game(headless=True, seed=2, pathing="flow", world_cols=300, world_rows=300)
+        game.spawn_enemy()
+        game.update()
+        start = game.player.grid_x
+        for x in (start + 1, start):
+            game.player.grid_x = x
+            game.update()
+
+        assert (game.navigator.hits, game.navigator.misses, len(game.navigator)) == (1, 2, 2)
+
+    def test_large_world_field_is_bounded(self, init_pygame):
+        """큰 월드에서도 흐름장은 플레이어 근처 범위만 계산"""
+        game = Game(headless=True, seed=3, pathing="flow", world_cols=400, world_rows=400)
+        game.spawn_enemy()
+        game.update()
+        cell = tuple(int(c) for c in game.player.get_center())
+        field = game.navigator.field_for(cell)
+        side = 2 * FLOW_FIELD_RADIUS + 1
+        assert field.window == (side, side)
+        assert game.navigator.misses == 1
+
+    def test_snapshot_restore_continues_identically(self, init_pygame):
+        """흐름장은 플레이어 셀만으로 정해지므로 복원한 게임도 똑같이 진행됨"""
+        settings = dict(headless=True, pathing="flow", enemy_speed=0.02, spawn_interval=150,
+                        max_enemies=80)
+        game = Game(seed=4, input_source=make_policy("random", 4), **settings)
+        game.simulate(407)
+        assert not game.game_over
+        other = Game(seed=9, input_source=make_policy("random", 4), **settings)
+        other.simulate(50)  # 다른 흐름장이 캐시에 있는 게임
+        restore_snapshot(other, capture_snapshot(game))
+        other.input_source = game.input_source = make_policy("idle")
+
+        game.simulate(300)
+        other.simulate(300)
+        assert ([(e.grid_x, e.grid_y) for e in other.enemies]
+                == [(e.grid_x, e.grid_y) for e in game.enemies])
+        assert other.tick_count == game.tick_count
+
+    def test_invalid_pathing(self, init_pygame):
+        """알 수 없는 이동 방식이나 Swarm과의 조합은 오류"""
+        with pytest.raises(ValueError):
+            Game(headless=True, pathing="teleport")
+        with pytest.raises(ValueError):
+            Game(headless=True, pathing="flow", use_swarm=True)
@@ -3,7 +3,11 @@
 import pytest
 import pygame
 from src.game import Game
-from src.constants import GRID_COLS, GRID_ROWS
+from src.input_state import KeyState
+from src.constants import (
+    GRID_COLS, GRID_ROWS, SCREEN_WIDTH, SCREEN_HEIGHT,
+    ENEMY_SPAWN_INTERVAL, SIM_TICK_MS
+)
 
 
 @pytest.fixture(scope="module")
@@ -130,6 +134,50 @@ class TestCollisionDetection:
         assert game.check_collision() is False
         assert game.game_over is False
 
+    
+    @pytest.mark.parametrize("options", [{}, {"use_swarm": True}, {"chunk_size": 16}])
+    def test_collision_after_move_enemy(self, init_pygame, options):
+        """spawn된 적을 move_enemy로 플레이어 위에 옮기면 충돌 (적 인덱스도 갱신됨)"""
+        game = Game(headless=True, seed=1, **options)
+        game.spawn_enemy()
+        game.spawn_enemy()
+        assert game.check_collision() is False
+        
+        enemy = game.enemies[0]
+        game.move_enemy(enemy, game.player.grid_x + 1, game.player.grid_y + 1)
+        
+        assert set(enemy.get_grid_positions()) & set(game.player.get_grid_positions())
+        assert game.check_collision() is True
+    
+    @pytest.mark.parametrize("options", [{}, {"chunk_size": 16}, {"spawner": "indexed"}])
+    def test_move_enemy_to_negative_fraction(self, init_pygame, options):
+        """모양 셀이 겹쳐 잘리는 음수 소수 위치로 옮겼다가 다시 옮겨도 인덱스가 유지됨"""
+        from src.constants import ENEMY_SHAPES
+        game = Game(headless=True, seed=1, **options)
+        game.spawn_enemy()
+        enemy = game.enemies[0]
+        enemy.shape = ENEMY_SHAPES[2]
+        game.move_enemy(enemy, -0.5, 3)
+        game.move_enemy(enemy, 3, 3)
+        
+        assert game.occupancy.cells_of(enemy) == tuple(enemy.get_grid_positions())
+        assert game.occupancy.count_at(0, 3) == 0
+        game.move_enemy(enemy, game.player.grid_x + 1, game.player.grid_y + 1)
+        assert game.check_collision() is True
+    
+    @pytest.mark.parametrize("options", [{}, {"use_swarm": True}, {"chunk_size": 16}])
+    def test_collision_after_replacing_element(self, init_pygame, options):
+        """enemies의 원소 하나를 플레이어 위의 적으로 바꿔 넣어도 충돌"""
+        from src.enemy import Enemy
+        from src.constants import RED
+        game = Game(headless=True, seed=1, **options)
+        game.spawn_enemy()
+        game.spawn_enemy()
+        assert game.check_collision() is False
+        
+        game.enemies[1] = Enemy(game.player.grid_x + 1, game.player.grid_y + 1, RED)
+        
+        assert game.check_collision() is True
 
 class TestGameState:
     """게임 상태 테스트"""
@@ -209,3 +257,119 @@ class TestGamePerformance:
         
         # 게임이 정상적으로 작동해야 함
         assert game.running is True
+
+
+class TestHeadlessMode:
+    """헤드리스/결정적 시뮬레이션 모드 테스트"""
+    
+    def test_headless_uses_offscreen_surface(self, init_pygame):
+        """헤드리스 모드는 디스플레이 창 대신 오프스크린 surface를 사용"""
+        game = Game(headless=True, seed=1)
+        
+        assert game.screen is not pygame.display.get_surface()
+        assert game.screen.get_size() == (SCREEN_WIDTH, SCREEN_HEIGHT)
+        game.draw()  # 창 없이도 그릴 수 있어야 함
+    
+    def test_simulated_clock_spawns_enemies(self, init_pygame):
+        """고정 시계 기준으로 spawn 간격이 지켜지는지 테스트"""
+        game = Game(headless=True, seed=1)
+        ticks_per_spawn = int(ENEMY_SPAWN_INTERVAL // SIM_TICK_MS) + 1
+        
+        game.simulate(ticks_per_spawn - 1)
+        assert len(game.enemies) == 0
+        
+        game.simulate(1)
+        assert len(game.enemies) == 1
+        assert game.sim_time == pytest.approx(ticks_per_spawn * SIM_TICK_MS)
+    
+    def test_balance_parameters(self, init_pygame):
+        """게임마다 적 속도/spawn 간격/최대 적 수를 지정할 수 있음"""
+        game = Game(headless=True, seed=1, enemy_speed=0.3, spawn_interval=100, max_enemies=3)
+        game.simulate(200)
+        
+        assert len(game.enemies) == 3
+        assert all(enemy.speed == 0.3 for enemy in game.enemies)
+    
+    def test_seeded_runs_are_identical(self, init_pygame):
+        """같은 시드와 입력이면 결과가 같아야 함"""
+        def run(seed):
+            game = Game(headless=True, seed=seed)
+            game.simulate(1500)
+            return game.tick_count, [(e.grid_x, e.grid_y, e.color) for e in game.enemies]
+        
+        assert run(42) == run(42)
+        assert run(42) != run(43)
+    
+    def test_injected_input(self, init_pygame):
+        """주입한 입력으로 플레이어가 움직이는지 테스트"""
+        game = Game(headless=True, seed=1, input_source=lambda g: KeyState([pygame.K_RIGHT]))
+        start_x = game.player.grid_x
+        
+        game.update()
+        assert game.player.grid_x == start_x + 1
+        
+        game.update(keys=KeyState([pygame.K_LEFT]))  # 쿨다운 중이라 무시됨
+        assert game.player.grid_x == start_x + 1
+
+
+class TestReset:
+    """시뮬레이션 상태만 초기화하는 재시작 테스트"""
+    
+    def test_reset_matches_new_game(self, init_pygame):
+        """reset 후 진행 결과가 새로 만든 게임과 같은지 테스트"""
+        game = Game(headless=True, seed=7)
+        game.simulate(900)
+        game.reset()
+        fresh = Game(headless=True, seed=7)
+        
+        for g in (game, fresh):
+            g.simulate(900)
+        
+        assert game.tick_count == fresh.tick_count
+        assert game.game_over == fresh.game_over
+        assert [(e.grid_x, e.grid_y) for e in game.enemies] == \
+            [(e.grid_x, e.grid_y) for e in fresh.enemies]
+    
+    def test_reset_keeps_resources(self, init_pygame):
+        """화면, 폰트, 스프라이트 캐시, 적 풀은 그대로 유지"""
+        game = Game(headless=True, seed=7)
+        game.simulate(300)
+        game.draw()
+        screen, font, cache, pool = game.screen, game.small_font, game.sprite_cache, game.enemy_pool
+        sprites = len(cache)
+        enemy_count = len(game.enemies)
+        
+        game.reset()
+        
+        assert game.screen is screen
+        assert game.small_font is font
+        assert game.sprite_cache is cache and len(cache) == sprites
+        assert game.enemy_pool is pool and len(pool) == enemy_count
+        assert game.enemies == [] and game.tick_count == 0
+        assert len(game.spatial_hash) == 0 and len(game.occupancy) == 0
+    
+    def test_reset_with_new_seed(self, init_pygame):
+        """새 시드로 reset하면 그 시드로 만든 게임과 같음"""
+        game = Game(headless=True, seed=1)
+        game.simulate(300)
+        game.reset(seed=2)
+        fresh = Game(headless=True, seed=2)
+        
+        for g in (game, fresh):
+            g.simulate(300)
+        
+        assert game.seed == 2
+        assert [(e.grid_x, e.grid_y) for e in game.enemies] == \
+            [(e.grid_x, e.grid_y) for e in fresh.enemies]
+    
+    def test_restart_key(self, init_pygame):
+        """게임 오버 후 R 키로 같은 화면에서 재시작"""
+        game = Game(seed=1)
+        screen = game.screen
+        game.game_over = True
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_r))
+        
+        game.handle_events()
+        
+        assert not game.game_over
+        assert game.screen is screen
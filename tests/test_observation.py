@@ -0,0 +1,105 @@
+"""관측 배열 (Game.observe, ObservationBuffer) 테스트"""
+
+import subprocess
+import sys
+import numpy as np
+import pytest
+import pygame
+from src.game import Game
+from src.observation import ObservationBuffer, OBSERVATION_SHAPE
+from src.shape import COMPILED_ENEMY_SHAPES
+from src.constants import GRID_COLS, GRID_ROWS, OBS_EMPTY, OBS_PLAYER
+
+PARAMS = {"enemy_speed": 0.2, "spawn_interval": 100, "max_enemies": 40}
+
+
+@pytest.fixture(scope="module")
+def init_pygame():
+    """pygame 초기화 픽스처"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def cell_labels(game):
+    """적 객체를 순회해 만든 셀별 가능한 라벨 집합 (기준)"""
+    labels = {}
+    for enemy in game.enemies:
+        label = COMPILED_ENEMY_SHAPES.index(enemy.compiled_shape) + 1
+        for x, y in enemy.get_grid_positions():
+            if 0 <= x < GRID_COLS and 0 <= y < GRID_ROWS:
+                labels.setdefault((x, y), set()).add(label)
+    return labels
+
+
+def assert_matches_enemies(game, observation):
+    """관측이 적/플레이어 위치와 일치하는지 확인"""
+    expected = cell_labels(game)
+    player_cells = set(game.player.get_grid_positions())
+    for x, y in zip(*np.nonzero(observation != OBS_EMPTY)):
+        cell = (int(x), int(y))
+        if cell in player_cells:
+            assert observation[cell] == OBS_PLAYER
+        else:
+            assert observation[cell] in expected[cell]
+    assert (observation != OBS_EMPTY).sum() == len(set(expected) | player_cells)
+
+
+class TestGameObserve:
+    """Game.observe 테스트"""
+
+    @pytest.mark.parametrize("use_swarm", [False, True])
+    def test_matches_enemies(self, init_pygame, use_swarm):
+        """관측이 적 객체로 직접 만든 결과와 같음 (겹친 셀은 그중 하나의 라벨)"""
+        game = Game(headless=True, seed=3, use_swarm=use_swarm, **PARAMS)
+
+        for _ in range(400):
+            game.update()
+            if game.game_over:
+                break
+            assert_matches_enemies(game, game.observe())
+
+    def test_writes_in_place(self, init_pygame):
+        """주어진 배열에 복사 없이 기록"""
+        game = Game(headless=True, seed=1)
+        out = np.full(OBSERVATION_SHAPE, 9, dtype=np.uint8)
+
+        result = game.observe(out)
+
+        assert result is out
+        assert (out == OBS_PLAYER).sum() == len(game.player.get_grid_positions())
+        assert ((out == OBS_EMPTY) | (out == OBS_PLAYER)).all()
+        assert game.observe() is game.observe()
+
+
+class TestObservationBuffer:
+    """ObservationBuffer 테스트"""
+
+    def test_local_buffer(self):
+        """기본 버퍼는 일반 메모리"""
+        buffer = ObservationBuffer()
+
+        assert not buffer.shared and buffer.name is None
+        assert buffer.array.shape == (GRID_COLS, GRID_ROWS)
+        assert buffer.array.dtype == np.uint8
+
+    def test_shared_buffer_visible_from_other_process(self, init_pygame):
+        """다른 프로세스가 이름으로 붙으면 쓴 내용이 그대로 보임"""
+        game = Game(headless=True, seed=2)
+        with ObservationBuffer(shared=True) as buffer:
+            game.observe(buffer.array)
+            code = (
+                "import sys\n"
+                "from src.observation import ObservationBuffer\n"
+                "view = ObservationBuffer.attach(sys.argv[1])\n"
+                "print(int((view.array == 255).sum()), int(view.array.sum()))\n"
+                "view.close()\n"
+            )
+            output = subprocess.run(
+                [sys.executable, "-c", code, buffer.name],
+                capture_output=True, text=True, check=True
+            ).stdout.split()
+
+            assert [int(value) for value in output] == [
+                int((buffer.array == OBS_PLAYER).sum()), int(buffer.array.sum())
+            ]
@@ -0,0 +1,170 @@
+"""OccupancyGrid 클래스 테스트"""
+
+import random
+import pytest
+import pygame
+from src.occupancy_grid import OccupancyGrid
+from src.spatial_hash import SpatialHash
+from src.enemy import Enemy
+from src.player import Player
+from src.constants import ENEMY_SHAPES, ENEMY_COLORS, RED, GRID_COLS, GRID_ROWS
+
+
+@pytest.fixture(scope="module")
+def init_pygame():
+    """pygame 초기화 픽스처"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+class TestOccupancyGridBasics:
+    """점유 그리드 기본 동작 테스트"""
+
+    def test_grid_size(self):
+        """그리드 크기가 GRID_COLS x GRID_ROWS인지 테스트"""
+        grid = OccupancyGrid()
+        assert grid.counts.shape == (GRID_COLS, GRID_ROWS)
+        assert grid.ids.shape == (GRID_COLS, GRID_ROWS)
+
+    def test_add_and_remove(self, init_pygame):
+        """등록 시 셀이 채워지고 제거 시 비워지는지 테스트"""
+        grid = OccupancyGrid()
+        enemy = Enemy(grid_x=5, grid_y=5, color=RED, shape=ENEMY_SHAPES[1])
+        grid.add(enemy)
+
+        for x, y in enemy.get_grid_positions():
+            assert grid.count_at(x, y) == 1
+            assert grid.entity_at(x, y) is enemy
+
+        grid.remove(enemy)
+        assert not grid.counts.any()
+        assert not grid.ids.any()
+        assert len(grid) == 0
+
+    def test_move_updates_cells(self, init_pygame):
+        """이동 후 이전 셀은 비워지고 새 셀이 채워지는지 테스트"""
+        grid = OccupancyGrid()
+        enemy = Enemy(grid_x=5, grid_y=5, color=RED)
+        grid.add(enemy)
+
+        enemy.grid_x = 9.5
+        grid.move(enemy)
+
+        assert grid.count_at(5, 5) == 0
+        assert grid.count_at(9, 5) == 1
+
+    def test_fractional_position_shared_cell(self, init_pygame):
+        """음수 소수 위치에서 두 오프셋이 같은 셀로 잘려도 한 번만 점유하고 정상 이동"""
+        grid = OccupancyGrid()
+        other = Enemy(grid_x=0, grid_y=10, color=RED)
+        enemy = Enemy(grid_x=-0.5, grid_y=10, color=RED, shape=ENEMY_SHAPES[2])
+        positions = enemy.get_grid_positions()
+        assert len(set(positions)) < len(positions)
+
+        grid.add(other)
+        grid.add(enemy)
+        assert grid.cells_of(enemy) == tuple(dict.fromkeys(positions))
+        assert grid.count_at(0, 10) == 2
+
+        enemy.grid_x = 5.0
+        grid.move(enemy)
+        assert grid.count_at(0, 10) == 1 and grid.entity_at(0, 10) is other
+        enemy.grid_x = -0.5
+        grid.move(enemy)
+        grid.remove(other)
+        grid.remove(enemy)
+        assert not grid.counts.any() and not grid.ids.any()
+
+    def test_overlapping_objects(self, init_pygame):
+        """겹친 객체 하나를 제거해도 나머지 점유가 유지되는지 테스트"""
+        grid = OccupancyGrid()
+        first = Enemy(grid_x=3, grid_y=3, color=RED)
+        second = Enemy(grid_x=3, grid_y=3, color=RED)
+        grid.add(first)
+        grid.add(second)
+        assert grid.count_at(3, 3) == 2
+
+        grid.remove(first)
+        assert grid.count_at(3, 3) == 1
+        assert grid.any_occupied([(3, 3)])
+
+    def test_labels_follow_remaining_object(self, init_pygame):
+        """겹친 셀에서 한 객체가 떠나면 ids/labels가 남은 객체를 가리키는지 테스트"""
+        grid = OccupancyGrid()
+        first = Enemy(grid_x=3, grid_y=3, color=RED)
+        second = Enemy(grid_x=3, grid_y=3, color=RED)
+        grid.add(first, label=2)
+        grid.add(second, label=7)
+        assert grid.labels[3, 3] == 7
+
+        grid.remove(second)
+        assert grid.entity_at(3, 3) is first
+        assert grid.labels[3, 3] == 2
+
+        second.grid_x = 10
+        grid.add(second, label=7)
+        grid.move(first, [(10, 3)])
+        assert grid.labels[3, 3] == 0 and grid.ids[3, 3] == 0
+        assert grid.labels[10, 3] in (2, 7)
+
+    def test_outside_cells(self, init_pygame):
+        """월드 밖 셀도 점유 판정되는지 테스트"""
+        grid = OccupancyGrid()
+        enemy = Enemy(grid_x=GRID_COLS, grid_y=0, color=RED)
+        grid.add(enemy)
+
+        assert grid.any_occupied([(GRID_COLS, 0)])
+        grid.remove(enemy)
+        assert not grid.any_occupied([(GRID_COLS, 0)])
+
+    def test_is_free_for_ignores_self(self, init_pygame):
+        """자기 자신의 셀은 점유로 보지 않는지 테스트"""
+        grid = OccupancyGrid()
+        enemy = Enemy(grid_x=5, grid_y=5, color=RED)
+        other = Enemy(grid_x=6, grid_y=5, color=RED)
+        grid.add(enemy)
+        grid.add(other)
+
+        assert grid.is_free_for(enemy, [(5, 5)])
+        assert not grid.is_free_for(enemy, [(6, 5)])
+
+
+class TestOccupancyGridMovement:
+    """점유 그리드를 사용한 이동이 전체 순회와 같은지 테스트"""
+
+    def _make_enemies(self, count, seed):
+        rng = random.Random(seed)
+        enemies = []
+        for _ in range(count):
+            shape_index = rng.randint(0, len(ENEMY_SHAPES) - 1)
+            enemies.append(Enemy(
+                rng.uniform(0, 30), rng.uniform(0, 30),
+                ENEMY_COLORS[shape_index], ENEMY_SHAPES[shape_index]
+            ))
+        return enemies
+
+    def test_matches_brute_force(self, init_pygame):
+        """점유 그리드 경로와 전체 리스트 경로의 이동 결과가 같아야 함"""
+        player = Player(grid_x=15, grid_y=15)
+        brute = self._make_enemies(80, seed=2)
+        indexed = self._make_enemies(80, seed=2)
+
+        spatial_hash = SpatialHash()
+        grid = OccupancyGrid()
+        for enemy in indexed:
+            spatial_hash.insert(enemy, *enemy.get_center())
+            grid.add(enemy)
+
+        for _ in range(60):
+            for enemy in brute:
+                enemy.move_towards_player(player, brute)
+            for enemy in indexed:
+                enemy.move_towards_player(player, spatial_hash=spatial_hash, occupancy=grid)
+
+            # 플레이어 충돌 판정도 같아야 함
+            expected = any(player.collides_with(enemy) for enemy in brute)
+            assert grid.any_occupied(player.get_grid_positions()) == expected
+
+        for a, b in zip(brute, indexed):
+            assert (a.grid_x, a.grid_y) == (b.grid_x, b.grid_y)
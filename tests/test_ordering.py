@@ -0,0 +1,84 @@
+"""FarToNearOrder 테스트"""
+
+import random
+import pytest
+import pygame
+from src.ordering import FarToNearOrder
+from src.enemy import Enemy
+from src.game import Game
+from src.constants import RED
+
+
+@pytest.fixture(scope="module")
+def init_pygame():
+    """pygame 초기화 픽스처"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def reference(enemies, center_x, center_y):
+    """기존 전체 정렬 방식"""
+    return sorted(
+        enemies,
+        key=lambda e: (e.grid_x - center_x)**2 + (e.grid_y - center_y)**2,
+        reverse=True
+    )
+
+
+class TestFarToNearOrder:
+    """점진적 정렬 테스트"""
+
+    def test_matches_full_sort_while_moving(self):
+        """적과 플레이어가 움직여도 전체 정렬과 같은 순서"""
+        rng = random.Random(1)
+        enemies = [Enemy(rng.uniform(0, 70), rng.uniform(0, 70), RED) for _ in range(300)]
+        ordering = FarToNearOrder()
+        center_x, center_y = 35.0, 35.0
+        for tick in range(50):
+            for enemy in enemies:
+                enemy.grid_x += rng.uniform(-0.15, 0.15)
+                enemy.grid_y += rng.uniform(-0.15, 0.15)
+            if tick % 7 == 0:
+                center_x += 1
+            assert ordering.order(enemies, center_x, center_y) == reference(enemies, center_x, center_y)
+
+    def test_ties_follow_list_order(self):
+        """거리가 같으면 리스트 순서 (지난 프레임 순서가 아님)"""
+        enemies = [Enemy(x, y, RED) for x, y in [(0, 5), (5, 0), (10, 5), (5, 10), (5, 6)]]
+        ordering = FarToNearOrder()
+        assert ordering.order(enemies, 5, 5) == reference(enemies, 5, 5)
+
+        # 지난 순서를 뒤집어 놓은 뒤에도 리스트 순서로 정렬
+        enemies[0].grid_x, enemies[3].grid_y = 1, 9
+        ordering.order(enemies, 5, 5)
+        enemies[0].grid_x, enemies[3].grid_y = 0, 10
+        assert ordering.order(enemies, 5, 5) == reference(enemies, 5, 5)
+
+    def test_appended_and_replaced_lists(self):
+        """뒤에 추가된 적과 교체된 리스트를 반영"""
+        enemies = [Enemy(i, 0, RED) for i in range(5)]
+        ordering = FarToNearOrder()
+        ordering.order(enemies, 0, 0)
+
+        enemies.append(Enemy(20, 0, RED))
+        assert ordering.order(enemies, 0, 0) == reference(enemies, 0, 0)
+
+        replaced = enemies[2:]
+        assert ordering.order(replaced, 0, 0) == reference(replaced, 0, 0)
+        assert len(ordering) == len(replaced)
+
+
+class TestGameOrdering:
+    """게임 업데이트 순서 테스트"""
+
+    def test_same_result_as_full_sort(self, init_pygame):
+        """점진적 정렬을 쓴 게임이 전체 정렬과 같은 결과"""
+        def run(full_sort):
+            game = Game(headless=True, seed=5, spawn_interval=200)
+            if full_sort:
+                game.ordering.order = reference
+            game.simulate(1200)
+            return game.tick_count, [(e.grid_x, e.grid_y) for e in game.enemies]
+
+        assert run(False) == run(True)
@@ -0,0 +1,128 @@
+"""시뮬레이션/렌더링 파이프라인 (SimulationPipeline, RenderFrame) 테스트"""
+
+import threading
+import pytest
+import pygame
+from src.pipeline import SimulationPipeline, FrozenObject
+from src.bots import make_policy
+from src.game import Game
+from src.input_state import NO_KEYS
+from src.constants import SIM_TICK_MS
+
+PARAMS = {"enemy_speed": 0.2, "spawn_interval": 200, "max_enemies": 60}
+
+
+@pytest.fixture(scope="module")
+def init_pygame():
+    """pygame 초기화 픽스처"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def make_game(seed=2, **options):
+    """랜덤 이동 입력의 헤드리스 게임"""
+    return Game(headless=True, seed=seed, input_source=make_policy("random", seed), **PARAMS, **options)
+
+
+def screen_bytes(game):
+    """화면 픽셀 비교용 바이트"""
+    return pygame.image.tobytes(game.screen, "RGB")
+
+
+def state(game):
+    """비교용 게임 상태"""
+    return (game.tick_count, game.game_over, game.player.grid_x, game.player.grid_y,
+            [(e.grid_x, e.grid_y) for e in game.enemies])
+
+
+class TestRenderFrame:
+    """RenderFrame 스냅샷 테스트"""
+
+    def test_frozen_frame_ignores_later_updates(self, init_pygame):
+        """frozen 스냅샷은 이후 틱이 실행되어도 그 틱의 위치를 유지"""
+        game = make_game()
+        game.simulate(100)
+        frame = game.render_frame(frozen=True)
+        positions = [(obj.grid_x, obj.grid_y) for obj in frame.objects]
+        assert (frame.tick, frame.enemy_count) == (100, len(game.enemies))
+
+        game.simulate(20)
+
+        assert [(obj.grid_x, obj.grid_y) for obj in frame.objects] == positions
+        assert positions != [(obj.grid_x, obj.grid_y) for obj in game.render_frame().objects]
+
+    def test_frozen_object_matches_source(self, init_pygame):
+        """복사한 객체는 원본과 같은 객체로 취급 (해시/비교)"""
+        game = make_game()
+        game.simulate(100)
+        enemy = game.enemies[0]
+        frozen = FrozenObject(enemy)
+
+        assert frozen == FrozenObject(enemy) and hash(frozen) == hash(enemy)
+        assert frozen != FrozenObject(game.enemies[1])
+        assert frozen.get_grid_positions() == enemy.get_grid_positions()
+
+
+class TestSimulationPipeline:
+    """SimulationPipeline 테스트"""
+
+    @pytest.mark.parametrize("dirty_rects", [False, True])
+    def test_matches_sequential_loop(self, init_pygame, dirty_rects):
+        """작업 스레드가 다음 틱을 실행하는 동안 그린 화면이 순차 실행의 지난 틱 화면과 같음"""
+        game = make_game(dirty_rects=dirty_rects)
+        reference = make_game(dirty_rects=dirty_rects)
+
+        with SimulationPipeline(game) as pipeline:
+            for _ in range(150):
+                pipeline.start(SIM_TICK_MS)
+                game.draw(pipeline.front)
+                reference.draw()
+                assert screen_bytes(game) == screen_bytes(reference)
+                assert pipeline.finish() == reference.advance(SIM_TICK_MS)
+
+        assert state(game) == state(reference)
+        assert game.tick_count > 100
+
+    def test_front_kept_without_ticks(self, init_pygame):
+        """틱을 실행하지 않은 프레임은 front를 그대로 둠"""
+        game = make_game()
+        with SimulationPipeline(game) as pipeline:
+            front = pipeline.front
+            pipeline.start(0.0)
+            assert pipeline.finish() == 0
+            assert pipeline.front is front
+
+            pipeline.start(SIM_TICK_MS)
+            assert pipeline.finish() == 1
+            assert pipeline.front is not front and pipeline.front.tick == 1
+
+    def test_worker_error_raised_on_finish(self, init_pygame):
+        """작업 스레드의 예외는 finish에서 다시 발생"""
+        def broken_input(game):
+            raise KeyError("input")
+
+        game = Game(headless=True, seed=0, input_source=broken_input)
+        pipeline = SimulationPipeline(game)
+        pipeline.start(SIM_TICK_MS)
+        with pytest.raises(KeyError):
+            pipeline.finish()
+        pipeline.close()
+
+    def test_busy_pipeline_rejects_changes(self, init_pygame):
+        """틱 실행 중에는 다시 시작하거나 front를 바꿀 수 없음"""
+        release = threading.Event()
+
+        def blocked_input(game):
+            release.wait()
+            return NO_KEYS
+
+        game = Game(headless=True, seed=0, input_source=blocked_input)
+        with SimulationPipeline(game) as pipeline:
+            pipeline.start(SIM_TICK_MS)
+            with pytest.raises(RuntimeError):
+                pipeline.start(SIM_TICK_MS)
+            with pytest.raises(RuntimeError):
+                pipeline.refresh()
+            release.set()
+
@@ -0,0 +1,106 @@
+"""FrameProfiler 테스트"""
+
+import threading
+import time
+import pytest
+import pygame
+from src.profiler import FrameProfiler, FRAME_PHASES
+from src.game import Game
+
+
+@pytest.fixture(scope="module")
+def init_pygame():
+    """pygame 초기화 픽스처"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+class TestFrameProfiler:
+    """프레임 프로파일러 테스트"""
+
+    def test_marks_record_phase_time(self):
+        """mark 사이의 시간이 해당 단계에 기록됨"""
+        profiler = FrameProfiler(phases=("fast", "slow"), capacity=8)
+        profiler.begin_frame()
+        profiler.mark("fast")
+        time.sleep(0.01)
+        profiler.mark("slow")
+        profiler.end_frame()
+
+        stats = profiler.stats()
+        assert stats["slow"][0] >= 9.0
+        assert stats["fast"][0] < stats["slow"][0]
+        assert stats["frame"][2] >= stats["slow"][2]
+        assert profiler.slowest_phase()[0] == "slow"
+
+    def test_marks_outside_frame_are_ignored(self):
+        """프레임 밖의 mark는 기록하지 않음"""
+        profiler = FrameProfiler(phases=("a",), capacity=4)
+        profiler.mark("a")
+        profiler.end_frame()
+        assert len(profiler) == 0
+        assert profiler.fps() == 0.0
+        assert profiler.slowest_phase() is None
+
+    def test_marks_from_other_threads_are_ignored(self):
+        """begin_frame을 호출한 스레드의 mark만 기록"""
+        profiler = FrameProfiler(phases=("a", "b"), capacity=4)
+        profiler.begin_frame()
+        worker = threading.Thread(target=profiler.mark, args=("b",))
+        worker.start()
+        worker.join()
+        profiler.mark("a")
+        profiler.end_frame()
+
+        stats = profiler.stats()
+        assert stats["a"][0] > 0
+        assert stats["b"][0] == 0
+
+    def test_ring_buffer_keeps_recent_frames(self):
+        """용량을 넘으면 오래된 프레임부터 덮어씀"""
+        profiler = FrameProfiler(phases=("a",), capacity=4)
+        for _ in range(10):
+            profiler.begin_frame()
+            profiler.mark("a")
+            profiler.end_frame()
+        assert profiler.frames == 10
+        assert len(profiler) == 4
+        assert profiler.fps() > 0
+
+    def test_report_lines(self):
+        """FPS 줄과 단계별 줄을 만듦"""
+        profiler = FrameProfiler()
+        lines = profiler.report_lines(60)
+        assert lines[0].startswith("FPS")
+        assert len(lines) == len(FRAME_PHASES) + 2
+
+
+class TestGameProfiler:
+    """게임 루프의 프로파일러 연동 테스트"""
+
+    def test_update_phases_recorded(self, init_pygame):
+        """프레임 안에서 update를 실행하면 단계별 시간이 기록됨"""
+        game = Game(headless=True, seed=1)
+        for _ in range(5):
+            game.spawn_enemy()
+        for _ in range(3):
+            game.profiler.begin_frame()
+            game.update()
+            game.draw()
+            game.profiler.mark("draw")
+            game.profiler.end_frame()
+
+        assert game.profiler.frames == 3
+        stats = game.profiler.stats()
+        assert stats["enemies"][2] > 0
+        assert stats["draw"][2] > 0
+
+    def test_overlay_toggle(self, init_pygame):
+        """오버레이를 켜면 HUD에 통계 텍스트가 추가됨"""
+        game = Game(headless=True, seed=1)
+        base = len(game._hud_overlays())
+        game.toggle_profiler()
+        assert len(game._hud_overlays()) == base + len(FRAME_PHASES) + 2
+        game.toggle_profiler()
+        assert len(game._hud_overlays()) == base
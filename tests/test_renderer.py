@@ -0,0 +1,86 @@
+"""DirtyRectRenderer 테스트"""
+
+import pytest
+import pygame
+from src.renderer import DirtyRectRenderer, cells_rect
+from src.game import Game
+from src.enemy import Enemy
+from src.constants import ENEMY_SHAPES, ENEMY_COLORS, GRID_WIDTH, GRID_HEIGHT, RED
+
+
+@pytest.fixture(scope="module")
+def init_pygame():
+    """pygame 초기화 픽스처"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def screen_bytes(game):
+    """화면 픽셀 비교용 바이트"""
+    return pygame.image.tobytes(game.screen, "RGB")
+
+
+class TestDirtyRectRenderer:
+    """dirty rectangle 렌더러 테스트"""
+    
+    def test_cells_rect(self):
+        """셀 목록을 감싸는 픽셀 영역 계산"""
+        rect = cells_rect([(2, 3), (3, 3), (3, 5)])
+        assert rect == pygame.Rect(2 * GRID_WIDTH, 3 * GRID_HEIGHT, 2 * GRID_WIDTH, 3 * GRID_HEIGHT)
+    
+    def test_first_frame_is_full(self, init_pygame):
+        """첫 프레임은 전체 화면을 반영"""
+        surface = pygame.Surface((200, 200))
+        renderer = DirtyRectRenderer()
+        rects = renderer.draw(surface, [Enemy(1, 1, RED)])
+        assert rects == [surface.get_rect()]
+    
+    def test_static_scene_has_no_dirty_rects(self, init_pygame):
+        """움직임이 없으면 다시 그릴 영역이 없음"""
+        surface = pygame.Surface((200, 200))
+        renderer = DirtyRectRenderer()
+        enemy = Enemy(1, 1, RED)
+        renderer.draw(surface, [enemy])
+        
+        assert renderer.draw(surface, [enemy]) == []
+        
+        enemy.grid_x = 2
+        rects = renderer.draw(surface, [enemy])
+        assert pygame.Rect(GRID_WIDTH, GRID_HEIGHT, GRID_WIDTH, GRID_HEIGHT) in rects
+        assert pygame.Rect(2 * GRID_WIDTH, GRID_HEIGHT, GRID_WIDTH, GRID_HEIGHT) in rects
+    
+    def test_removed_object_is_erased(self, init_pygame):
+        """사라진 객체의 영역이 지워지는지 테스트"""
+        surface = pygame.Surface((200, 200))
+        renderer = DirtyRectRenderer()
+        renderer.draw(surface, [Enemy(1, 1, RED)])
+        renderer.draw(surface, [])
+        
+        assert surface.get_at((GRID_WIDTH + 1, GRID_HEIGHT + 1))[:3] == (0, 0, 0)
+
+
+class TestGameDirtyRects:
+    """Game의 dirty rectangle 모드 테스트"""
+    
+    def test_matches_full_redraw(self, init_pygame):
+        """여러 프레임 동안 전체 다시 그리기와 같은 화면이어야 함 (겹친 적 포함)"""
+        full = Game(headless=True, seed=5)
+        dirty = Game(headless=True, seed=5, dirty_rects=True)
+        for game in (full, dirty):
+            game.enemies = [
+                Enemy(x, y, ENEMY_COLORS[i % 5], ENEMY_SHAPES[i % 5])
+                for i, (x, y) in enumerate([(2, 2), (2.5, 2.5), (10, 60), (60, 10), (3, 3)])
+            ]
+        
+        for tick in range(400):
+            full.update()
+            dirty.update()
+            full.draw()
+            dirty.draw()
+            if tick % 50 == 0 or full.game_over:
+                assert screen_bytes(full) == screen_bytes(dirty)
+            if full.game_over:
+                break
+        
+        assert screen_bytes(full) == screen_bytes(dirty)
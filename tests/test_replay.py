@@ -0,0 +1,177 @@
+"""리플레이 녹화/재생 테스트"""
+
+import pytest
+import pygame
+from src.replay import Replay, encode_keys, decode_keys, SEED_MIN, SEED_MAX, REPLAY_VERSION
+from src.bots import make_policy
+from src.game import Game
+from src.input_state import KeyState
+
+
+@pytest.fixture(scope="module")
+def init_pygame():
+    """pygame 초기화 픽스처"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+# 적이 자주 생기지만 천천히 다가와 오래 버티는 설정
+PARAMS = {"enemy_speed": 0.03, "spawn_interval": 300}
+
+
+def snapshot(game):
+    """비교용 게임 상태"""
+    return (
+        game.tick_count, game.game_over, game.last_spawn_time,
+        game.player.grid_x, game.player.grid_y, game.player.move_cooldown,
+        [(e.grid_x, e.grid_y, e.color, e.compiled_shape) for e in game.enemies],
+    )
+
+
+def record(seed=6, ticks=900, use_swarm=False, keyframe_interval=200):
+    """랜덤 이동 입력으로 녹화한 게임과 리플레이"""
+    game = Game(headless=True, seed=seed, use_swarm=use_swarm, **PARAMS,
+                input_source=make_policy("random", seed))
+    recorder = game.start_recording(keyframe_interval)
+    game.simulate(ticks)
+    return game, recorder.replay
+
+
+class TestInputEncoding:
+    """입력 비트마스크 테스트"""
+
+    def test_round_trip(self):
+        """키 상태 <-> 비트마스크 변환"""
+        keys = KeyState([pygame.K_a, pygame.K_DOWN])
+        mask = encode_keys(keys)
+        decoded = decode_keys(mask)
+        assert decoded[pygame.K_LEFT] and decoded[pygame.K_DOWN]
+        assert not decoded[pygame.K_RIGHT]
+        assert encode_keys(decoded) == mask
+
+
+class TestReplay:
+    """리플레이 테스트"""
+
+    def test_play_reproduces_session(self, init_pygame, tmp_path):
+        """저장한 리플레이를 재생하면 같은 결과"""
+        game, replay = record()
+        path = tmp_path / "session.fgr"
+        replay.save(path)
+
+        loaded = Replay.load(path)
+        assert len(loaded) == len(replay)
+        assert len(loaded.keyframes) > 1
+        assert snapshot(loaded.play()) == snapshot(game)
+
+    def test_seek_matches_linear_play(self, init_pygame):
+        """키프레임에서 출발한 seek 결과가 처음부터 실행한 결과와 같음"""
+        _, replay = record(ticks=900)
+        assert len(replay) == 900
+        target = 777
+        expected = Game(headless=True, seed=6, **PARAMS,
+                        input_source=make_policy("random", 6))
+        expected.simulate(target)
+
+        assert snapshot(replay.seek(target)) == snapshot(expected)
+
+    def test_swarm_replay(self, init_pygame):
+        """Swarm 엔진 게임도 재현"""
+        game, replay = record(use_swarm=True)
+        assert snapshot(replay.seek(len(replay))) == snapshot(game)
+
+    def test_world_size_recorded(self, init_pygame, tmp_path):
+        """큰 월드의 리플레이는 같은 월드 크기로 재생"""
+        game = Game(headless=True, seed=2, world_cols=120, world_rows=90, **PARAMS,
+                    input_source=make_policy("random", 2))
+        recorder = game.start_recording(100)
+        game.simulate(300)
+        path = tmp_path / "world.fgr"
+        recorder.save(path)
+
+        loaded = Replay.load(path)
+        assert (loaded.params["world_cols"], loaded.params["world_rows"]) == (120, 90)
+        assert snapshot(loaded.play()) == snapshot(game)
+
+    def test_chunk_settings_recorded(self, init_pygame, tmp_path):
+        """청크 월드의 리플레이는 같은 청크 설정으로 재생 (먼 청크의 이동 방식 포함)"""
+        game = Game(headless=True, seed=5, world_cols=200, world_rows=160, chunk_size=16,
+                    active_chunk_radius=1, far_chunk_interval=3, **PARAMS,
+                    input_source=make_policy("random", 5))
+        recorder = game.start_recording(100)
+        game.simulate(300)
+        path = tmp_path / "chunks.fgr"
+        recorder.save(path)
+
+        loaded = Replay.load(path)
+        assert (loaded.params["chunk_size"], loaded.params["active_chunk_radius"],
+                loaded.params["far_chunk_interval"]) == (16, 1, 3)
+        assert snapshot(loaded.play()) == snapshot(game)
+
+    def test_indexed_spawner_seek(self, init_pygame, tmp_path):
+        """빈 자리 spawn 색인은 키프레임 복원 후 다시 만들어도 같은 자리에 spawn"""
+        settings = dict(seed=7, enemy_speed=0.02, spawn_interval=100, max_enemies=1000,
+                        spawner="indexed", wave_size=6)
+        game = Game(headless=True, **settings, input_source=make_policy("random", 7))
+        recorder = game.start_recording(100)
+        game.simulate(650)
+        path = tmp_path / "waves.fgr"
+        recorder.save(path)
+
+        loaded = Replay.load(path)
+        assert (loaded.params["spawner"], loaded.params["wave_size"]) == ("indexed", 6)
+        target = len(loaded) * 5 // 6
+        assert target > 300
+        expected = Game(headless=True, **settings, input_source=make_policy("random", 7))
+        expected.simulate(target)
+        assert snapshot(loaded.seek(target)) == snapshot(expected)
+        assert snapshot(loaded.play()) == snapshot(game)
+
+    @pytest.mark.parametrize("seed", [SEED_MIN, SEED_MAX, None])
+    def test_seed_range_saved(self, init_pygame, tmp_path, seed):
+        """64비트 범위 끝의 시드와 시드 없음도 저장/불러오기 가능"""
+        game = Game(headless=True, seed=seed)
+        recorder = game.start_recording()
+        game.simulate(10)
+        path = tmp_path / "seed.fgr"
+        recorder.save(path)
+        assert Replay.load(path).seed == seed
+
+    @pytest.mark.parametrize("seed", [SEED_MAX + 1, SEED_MIN - 1, "abc", 1.5, True])
+    def test_unsavable_seed_rejected(self, init_pygame, seed):
+        """리플레이에 저장할 수 없는 시드는 게임을 만들거나 재시작할 때 바로 오류"""
+        with pytest.raises(ValueError):
+            Game(headless=True, seed=seed)
+        game = Game(headless=True, seed=1)
+        with pytest.raises(ValueError):
+            game.reset(seed)
+        assert game.seed == 1
+
+    def test_invalid_file(self, tmp_path):
+        """리플레이 파일이 아니면 오류"""
+        path = tmp_path / "bad.fgr"
+        path.write_bytes(b"x" * 64)
+        with pytest.raises(ValueError):
+            Replay.load(path)
+
+    def test_other_version_rejected(self, init_pygame, tmp_path):
+        """버전이 다른 파일은 오류"""
+        game = Game(headless=True, seed=1)
+        recorder = game.start_recording()
+        game.simulate(10)
+        path = tmp_path / "version.fgr"
+        recorder.save(path)
+        data = bytearray(path.read_bytes())
+        assert int.from_bytes(data[4:6], "little") == REPLAY_VERSION == 1
+
+        data[4:6] = (REPLAY_VERSION + 1).to_bytes(2, "little")
+        path.write_bytes(bytes(data))
+        with pytest.raises(ValueError):
+            Replay.load(path)
+
+    def test_record_dir(self, init_pygame, tmp_path):
+        """record_dir를 지정하면 판을 파일로 저장"""
+        game = Game(headless=True, seed=1, record_dir=str(tmp_path))
+        game.simulate(100)
+        path = game.save_recording()
+        assert Replay.load(path).end_tick == 100
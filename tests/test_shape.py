@@ -0,0 +1,77 @@
+"""Shape (미리 계산된 모양) 테스트"""
+
+import pytest
+import pygame
+from src.shape import Shape, compile_shape, COMPILED_ENEMY_SHAPES, COMPILED_PLAYER_SHAPE
+from src.enemy import Enemy
+from src.player import Player
+from src.constants import ENEMY_SHAPES, ENEMY_COLORS, PLAYER_SHAPE, RED
+
+
+@pytest.fixture(scope="module")
+def init_pygame():
+    """pygame 초기화 픽스처"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+class TestShapeCompilation:
+    """모양 분석 테스트"""
+    
+    def test_interned(self):
+        """같은 좌표 구성은 같은 인스턴스"""
+        assert compile_shape(list(ENEMY_SHAPES[2])) is COMPILED_ENEMY_SHAPES[2]
+        assert compile_shape(PLAYER_SHAPE) is COMPILED_PLAYER_SHAPE
+        assert compile_shape(COMPILED_PLAYER_SHAPE) is COMPILED_PLAYER_SHAPE
+    
+    def test_precomputed_values(self):
+        """중심점, 경계, 셀 개수 테스트"""
+        shape = compile_shape(ENEMY_SHAPES[1])  # L자
+        
+        assert shape.size == 4
+        assert (shape.min_x, shape.max_x, shape.min_y, shape.max_y) == (0, 1, 0, 2)
+        assert (shape.width, shape.height) == (2, 3)
+        assert shape.center_x == pytest.approx(0.25)
+        assert shape.center_y == pytest.approx(1.25)
+    
+    def test_behaves_like_list(self):
+        """리스트처럼 순회/len/인덱싱 가능"""
+        shape = Shape([(0, 0), (1, 0)])
+        assert list(shape) == [(0, 0), (1, 0)]
+        assert len(shape) == 2
+        assert shape[1] == (1, 0)
+
+
+class TestGameObjectSharing:
+    """GameObject의 Shape 공유 테스트"""
+    
+    def test_objects_share_shape(self, init_pygame):
+        """같은 모양의 객체는 같은 Shape를 공유"""
+        first = Enemy(0, 0, RED, ENEMY_SHAPES[3])
+        second = Enemy(5, 5, RED, ENEMY_SHAPES[3])
+        
+        assert first.compiled_shape is second.compiled_shape
+        assert Player(1, 1).compiled_shape is COMPILED_PLAYER_SHAPE
+    
+    def test_shape_reassignment_recompiles(self, init_pygame):
+        """shape을 바꾸면 Shape도 갱신"""
+        enemy = Enemy(0, 0, RED)
+        enemy.shape = ENEMY_SHAPES[4]
+        assert enemy.compiled_shape is COMPILED_ENEMY_SHAPES[4]
+        assert len(enemy.get_grid_positions()) == 4
+    
+    @pytest.mark.parametrize("grid_x, grid_y", [(10.4, 3.9), (-0.5, -0.7), (-1.5, 2.0), (68.9, 0.0)])
+    def test_cached_values_match_direct_computation(self, init_pygame, grid_x, grid_y):
+        """캐시된 값이 좌표에서 직접 계산한 값과 같아야 함 (음수 좌표 절삭 포함)"""
+        for shape, color in zip(ENEMY_SHAPES, ENEMY_COLORS):
+            enemy = Enemy(grid_x, grid_y, color, shape)
+            positions = enemy.get_grid_positions()
+            xs = [x for x, y in positions]
+            ys = [y for x, y in positions]
+            
+            assert enemy.get_bounding_box() == (min(xs), min(ys), max(xs), max(ys))
+            assert enemy.get_center() == (
+                grid_x + sum(dx for dx, dy in shape) / len(shape),
+                grid_y + sum(dy for dx, dy in shape) / len(shape)
+            )
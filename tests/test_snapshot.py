@@ -0,0 +1,90 @@
+"""게임 상태 스냅샷 테스트"""
+
+import numpy as np
+import pytest
+import pygame
+from src.snapshot import (
+    capture_snapshot, restore_snapshot, dumps, loads, save_snapshot, load_snapshot
+)
+from src.game import Game
+from src.bots import make_policy
+
+
+@pytest.fixture(scope="module")
+def init_pygame():
+    """pygame 초기화 픽스처"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def state(game):
+    """비교용 게임 상태"""
+    return (
+        game.tick_count, game.sim_time, game.last_spawn_time, game.game_over, game.running,
+        game.player.grid_x, game.player.grid_y, game.player.move_cooldown,
+        game.rng.getstate(),
+        [(e.grid_x, e.grid_y, e.speed, e.color, e.compiled_shape) for e in game.enemies],
+    )
+
+
+def played_game(ticks=400):
+    """적이 여럿 있는 진행 중인 게임"""
+    game = Game(headless=True, seed=6, enemy_speed=0.03, spawn_interval=100,
+                input_source=make_policy("random", 6))
+    game.simulate(ticks)
+    return game
+
+
+class TestSnapshot:
+    """스냅샷 테스트"""
+
+    def test_bytes_round_trip(self, init_pygame):
+        """바이트로 저장한 상태를 다른 게임에 복원"""
+        game = played_game()
+        assert len(game.enemies) > 5
+
+        other = Game(headless=True, seed=1)
+        restore_snapshot(other, loads(dumps(capture_snapshot(game))))
+        assert state(other) == state(game)
+
+    def test_restored_game_continues_identically(self, init_pygame):
+        """복원한 게임이 원래 게임과 똑같이 진행됨"""
+        game = played_game()
+        other = Game(headless=True, seed=1, enemy_speed=0.03, spawn_interval=100,
+                     input_source=make_policy("idle"))
+        restore_snapshot(other, capture_snapshot(game))
+        game.input_source = make_policy("idle")
+
+        game.simulate(300)
+        other.simulate(300)
+        assert state(other) == state(game)
+
+    def test_file_round_trip_with_mmap(self, init_pygame, tmp_path):
+        """파일 저장 후 메모리 매핑으로 읽기"""
+        game = played_game()
+        path = tmp_path / "state.fgs"
+        save_snapshot(game, path)
+
+        arrays = load_snapshot(path)
+        assert not arrays["enemy_x"].flags.owndata  # 복사 없이 매핑된 뷰
+        other = Game(headless=True, seed=1)
+        restore_snapshot(other, arrays)
+        assert state(other) == state(game)
+
+    def test_multidimensional_arrays(self):
+        """dtype과 2차원 모양이 보존됨"""
+        data = dumps({"a": np.arange(3, dtype=np.uint8), "b": np.arange(6.0).reshape(3, 2)})
+        arrays = loads(data)
+        assert arrays["b"].shape == (3, 2)
+        assert arrays["a"].dtype == np.uint8
+        assert np.array_equal(arrays["b"], np.arange(6.0).reshape(3, 2))
+
+    def test_rejects_other_data(self):
+        """스냅샷이 아니거나 버전이 다르면 오류"""
+        with pytest.raises(ValueError):
+            loads(b"not a snapshot at all")
+        data = bytearray(dumps({"a": np.zeros(2)}))
+        data[4] = 99
+        with pytest.raises(ValueError):
+            loads(bytes(data))
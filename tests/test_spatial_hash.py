@@ -0,0 +1,92 @@
+"""SpatialHash 클래스 테스트"""
+
+import random
+import pytest
+import pygame
+from src.spatial_hash import SpatialHash
+from src.enemy import Enemy
+from src.player import Player
+from src.constants import ENEMY_SHAPES, ENEMY_COLORS
+
+
+@pytest.fixture(scope="module")
+def init_pygame():
+    """pygame 초기화 픽스처"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+class TestSpatialHashBasics:
+    """공간 해시 기본 동작 테스트"""
+
+    def test_insert_and_query(self):
+        """등록한 항목이 근처 조회에 포함되는지 테스트"""
+        spatial_hash = SpatialHash(cell_size=5)
+        spatial_hash.insert("a", 1.0, 1.0)
+        spatial_hash.insert("b", 40.0, 40.0)
+
+        nearby = spatial_hash.query(2.0, 2.0, 5)
+        assert "a" in nearby
+        assert "b" not in nearby
+        assert len(spatial_hash) == 2
+
+    def test_update_moves_bucket(self):
+        """좌표 갱신 시 버킷이 바뀌는지 테스트"""
+        spatial_hash = SpatialHash(cell_size=5)
+        spatial_hash.insert("a", 1.0, 1.0)
+        spatial_hash.update("a", 30.0, 30.0)
+
+        assert "a" not in spatial_hash.query(1.0, 1.0, 2)
+        assert "a" in spatial_hash.query(30.0, 30.0, 2)
+
+    def test_remove(self):
+        """항목 제거 테스트"""
+        spatial_hash = SpatialHash(cell_size=5)
+        spatial_hash.insert("a", 1.0, 1.0)
+        spatial_hash.remove("a")
+        spatial_hash.remove("missing")  # 없는 항목은 무시
+
+        assert len(spatial_hash) == 0
+        assert spatial_hash.query(1.0, 1.0, 5) == []
+
+    def test_negative_coordinates(self):
+        """음수 좌표도 올바른 버킷으로 분류되는지 테스트"""
+        spatial_hash = SpatialHash(cell_size=5)
+        spatial_hash.insert("a", -0.5, -0.5)
+
+        assert "a" in spatial_hash.query(0.0, 0.0, 1)
+
+
+class TestSpatialHashMovement:
+    """공간 해시를 사용한 적 이동이 전체 순회와 같은지 테스트"""
+
+    def _make_enemies(self, count, seed):
+        rng = random.Random(seed)
+        enemies = []
+        for _ in range(count):
+            shape_index = rng.randint(0, len(ENEMY_SHAPES) - 1)
+            enemies.append(Enemy(
+                rng.uniform(0, 30), rng.uniform(0, 30),
+                ENEMY_COLORS[shape_index], ENEMY_SHAPES[shape_index]
+            ))
+        return enemies
+
+    def test_matches_brute_force(self, init_pygame):
+        """공간 해시 경로와 전체 리스트 경로의 이동 결과가 같아야 함"""
+        player = Player(grid_x=15, grid_y=15)
+        brute = self._make_enemies(60, seed=1)
+        hashed = self._make_enemies(60, seed=1)
+
+        spatial_hash = SpatialHash()
+        for enemy in hashed:
+            spatial_hash.insert(enemy, *enemy.get_center())
+
+        for _ in range(40):
+            for enemy in brute:
+                enemy.move_towards_player(player, brute)
+            for enemy in hashed:
+                enemy.move_towards_player(player, spatial_hash=spatial_hash)
+
+        for a, b in zip(brute, hashed):
+            assert (a.grid_x, a.grid_y) == (b.grid_x, b.grid_y)
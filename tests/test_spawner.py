@@ -0,0 +1,175 @@
+"""빈 자리 spawn 색인 (EdgeSpawnIndex, Game(spawner="indexed")) 테스트"""
+
+import random
+import pytest
+import pygame
+from src.spawner import EdgeSpawnIndex, edge_anchors
+from src.occupancy_grid import OccupancyGrid
+from src.chunked_world import ChunkedOccupancyGrid
+from src.game import Game
+from src.enemy import Enemy
+from src.shape import COMPILED_ENEMY_SHAPES
+from src.constants import ENEMY_SHAPES, ENEMY_COLORS
+
+
+@pytest.fixture(scope="module")
+def init_pygame():
+    """pygame 초기화 픽스처"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def footprint(shape, anchor):
+    """앵커에 놓인 모양의 셀"""
+    x, y = anchor
+    return [(x + dx, y + dy) for dx, dy in shape.offsets]
+
+
+def assert_matches_grid(index, grid):
+    """모든 앵커의 빈 자리 여부와 빈 앵커 순서가 점유 그리드를 직접 검사한 결과와 같은지 확인"""
+    for shape_index, shape in enumerate(COMPILED_ENEMY_SHAPES):
+        free = [anchor for anchor in index.anchors[shape_index]
+                if not grid.any_occupied(footprint(shape, anchor))]
+        assert index.free_count(shape_index) == len(free)
+        assert [index.nth_free(shape_index, rank) for rank in range(len(free))] == free
+
+
+def overlaps(enemy, others):
+    """적이 다른 적들과 셀을 공유하는지 확인"""
+    cells = set(enemy.get_grid_positions())
+    return any(cells & set(other.get_grid_positions()) for other in others if other is not enemy)
+
+
+class TestEdgeAnchors:
+    """경계 앵커 테스트"""
+
+    @pytest.mark.parametrize("shape", COMPILED_ENEMY_SHAPES)
+    def test_anchors_touch_edge_inside_world(self, shape):
+        """모든 앵커는 모양 전체가 월드 안에 있고 한 변 이상에 붙어 있으며 중복이 없음"""
+        cols, rows = 30, 20
+        anchors = edge_anchors(shape, cols, rows)
+
+        assert len(set(anchors)) == len(anchors)
+        for anchor in anchors:
+            xs, ys = zip(*footprint(shape, anchor))
+            assert min(xs) >= 0 and min(ys) >= 0 and max(xs) < cols and max(ys) < rows
+            assert min(xs) == 0 or min(ys) == 0 or max(xs) == cols - 1 or max(ys) == rows - 1
+        width, height = cols - shape.width + 1, rows - shape.height + 1
+        assert len(anchors) == 2 * width + 2 * height - 4
+
+
+class TestEdgeSpawnIndex:
+    """EdgeSpawnIndex 테스트"""
+
+    @pytest.mark.parametrize("grid_type", [OccupancyGrid, ChunkedOccupancyGrid])
+    def test_tracks_grid_changes(self, init_pygame, grid_type):
+        """점유 그리드에 추가/이동/제거/초기화해도 빈 앵커가 직접 검사한 결과와 같음"""
+        rng = random.Random(2)
+        cols, rows = 24, 18
+        grid = grid_type(cols, rows)
+        index = grid.watcher = EdgeSpawnIndex(cols, rows)
+        enemies = []
+        for _ in range(40):
+            shape_index = rng.randint(0, len(ENEMY_SHAPES) - 1)
+            enemy = Enemy(rng.uniform(0, cols), rng.uniform(0, rows),
+                          ENEMY_COLORS[shape_index], ENEMY_SHAPES[shape_index])
+            grid.add(enemy)
+            enemies.append(enemy)
+        assert_matches_grid(index, grid)
+
+        for _ in range(200):
+            enemy = rng.choice(enemies)
+            if rng.random() < 0.2:
+                grid.remove(enemy)
+            else:
+                enemy.grid_x = rng.uniform(0, cols)
+                enemy.grid_y = rng.uniform(0, rows)
+                grid.move(enemy)
+        assert_matches_grid(index, grid)
+
+        grid.clear()
+        assert all(index.free_count(i) == len(index.anchors[i]) for i in range(len(ENEMY_SHAPES)))
+
+    def test_pick_only_free_anchors(self, init_pygame):
+        """고른 앵커는 비어 있고, 빈 앵커가 없으면 None"""
+        rng = random.Random(0)
+        cols, rows = 12, 10
+        grid = OccupancyGrid(cols, rows)
+        index = grid.watcher = EdgeSpawnIndex(cols, rows)
+
+        placed = []
+        while True:
+            result = index.pick(rng)
+            if result is None:
+                break
+            shape_index, grid_x, grid_y = result
+            enemy = Enemy(grid_x, grid_y, ENEMY_COLORS[shape_index], ENEMY_SHAPES[shape_index])
+            assert not grid.any_occupied(enemy.get_grid_positions())
+            grid.add(enemy)
+            placed.append(enemy)
+
+        assert len(placed) > 4
+        assert all(index.free_count(i) == 0 for i in range(len(ENEMY_SHAPES)))
+
+
+class TestIndexedSpawner:
+    """Game(spawner="indexed") 테스트"""
+
+    def test_spawns_never_overlap(self, init_pygame):
+        """spawn 간격이 짧고 웨이브가 커도 새 적은 기존 적/플레이어와 겹치지 않음"""
+        game = Game(headless=True, seed=1, enemy_speed=0.05, spawn_interval=50, max_enemies=400,
+                    spawner="indexed", wave_size=8)
+        for _ in range(300):
+            before = len(game.enemies)
+            game.update()
+            if game.game_over:
+                break
+            for enemy in game.enemies[before:]:
+                assert not overlaps(enemy, game.enemies)
+                assert not set(enemy.get_grid_positions()) & set(game.player.get_grid_positions())
+        assert len(game.enemies) > 100
+
+    def test_spawn_wave_limits(self, init_pygame):
+        """웨이브는 최대 적 수와 빈 앵커 수를 넘지 않음"""
+        game = Game(headless=True, seed=0, max_enemies=50, spawner="indexed")
+        assert len(game.spawn_wave(30)) == 30
+        assert len(game.spawn_wave(30)) == 20
+        assert game.spawn_wave(5) == []
+
+        small = Game(headless=True, seed=0, world_cols=12, world_rows=10, max_enemies=1000,
+                     spawner="indexed")
+        spawned = small.spawn_wave(1000)
+        assert 4 < len(spawned) < 40
+        assert not any(overlaps(enemy, small.enemies) for enemy in spawned)
+
+    def test_random_spawner_unchanged(self, init_pygame):
+        """기본 spawner의 웨이브는 spawn_enemy를 여러 번 부른 것과 같음"""
+        waves = Game(headless=True, seed=3, max_enemies=100)
+        singles = Game(headless=True, seed=3, max_enemies=100)
+        waves.spawn_wave(12)
+        for _ in range(12):
+            singles.spawn_enemy()
+
+        assert ([(e.grid_x, e.grid_y, e.compiled_shape) for e in waves.enemies]
+                == [(e.grid_x, e.grid_y, e.compiled_shape) for e in singles.enemies])
+
+    def test_reset_matches_new_game(self, init_pygame):
+        """재시작한 게임도 새 게임과 같은 자리에 spawn"""
+        settings = dict(headless=True, seed=4, spawn_interval=100, spawner="indexed", wave_size=5)
+        game = Game(**settings)
+        game.simulate(200)
+        game.reset()
+        fresh = Game(**settings)
+        game.simulate(200)
+        fresh.simulate(200)
+
+        assert ([(e.grid_x, e.grid_y) for e in game.enemies]
+                == [(e.grid_x, e.grid_y) for e in fresh.enemies])
+
+    def test_rejects_swarm(self, init_pygame):
+        """빈 자리 spawn 색인은 Swarm 엔진과 함께 쓸 수 없음"""
+        with pytest.raises(ValueError):
+            Game(headless=True, use_swarm=True, spawner="indexed")
+        with pytest.raises(ValueError):
+            Game(headless=True, spawner="grid")
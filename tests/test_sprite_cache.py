@@ -0,0 +1,100 @@
+"""SpriteCache 테스트"""
+
+import random
+import pytest
+import pygame
+from src.sprite_cache import SpriteCache
+from src.enemy import Enemy
+from src.player import Player
+from src.game import Game
+from src.constants import ENEMY_SHAPES, ENEMY_COLORS, BLACK, RED, GRID_WIDTH, GRID_HEIGHT
+
+
+@pytest.fixture(scope="module")
+def init_pygame():
+    """pygame 초기화 픽스처"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def draw_per_cell(size, objects):
+    """기존 방식 (셀마다 draw.rect)으로 그린 픽셀"""
+    surface = pygame.Surface(size)
+    surface.fill(BLACK)
+    for obj in objects:
+        obj.draw(surface)
+    return pygame.image.tobytes(surface, "RGB")
+
+
+def draw_with_cache(size, objects, cache=None):
+    """스프라이트 캐시로 그린 픽셀"""
+    surface = pygame.Surface(size)
+    surface.fill(BLACK)
+    (cache or SpriteCache()).draw(surface, objects)
+    return pygame.image.tobytes(surface, "RGB")
+
+
+class TestSpriteCache:
+    """스프라이트 캐시 테스트"""
+
+    def test_sprite_is_shared_per_shape_and_color(self, init_pygame):
+        """같은 모양/색상은 스프라이트를 한 번만 만듦"""
+        cache = SpriteCache()
+        surface = pygame.Surface((200, 200))
+        enemies = [Enemy(i * 4, 1, RED, ENEMY_SHAPES[1]) for i in range(5)]
+        cache.draw(surface, enemies)
+        assert len(cache) == 1
+
+        first = cache.get(enemies[0].compiled_shape, RED, surface)
+        assert cache.get(enemies[1].compiled_shape, RED, surface) is first
+        assert first.get_size() == (2 * GRID_WIDTH, 3 * GRID_HEIGHT)
+
+    def test_matches_per_cell_drawing(self, init_pygame):
+        """모든 모양에서 셀 단위 그리기와 같은 픽셀 결과"""
+        rng = random.Random(3)
+        objects = [Player(10, 10)]
+        for _ in range(60):
+            index = rng.randrange(len(ENEMY_SHAPES))
+            objects.append(Enemy(rng.uniform(0, 30), rng.uniform(0, 30),
+                                 ENEMY_COLORS[index], ENEMY_SHAPES[index]))
+        assert draw_with_cache((400, 400), objects) == draw_per_cell((400, 400), objects)
+
+    def test_overlapping_draw_order_is_kept(self, init_pygame):
+        """겹친 객체는 나중 객체가 위에 그려짐"""
+        objects = [Enemy(2, 2, RED, ENEMY_SHAPES[4]), Enemy(3, 3, (0, 255, 0), ENEMY_SHAPES[4])]
+        assert draw_with_cache((200, 200), objects) == draw_per_cell((200, 200), objects)
+
+    def test_negative_positions_fall_back(self, init_pygame):
+        """음수 영역에 걸친 객체도 셀 단위 그리기와 같은 결과"""
+        objects = [
+            Enemy(-0.5, 2.2, RED, ENEMY_SHAPES[3]),
+            Enemy(1.5, 1.5, (0, 255, 0), ENEMY_SHAPES[4]),
+            Enemy(-1.7, -0.3, (0, 0, 255), ENEMY_SHAPES[2]),
+            Enemy(0.4, 0.6, (255, 255, 0), ENEMY_SHAPES[1]),
+        ]
+        assert draw_with_cache((200, 200), objects) == draw_per_cell((200, 200), objects)
+
+    def test_black_shape_is_not_transparent(self, init_pygame):
+        """배경과 같은 색의 모양도 그려짐 (colorkey와 겹치지 않음)"""
+        surface = pygame.Surface((100, 100))
+        surface.fill((255, 0, 0))
+        SpriteCache().draw(surface, [Enemy(1, 1, BLACK)])
+        assert surface.get_at((GRID_WIDTH + 1, GRID_HEIGHT + 1))[:3] == (0, 0, 0)
+
+    def test_game_draw_uses_cache(self, init_pygame):
+        """게임 화면이 셀 단위 그리기와 같음"""
+        game = Game(headless=True, seed=5)
+        for _ in range(20):
+            game.spawn_enemy()
+        game.draw()
+
+        expected = pygame.Surface(game.screen.get_size())
+        expected.fill(BLACK)
+        for obj in [game.player] + game.enemies:
+            obj.draw(expected)
+        for surface, rect in game._hud_overlays():
+            expected.blit(surface, rect)
+
+        assert pygame.image.tobytes(game.screen, "RGB") == pygame.image.tobytes(expected, "RGB")
+        assert len(game.sprite_cache) > 0
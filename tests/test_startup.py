@@ -0,0 +1,84 @@
+"""시작 경로 테스트 (지연 초기화, 시작 시간 측정)"""
+
+import os
+import subprocess
+import sys
+import pytest
+from src.startup import StartupTimer, process_uptime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(args):
+    """깨끗한 pygame 상태의 새 프로세스에서 실행"""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    return subprocess.run(
+        [sys.executable] + args, cwd=ROOT, env=env,
+        capture_output=True, text=True, timeout=60
+    )
+
+
+class TestStartupTimer:
+    """단계별 시간 기록 테스트"""
+
+    def test_phases_in_order(self):
+        """기록한 순서대로 단계가 나오고 합계가 맞는지 테스트"""
+        timer = StartupTimer()
+        timer.mark("imports")
+        timer.mark("game_init")
+
+        phases = timer.phases()
+        names = [name for name, _ in phases]
+
+        assert names[-2:] == ["imports", "game_init"]
+        assert all(ms >= 0 for _, ms in phases)
+        assert timer.total_ms() == pytest.approx(sum(ms for _, ms in phases))
+        assert timer.report_lines()[-1].split()[0] == "total"
+
+    def test_process_uptime(self):
+        """프로세스 실행 후 시간은 알 수 없거나 0 이상"""
+        uptime = process_uptime()
+
+        assert uptime is None or uptime >= 0
+
+
+class TestLazyInit:
+    """필요한 서브시스템만 초기화하는지 테스트"""
+
+    def test_headless_game_initializes_nothing_until_text(self):
+        """헤드리스 게임은 화면/오디오를 켜지 않고, 폰트는 처음 그릴 때 초기화"""
+        code = (
+            "import pygame\n"
+            "from src.game import Game\n"
+            "game = Game(headless=True, seed=1)\n"
+            "print(pygame.display.get_init(), pygame.mixer.get_init() is not None, pygame.font.get_init())\n"
+            "game.update()\n"
+            "game.draw()\n"
+            "print(pygame.display.get_init(), pygame.mixer.get_init() is not None, pygame.font.get_init())\n"
+        )
+        result = run_python(["-c", code])
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split("\n")[-3:-1] == ["False False False", "False False True"]
+
+    def test_window_game_skips_audio(self):
+        """창 모드 게임은 화면만 초기화하고 오디오는 켜지 않음"""
+        code = (
+            "import pygame\n"
+            "from src.game import Game\n"
+            "Game()\n"
+            "print(pygame.display.get_init(), pygame.mixer.get_init() is not None)\n"
+        )
+        result = run_python(["-c", code])
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split("\n")[-2] == "True False"
+
+    def test_main_startup_report(self):
+        """첫 프레임 후 시작 시간 보고를 출력하고 종료"""
+        result = run_python(["main.py", "--startup-report", "--exit-after-first-frame"])
+
+        assert result.returncode == 0, result.stderr
+        assert "cold start:" in result.stderr
+        for phase in ("imports", "game_init", "first_frame", "total"):
+            assert phase in result.stderr
@@ -0,0 +1,145 @@
+"""Swarm 벡터화 엔진 테스트"""
+
+import random
+import pytest
+import pygame
+from src.swarm import Swarm
+from src.enemy import Enemy
+from src.player import Player
+from src.game import Game
+from src.constants import ENEMY_SHAPES, ENEMY_COLORS, RED
+
+
+@pytest.fixture(scope="module")
+def init_pygame():
+    """pygame 초기화 픽스처"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def make_enemies(count, seed, low=0.0, high=69.0):
+    """재현 가능한 랜덤 적 리스트 생성"""
+    rng = random.Random(seed)
+    enemies = []
+    for _ in range(count):
+        shape_index = rng.randint(0, len(ENEMY_SHAPES) - 1)
+        enemies.append(Enemy(
+            rng.uniform(low, high - 2), rng.uniform(low, high - 2),
+            ENEMY_COLORS[shape_index], ENEMY_SHAPES[shape_index]
+        ))
+    return enemies
+
+
+def step_objects(enemies, player):
+    """Game.update와 같은 순서로 객체별 이동 (기준 동작)"""
+    center_x, center_y = player.get_center()
+    ordered = sorted(
+        enemies,
+        key=lambda e: (e.grid_x - center_x)**2 + (e.grid_y - center_y)**2,
+        reverse=True
+    )
+    for enemy in ordered:
+        enemy.move_towards_player(player, enemies)
+
+
+class TestSwarmBasics:
+    """무리 엔진 기본 동작 테스트"""
+
+    def test_add_and_grow(self):
+        """용량을 넘어 추가하면 배열이 늘어나는지 테스트"""
+        swarm = Swarm(capacity=2)
+        for i in range(5):
+            swarm.add(i, i, 0)
+
+        assert len(swarm) == 5
+        assert swarm.x[4] == 4
+
+    def test_register_shape_reuses_id(self):
+        """같은 모양은 같은 id를 받는지 테스트"""
+        swarm = Swarm()
+        assert swarm.register_shape(ENEMY_SHAPES[2]) == 2
+        new_id = swarm.register_shape([(0, 0), (1, 0)])
+        assert new_id == len(ENEMY_SHAPES)
+        assert swarm.register_shape([(0, 0), (1, 0)]) == new_id
+
+    def test_overlaps(self):
+        """셀 점유 판정 테스트"""
+        swarm = Swarm()
+        swarm.add(10.5, 10.5, 0)
+
+        assert swarm.overlaps([(10, 10)])
+        assert not swarm.overlaps([(11, 10)])
+
+    def test_single_enemy_moves_towards_player(self, init_pygame):
+        """적 하나가 플레이어 쪽으로 이동하는지 테스트"""
+        player = Player(grid_x=30, grid_y=30)
+        swarm = Swarm()
+        swarm.add(0, 0, 0)
+        swarm.step(player.get_center())
+
+        assert swarm.x[0] > 0
+        assert swarm.y[0] > 0
+
+
+class TestSwarmMatchesObjects:
+    """무리 엔진이 객체별 경로와 같은 결과를 내는지 테스트"""
+
+    @pytest.mark.parametrize("count, low, high", [
+        (60, 0.0, 69.0),    # 흩어진 무리
+        (150, 20.0, 50.0),  # 빽빽한 무리
+    ])
+    def test_matches_object_path(self, init_pygame, count, low, high):
+        """여러 프레임 동안 위치가 정확히 같아야 함"""
+        player = Player(grid_x=34, grid_y=34)
+        objects = make_enemies(count, seed=count, low=low, high=high)
+        swarm = Swarm()
+        swarm.load(make_enemies(count, seed=count, low=low, high=high))
+
+        for _ in range(80):
+            step_objects(objects, player)
+            swarm.step(player.get_center())
+
+        for index, enemy in enumerate(objects):
+            assert (swarm.x[index], swarm.y[index]) == (enemy.grid_x, enemy.grid_y)
+
+    def test_overlapping_spawns(self, init_pygame):
+        """이미 겹친 상태로 시작해도 lock-in 탈출 규칙이 같아야 함"""
+        player = Player(grid_x=34, grid_y=34)
+        positions = [(0, 0), (0.5, 0.2), (1, 1), (0, 1), (3, 0), (3.2, 0.4)]
+        objects = [Enemy(x, y, RED, ENEMY_SHAPES[4]) for x, y in positions]
+        swarm = Swarm()
+        swarm.load([Enemy(x, y, RED, ENEMY_SHAPES[4]) for x, y in positions])
+
+        for _ in range(40):
+            step_objects(objects, player)
+            swarm.step(player.get_center())
+
+        for index, enemy in enumerate(objects):
+            assert (swarm.x[index], swarm.y[index]) == (enemy.grid_x, enemy.grid_y)
+
+
+class TestGameWithSwarm:
+    """Game의 Swarm 모드 테스트"""
+
+    def test_swarm_game_matches_default(self, init_pygame):
+        """Swarm 모드와 기본 모드의 게임 진행이 같아야 함"""
+        default_game = Game()
+        swarm_game = Game(use_swarm=True)
+        default_game.enemies = make_enemies(40, seed=7)
+        swarm_game.enemies = make_enemies(40, seed=7)
+
+        for _ in range(30):
+            default_game.update()
+            swarm_game.update()
+
+        assert swarm_game.game_over == default_game.game_over
+        for a, b in zip(default_game.enemies, swarm_game.enemies):
+            assert (a.grid_x, a.grid_y) == (b.grid_x, b.grid_y)
+
+    def test_swarm_collision(self, init_pygame):
+        """Swarm 모드에서도 플레이어 충돌이 감지되는지 테스트"""
+        game = Game(use_swarm=True)
+        game.enemies = [Enemy(game.player.grid_x + 1, game.player.grid_y + 1, RED)]
+
+        assert game.check_collision() is True
@@ -0,0 +1,67 @@
+"""FixedTimestep 테스트"""
+
+import pytest
+import pygame
+from src.timestep import FixedTimestep
+from src.game import Game
+from src.constants import SIM_TICK_MS
+
+
+@pytest.fixture(scope="module")
+def init_pygame():
+    """pygame 초기화 픽스처"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+class TestFixedTimestep:
+    """고정 간격 누적기 테스트"""
+
+    def test_accumulates_partial_ticks(self):
+        """틱 길이보다 짧은 시간은 누적됨"""
+        timestep = FixedTimestep(tick_ms=10)
+        assert timestep.advance(4) == 0
+        assert timestep.advance(4) == 0
+        assert timestep.advance(4) == 1
+        assert timestep.alpha == pytest.approx(0.2)
+
+    def test_slow_frame_runs_multiple_ticks(self):
+        """렌더링이 밀리면 한 프레임에 여러 틱을 실행함"""
+        timestep = FixedTimestep(tick_ms=10, max_ticks=5)
+        assert timestep.advance(35) == 3
+        assert timestep.advance(5) == 1
+
+    def test_excess_time_is_dropped(self):
+        """최대 틱 수를 넘는 밀린 시간은 버림"""
+        timestep = FixedTimestep(tick_ms=10, max_ticks=5)
+        assert timestep.advance(1000) == 5
+        assert timestep.dropped_ms == pytest.approx(950)
+        assert timestep.advance(10) == 1
+
+    def test_time_scale(self):
+        """빨리 감기 배율만큼 틱이 늘어남"""
+        timestep = FixedTimestep(tick_ms=10, max_ticks=5, time_scale=4)
+        assert timestep.advance(10) == 4
+        assert timestep.advance(100) == 20  # 한도도 배율만큼 늘어남
+
+
+class TestGameAdvance:
+    """게임 루프의 고정 간격 진행 테스트"""
+
+    def test_sim_speed_is_independent_of_frame_rate(self, init_pygame):
+        """같은 실제 시간이면 프레임 수와 관계없이 같은 틱 수를 실행"""
+        fast = Game(headless=True, seed=3)
+        slow = Game(headless=True, seed=3)
+        for _ in range(60):
+            fast.advance(SIM_TICK_MS)
+        for _ in range(20):
+            slow.advance(SIM_TICK_MS * 3)
+
+        assert fast.tick_count == slow.tick_count == 60
+        assert fast.sim_time == pytest.approx(slow.sim_time)
+
+    def test_unthrottled_runs_many_ticks(self, init_pygame):
+        """최대 속도 모드는 렌더 간격 동안 여러 틱을 실행"""
+        game = Game(headless=True, seed=3, unthrottled=True)
+        assert game.advance(0) > 1
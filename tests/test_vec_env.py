@@ -0,0 +1,167 @@
+"""VecEnv (다중 월드 벡터화 환경) 테스트"""
+
+import numpy as np
+import pytest
+import pygame
+from src.vec_env import VecEnv, ACTION_KEYS, NUM_ACTIONS
+from src.game import Game
+from src.swarm import Swarm
+from src.observation import ObservationBuffer
+from src.constants import GRID_COLS, GRID_ROWS, OBS_EMPTY, OBS_PLAYER
+
+PARAMS = {"enemy_speed": 0.2, "spawn_interval": 300, "max_enemies": 30}
+
+
+@pytest.fixture(scope="module")
+def init_pygame():
+    """pygame 초기화 픽스처"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def world_positions(env, index):
+    """월드 하나의 적 위치 목록 (추가 순서)"""
+    swarm = env.swarm
+    selected = swarm.world[:swarm.count] == index
+    return list(zip(swarm.x[:swarm.count][selected].tolist(), swarm.y[:swarm.count][selected].tolist()))
+
+
+def game_observation(game):
+    """Game 객체들로 직접 만든 관측 (기준)"""
+    expected = np.full((GRID_COLS, GRID_ROWS), OBS_EMPTY, dtype=np.uint8)
+    for enemy, shape_id in zip(game.enemies, game.swarm.shape_id[:len(game.enemies)].tolist()):
+        for x, y in enemy.get_grid_positions():
+            if 0 <= x < GRID_COLS and 0 <= y < GRID_ROWS:
+                expected[x, y] = shape_id + 1
+    for x, y in game.player.get_grid_positions():
+        expected[x, y] = OBS_PLAYER
+    return expected
+
+
+class TestVecEnv:
+    """벡터화 환경 테스트"""
+
+    def test_matches_games(self, init_pygame):
+        """각 월드가 같은 시드/입력의 Game과 같은 결과"""
+        env = VecEnv(4, seed=20, **PARAMS)
+        games = [Game(headless=True, seed=20 + i, use_swarm=True, **PARAMS) for i in range(4)]
+        rng = np.random.default_rng(0)
+
+        for _ in range(1500):
+            actions = rng.integers(0, NUM_ACTIONS, 4)
+            observations, rewards, dones, infos = env.step(actions)
+            for i, game in enumerate(games):
+                if game is None:
+                    continue
+                game.update(ACTION_KEYS[actions[i]])
+                assert dones[i] == game.game_over
+                assert rewards[i] == (0.0 if game.game_over else 1.0)
+                if game.game_over:
+                    assert infos["episode_ticks"][i] == game.tick_count
+                    games[i] = None
+                    continue
+                assert world_positions(env, i) == [(e.grid_x, e.grid_y) for e in game.enemies]
+                assert (env.player_x[i], env.player_y[i]) == (game.player.grid_x, game.player.grid_y)
+                assert np.array_equal(observations[i], game_observation(game))
+
+        assert all(game is None for game in games)
+
+    def test_auto_reset_uses_next_seeds(self, init_pygame):
+        """끝난 월드는 다음 시드로 새 판을 시작"""
+        env = VecEnv(2, seed=5, **PARAMS)
+        assert env.seeds.tolist() == [5, 6]
+
+        dones = np.zeros(2, dtype=bool)
+        while not dones.any():
+            _, _, dones, infos = env.step(np.zeros(2, dtype=np.int64))
+
+        finished = int(np.flatnonzero(dones)[0])
+        assert infos["seeds"][finished] in (5, 6)
+        assert env.seeds[finished] == 7
+        assert env.tick_count[finished] == 0
+        assert env.episodes[finished] == 1
+        assert env.enemy_count[finished] == 0
+        assert not (env.swarm.world[:env.swarm.count] == finished).any()
+
+    def test_truncation(self, init_pygame):
+        """최대 틱 수에 도달하면 잘려서 종료"""
+        env = VecEnv(3, seed=0, max_episode_ticks=10, **PARAMS)
+
+        for _ in range(9):
+            _, _, dones, _ = env.step(np.zeros(3, dtype=np.int64))
+            assert not dones.any()
+        _, rewards, dones, infos = env.step(np.zeros(3, dtype=np.int64))
+
+        assert dones.all() and infos["truncated"].all()
+        assert (rewards == 1.0).all()
+        assert (infos["episode_ticks"] == 10).all()
+
+    def test_invalid_actions(self, init_pygame):
+        """행동 배열 모양이나 번호가 잘못되면 ValueError"""
+        env = VecEnv(2)
+
+        with pytest.raises(ValueError):
+            env.step([0, 0, 0])
+        with pytest.raises(ValueError):
+            env.step([0, NUM_ACTIONS])
+
+    def test_reset_observation(self, init_pygame):
+        """처음 관측에는 중앙의 플레이어만 있음"""
+        env = VecEnv(2)
+        observations = env.reset()
+
+        assert observations.shape == (2, GRID_COLS, GRID_ROWS)
+        assert (observations == OBS_PLAYER).sum(axis=(1, 2)).tolist() == [5, 5]
+        assert ((observations != OBS_EMPTY) == (observations == OBS_PLAYER)).all()
+
+    def test_shared_memory_observations(self, init_pygame):
+        """shared_memory=True면 다른 연결에서도 같은 관측이 보임"""
+        env = VecEnv(3, seed=1, shared_memory=True, **PARAMS)
+        view = ObservationBuffer.attach(env.observation_buffer.name, env.observations.shape)
+        try:
+            for _ in range(50):
+                observations, _, _, _ = env.step(np.zeros(3, dtype=np.int64))
+                assert observations is env.observations
+                assert np.array_equal(view.array, observations)
+        finally:
+            view.close()
+            env.close()
+
+
+class TestMultiWorldSwarm:
+    """여러 월드를 담은 Swarm 테스트"""
+
+    def test_worlds_match_separate_swarms(self):
+        """한 배열에서 이동해도 월드별 Swarm과 같은 결과"""
+        rng = np.random.default_rng(1)
+        combined = Swarm(worlds=3)
+        separate = [Swarm() for _ in range(3)]
+        for _ in range(90):
+            world = int(rng.integers(0, 3))
+            x, y = rng.uniform(0, 20, 2).tolist()
+            shape_id = int(rng.integers(0, len(combined.shapes)))
+            combined.add(x, y, shape_id, 0.3, world=world)
+            separate[world].add(x, y, shape_id, 0.3)
+        centers = np.array([[10.0, 10.0], [3.0, 15.0], [18.0, 2.0]])
+
+        for _ in range(40):
+            combined.step(centers)
+            for world, swarm in enumerate(separate):
+                swarm.step(tuple(centers[world]))
+
+        for world, swarm in enumerate(separate):
+            selected = combined.world[:combined.count] == world
+            assert combined.x[:combined.count][selected].tolist() == swarm.x[:swarm.count].tolist()
+            assert combined.y[:combined.count][selected].tolist() == swarm.y[:swarm.count].tolist()
+
+    def test_remove_worlds_keeps_order(self):
+        """월드를 제거해도 나머지 적의 순서는 유지"""
+        swarm = Swarm(worlds=2)
+        for i in range(6):
+            swarm.add(i, i, 0, world=i % 2)
+
+        swarm.remove_worlds(np.array([True, False]))
+
+        assert swarm.x[:swarm.count].tolist() == [1.0, 3.0, 5.0]
+        assert swarm.counts_by_world().tolist() == [0, 3]